@@ -0,0 +1,42 @@
+"""
+Render benchmarks.
+
+The suite measures the render time, the peak allocated memory and the output
+size of representative workloads, and compares them with a JSON baseline.
+It also checks the time of `from bootwrap import *` (measured with
+`python -X importtime`) against the `IMPORT_BUDGET`.
+Run it offline from the project root:
+
+    python -m benchmarks                 # compares with the baseline
+    python -m benchmarks --save          # records a new baseline
+    python -m benchmarks table list      # runs the selected workloads
+
+Render times depend on the machine, so record the baseline on the machine
+you compare on. The HTML sizes do not, so they must match the baseline
+exactly.
+
+The `reference.json` file keeps a run of the original code (the one the
+render optimizations started from), recorded on the same machine as the
+baseline. The workloads found in it are reported with their
+speedup over the original code. Record it from a checkout of the original
+code (the workloads using newer features are left out):
+
+    cd /path/to/original
+    PYTHONPATH=/path/to/bootwrap python -m benchmarks --save \
+        --baseline /path/to/bootwrap/benchmarks/reference.json \
+        table list form ...
+"""
+
+# flake8: noqa
+# pylint: disable=unused-variable
+
+from .runner import (
+    IMPORT_BUDGET,
+    import_time,
+    measure,
+    run,
+    compare,
+    load_baseline,
+    save_baseline
+)
+from .workloads import WORKLOADS
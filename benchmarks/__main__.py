@@ -0,0 +1,108 @@
+"""
+The benchmark launcher.
+"""
+
+import sys
+import pathlib
+import argparse
+
+from .runner import (
+    IMPORT_BUDGET,
+    import_time,
+    run,
+    compare,
+    load_baseline,
+    save_baseline
+)
+from .workloads import WORKLOADS
+
+BASELINE = pathlib.Path(__file__).parent / 'baseline.json'
+REFERENCE = pathlib.Path(__file__).parent / 'reference.json'
+
+
+def main(argv):
+    parser = argparse.ArgumentParser(prog='python -m benchmarks')
+    parser.add_argument(
+        'workloads',
+        nargs='*',
+        help=f'workloads to run: {", ".join(WORKLOADS)} (default all)'
+    )
+    parser.add_argument(
+        '--baseline',
+        default=str(BASELINE),
+        help='baseline JSON file (default %(default)s)'
+    )
+    parser.add_argument(
+        '--threshold',
+        type=float,
+        default=0.2,
+        help='tolerated relative regression (default %(default)s)'
+    )
+    parser.add_argument(
+        '--scale',
+        type=float,
+        default=1.0,
+        help='workload size factor (default %(default)s)'
+    )
+    parser.add_argument(
+        '--repeat',
+        type=int,
+        default=5,
+        help='timing repetitions (default %(default)s)'
+    )
+    parser.add_argument(
+        '--save',
+        action='store_true',
+        help='record the measurements as the baseline'
+    )
+    args = parser.parse_args(argv)
+    for name in args.workloads:
+        if name not in WORKLOADS:
+            parser.error(f'unknown workload: {name}')
+
+    # The reference run of the original code, recorded along with the
+    # baseline (the speedups are meaningful on that machine only).
+    try:
+        reference = load_baseline(REFERENCE, args.scale)
+    except (FileNotFoundError, ValueError):
+        reference = {}
+
+    def report(name, measured):
+        speedup = ''
+        if name in reference:
+            ratio = reference[name]['seconds'] / measured['seconds']
+            speedup = f'{ratio:>8.2f}x'
+        print(
+            f'{name:<24}'
+            f'{measured["seconds"] * 1000:>12.3f} ms'
+            f'{measured["peak_bytes"] / 1024:>12.1f} KiB peak'
+            f'{measured["bytes"] / 1024:>12.1f} KiB html'
+            f'{speedup}'
+        )
+
+    results = run(
+        args.workloads, scale=args.scale, repeat=args.repeat, report=report
+    )
+
+    if args.save:
+        save_baseline(args.baseline, results, args.scale)
+        print(f'Baseline saved to {args.baseline}')
+        return 0
+
+    regressions = compare(
+        results, load_baseline(args.baseline, args.scale), args.threshold
+    )
+
+    seconds = import_time()
+    print(f'{"import":<24}{seconds * 1000:>12.3f} ms')
+    if seconds > IMPORT_BUDGET:
+        regressions.append(
+            f'import: seconds {seconds:.6g} > {IMPORT_BUDGET:.6g} (budget)'
+        )
+    for regression in regressions:
+        print(f'REGRESSION {regression}')
+    return 1 if regressions else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main(sys.argv[1:]))
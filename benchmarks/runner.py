@@ -0,0 +1,227 @@
+"""
+The benchmark runner.
+"""
+
+import gc
+import sys
+import json
+import time
+import contextlib
+import subprocess
+import tracemalloc
+
+from .workloads import WORKLOADS
+
+try:
+    from bootwrap import rendering
+except ImportError:
+    # The original code (see the reference run) has no render options.
+    def rendering(**options):  # pylint: disable=unused-argument
+        return contextlib.nullcontext()
+
+METRICS = ('seconds', 'peak_bytes', 'bytes')
+"""The measured metrics."""
+
+IMPORT_BUDGET = 0.1
+"""The budget for importing the whole package, in seconds."""
+
+
+def import_time(statement='from bootwrap import *', repeat=3):
+    """Measures the import time of a statement with `-X importtime`.
+
+    The modules imported by the interpreter start-up are left out.
+
+    Args:
+        statement (str): The import statement (default imports the whole
+            package).
+        repeat (int): The number of measurements (default=3).
+
+    Returns:
+        float: The best import time in seconds.
+    """
+    def modules(code):
+        stderr = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', code],
+            capture_output=True, text=True, check=True
+        ).stderr
+        times = {}
+        for line in stderr.splitlines():
+            if not line.startswith('import time:') or 'cumulative' in line:
+                continue
+            _, cumulative, name = line[len('import time:'):].split('|')
+            if not name.startswith('  '):
+                times[name.strip()] = int(cumulative)
+        return times
+
+    startup = modules('pass')
+    return min(
+        sum(
+            us for name, us in modules(statement).items()
+            if name not in startup
+        )
+        for _ in range(repeat)
+    ) / 1e6
+
+
+def measure(render, repeat=5, min_time=0.1):
+    """Measures a workload render.
+
+    Args:
+        render (func): The callable rendering the workload HTML.
+        repeat (int): The number of timing repetitions (default=5).
+        min_time (float): The minimal duration of a single repetition
+            in seconds (default=0.1).
+
+    Returns:
+        dict: The best render time in seconds (`seconds`), the peak memory
+            allocated while rendering (`peak_bytes`) and the size of the
+            UTF-8 encoded HTML (`bytes`).
+    """
+    # The HTML size is measured on a deterministic render, so the identifiers
+    # (and their length) do not depend on the web components made before.
+    with rendering(deterministic=True):
+        html = render()
+    render()
+
+    tracemalloc.start()
+    try:
+        render()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    started = time.perf_counter()
+    render()
+    number = max(1, int(min_time / (time.perf_counter() - started)))
+
+    timings = []
+    gc_enabled = gc.isenabled()
+    gc.disable()
+    try:
+        for _ in range(repeat):
+            started = time.perf_counter()
+            for _ in range(number):
+                render()
+            timings.append((time.perf_counter() - started) / number)
+    finally:
+        if gc_enabled:
+            gc.enable()
+
+    return {
+        'seconds': min(timings),
+        'peak_bytes': peak_bytes,
+        'bytes': len(html.encode('utf-8'))
+    }
+
+
+def run(names=None, scale=1.0, repeat=5, min_time=0.1, report=None):
+    """Runs the benchmark workloads.
+
+    Args:
+        names (list): The workload names to run (default all).
+        scale (float): The workload size factor (default=1.0).
+        repeat (int): The number of timing repetitions (default=5).
+        min_time (float): The minimal duration of a single repetition
+            in seconds (default=0.1).
+        report (func): The function called with the workload name and its
+            measurements once the workload is measured.
+
+    Returns:
+        dict: The measurements by workload names.
+    """
+    results = {}
+    for name in names or WORKLOADS:
+        if name not in WORKLOADS:
+            raise ValueError(f'Unknown workload: {name};')
+        results[name] = measure(
+            WORKLOADS[name](scale), repeat=repeat, min_time=min_time
+        )
+        if report is not None:
+            report(name, results[name])
+    return results
+
+
+def compare(results, baseline, threshold=0.2):
+    """Compares measurements with a baseline.
+
+    The HTML size (`bytes`) must match the baseline exactly: it does not
+    depend on the machine, so any drift (in either direction) means the
+    rendered markup has changed and the baseline must be recorded again.
+
+    Args:
+        results (dict): The measurements by workload names.
+        baseline (dict): The baseline measurements by workload names.
+        threshold (float): The tolerated relative increase of the render
+            time and the peak memory (default=0.2).
+
+    Returns:
+        list: The regression descriptions, empty if there is none.
+    """
+    regressions = []
+    for name, measured in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            continue
+        for metric in METRICS:
+            if metric not in expected:
+                continue
+            if metric == 'bytes':
+                if measured[metric] != expected[metric]:
+                    regressions.append(
+                        f'{name}: bytes {measured[metric]} != '
+                        f'{expected[metric]}'
+                    )
+                continue
+            limit = expected[metric] * (1 + threshold)
+            if measured[metric] > limit:
+                regressions.append(
+                    f'{name}: {metric} {measured[metric]:.6g} > '
+                    f'{expected[metric]:.6g} (+{threshold:.0%})'
+                )
+    return regressions
+
+
+def load_baseline(path, scale=1.0):
+    """Loads baseline measurements from a JSON file.
+
+    Args:
+        path (str|Path): The baseline file path.
+        scale (float): The workload size factor the baseline must be
+            recorded at (default=1.0).
+
+    Returns:
+        dict: The baseline measurements by workload names.
+    """
+    with open(path, 'r', encoding='utf-8') as file:
+        content = json.load(file)
+    if content['scale'] != scale:
+        raise ValueError(
+            f'The baseline is recorded at scale {content["scale"]}, '
+            f'but got {scale};'
+        )
+    return content['workloads']
+
+
+def save_baseline(path, results, scale=1.0):
+    """Saves measurements as a baseline to a JSON file.
+
+    Measurements of workloads missing in the results are kept.
+
+    Args:
+        path (str|Path): The baseline file path.
+        results (dict): The measurements by workload names.
+        scale (float): The workload size factor (default=1.0).
+    """
+    try:
+        workloads = load_baseline(path, scale)
+    except (FileNotFoundError, ValueError):
+        workloads = {}
+    workloads.update(results)
+    with open(path, 'w', encoding='utf-8') as file:
+        json.dump(
+            {'scale': scale, 'workloads': workloads},
+            file,
+            indent=4,
+            sort_keys=True
+        )
+        file.write('\n')
@@ -0,0 +1,391 @@
+"""
+The benchmark workloads.
+
+A workload takes a scale factor (1.0 for the nominal size) and returns a
+callable rendering the workload HTML. The workload data is built before the
+callable is returned, so only the rendering is measured.
+"""
+
+import io
+import datetime
+import contextlib
+import importlib
+import random
+
+import bootwrap as bw
+from bootwrap.components import base
+
+
+def _cold(component):
+    """Makes a callable rendering a web component from scratch.
+
+    Web components memoize their output, so the memoized outputs are
+    dropped before every render.
+    """
+    # The original code (see the reference run) memoizes nothing.
+    iter_components = getattr(base, 'iter_components', lambda *roots: [])
+    components = list(iter_components(component))
+
+    def render():
+        for nested in components:
+            nested.__dict__.pop('_render_memo', None)
+        return str(component)
+    return render
+
+
+def _scaled(n, scale):
+    return max(1, int(n * scale))
+
+
+def _table_rows(n):
+    rng = random.Random(0)
+    return [
+        [
+            row,
+            f'name {row}',
+            rng.random() * 1000,
+            rng.randint(-100, 100),
+            rng.choice(['buy', 'sell', 'deposit', 'withdraw']),
+            f'description of the row {row}',
+            rng.random() < 0.5,
+            rng.randint(0, 10**6),
+            'x' * rng.randint(1, 20),
+            None
+        ]
+        for row in range(n)
+    ]
+
+
+def table(scale):
+    """The `Table` with 10k x 10 cells and per-column transforms."""
+    table = bw.Table(
+        [f'Column {i}' for i in range(10)],
+        _table_rows(_scaled(10000, scale))
+    )
+    table.body.transform(0, bw.TableEntity.CELL, lambda v: 'text-muted')
+    table.body.transform(2, bw.TableEntity.VALUE, lambda v: '$%.2f' % v)
+    table.body.transform(
+        3,
+        bw.TableEntity.CELL,
+        lambda v: 'text-success' if v >= 0 else 'text-danger'
+    )
+    table.body.transform(
+        4,
+        bw.TableEntity.ROW,
+        lambda v: 'table-warning' if v == 'sell' else ''
+    )
+    table.body.transform(6, bw.TableEntity.VALUE, lambda v: 'yes' if v else '')
+    return _cold(table)
+
+
+def _table_transforms(count):
+    def workload(scale):
+        table = bw.Table(
+            [f'Column {i}' for i in range(10)],
+            _table_rows(_scaled(10000, scale))
+        )
+        entities = list(bw.TableEntity)
+        for i in range(count):
+            table.body.transform(
+                i * 3 % 10,
+                entities[i % 3],
+                lambda v: 'x' if v else ''
+            )
+        return _cold(table.body)
+    workload.__doc__ = \
+        f'The `Table` body with 10k x 10 cells and {count} transforms.'
+    return workload
+
+
+def _table_activity(memoize):
+    def workload(scale):
+        rng = random.Random(0)
+        table = bw.Table(
+            ['Timestamp', 'Target', 'Action', 'Amount'],
+            [
+                [
+                    datetime.datetime(2021, 1, i % 28 + 1, 12),
+                    rng.choice(['account', 'stock']),
+                    rng.choice(['buy', 'sell', 'deposit', 'withdraw']),
+                    rng.random() * 1000
+                ]
+                for i in range(_scaled(10000, scale))
+            ]
+        )
+        table.body.transform(
+            0,
+            bw.TableEntity.VALUE,
+            lambda timestamp: timestamp.strftime('%m/%d/%Y, %H:%M:%S'),
+            memoize=memoize
+        )
+        # The memoized web components would not be shared between rows,
+        # so the icons are markup.
+        table.body.transform(
+            1,
+            bw.TableEntity.VALUE,
+            lambda target: f'<img src="{target}.png" width=32 height=32/>',
+            memoize=memoize
+        )
+        table.body.transform(
+            2,
+            bw.TableEntity.ROW,
+            lambda action: 'text-success' if action in ['deposit', 'sell']
+            else 'text-danger',
+            memoize=memoize
+        )
+        return _cold(table.body)
+    workload.__doc__ = (
+        'The activity `Table` body with 10k rows and '
+        f'{"memoized" if memoize else "plain"} low-cardinality transforms.'
+    )
+    return workload
+
+
+def table_page(scale):
+    """The page of 50 rows cut from a `Table` with 100k rows."""
+    table = bw.Table([f'Column {i}' for i in range(10)], _table_rows(
+        _scaled(100000, scale)
+    ))
+    page = table.body.pages(50) // 2
+    return lambda: table.body.render_page(page, 50)
+
+
+def table_page_sorted(scale):
+    """The page of 50 rows cut from a `Table` with 100k rows sorted by
+    a column."""
+    table = bw.Table([f'Column {i}' for i in range(10)], _table_rows(
+        _scaled(100000, scale)
+    ))
+    page = table.body.pages(50) // 2
+    return lambda: table.body.render_page(page, 50, sort_key=7)
+
+
+def table_page_filtered(scale):
+    """The page of 50 rows cut from a `Table` with 100k rows filtered by
+    a predicate and sorted by a column."""
+    table = bw.Table([f'Column {i}' for i in range(10)], _table_rows(
+        _scaled(100000, scale)
+    ))
+
+    def where(row):
+        return row[4] == 'sell'
+
+    page = table.body.pages(50, where) // 2
+    return lambda: table.body.render_page(
+        page, 50, sort_key=7, where=where
+    )
+
+
+def table_columnar(scale):
+    """The columnar `Table` with 10k x 10 NumPy cells and vectorized
+    transforms."""
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    rng = np.random.default_rng(0)
+    n = _scaled(10000, scale)
+    numbers = np.arange(n).astype(str)
+    table = bw.Table(
+        None,
+        {
+            f'Column {i}': column
+            for i, column in enumerate([
+                np.arange(n),
+                np.char.add('name ', numbers),
+                rng.random(n) * 1000,
+                rng.integers(-100, 100, n),
+                rng.choice(['buy', 'sell', 'deposit', 'withdraw'], n),
+                np.char.add('description of the row ', numbers),
+                rng.random(n) < 0.5,
+                rng.integers(0, 10**6, n),
+                rng.choice(['x', 'xxxxx', 'xxxxxxxxxxxxxxx'], n),
+                np.full(n, None)
+            ])
+        }
+    )
+    table.body.transform(
+        0,
+        bw.TableEntity.CELL,
+        lambda column: np.full(len(column), 'text-muted'),
+        vectorized=True
+    )
+    table.body.transform(
+        2,
+        bw.TableEntity.VALUE,
+        lambda column: np.char.mod('$%.2f', column),
+        vectorized=True
+    )
+    table.body.transform(
+        3,
+        bw.TableEntity.CELL,
+        lambda column: np.where(column >= 0, 'text-success', 'text-danger'),
+        vectorized=True
+    )
+    table.body.transform(
+        4,
+        bw.TableEntity.ROW,
+        lambda column: np.where(column == 'sell', 'table-warning', ''),
+        vectorized=True
+    )
+    table.body.transform(
+        6,
+        bw.TableEntity.VALUE,
+        lambda column: np.where(column, 'yes', ''),
+        vectorized=True
+    )
+    return _cold(table)
+
+
+def form(scale):
+    """The `Form` with 500 mixed inputs."""
+    def make_input(i):
+        kind = i % 5
+        if kind == 0:
+            return bw.TextInput(f'Text {i}', f'text{i}', placeholder='text')
+        if kind == 1:
+            return bw.NumericInput(f'Number {i}', f'number{i}', value=i)
+        if kind == 2:
+            return bw.CheckboxInput(f'Check {i}', f'check{i}', i % 2 == 0)
+        if kind == 3:
+            return bw.SelectInput(
+                f'Select {i}',
+                f'select{i}',
+                'b',
+                [
+                    bw.SelectInput.Option('Option A', 'a'),
+                    bw.SelectInput.Option('Option B', 'b'),
+                    bw.SelectInput.Option('Option C', 'c')
+                ]
+            )
+        return bw.TextInput(f'Area {i}', f'area{i}').with_multirows(3)
+
+    return _cold(
+        bw.Form(
+            *[make_input(i) for i in range(_scaled(500, scale))]
+        ).on_submit('/submit')
+    )
+
+
+def list_(scale):
+    """The `List` with 5k items carrying menus."""
+    return _cold(
+        bw.List(*[
+            bw.List.Item(
+                f'Item {i}',
+                description=f'The description of the item {i}',
+                marker=f'{i % 60} min ago',
+                figure=bw.Image('logo.png', width=32, height=32)
+            ).add_menu(
+                bw.Button('Buy').as_primary(),
+                bw.Button('Sell').as_danger()
+            ).link(f'/items/{i}')
+            for i in range(_scaled(5000, scale))
+        ])
+    )
+
+
+def panel(scale):
+    """The `Panel` with 20k texts."""
+    return _cold(
+        bw.Panel(*[
+            bw.Text(f'The text {i}') for i in range(_scaled(20000, scale))
+        ])
+    )
+
+
+def deck(scale):
+    """The `Deck` with 1k cards."""
+    return _cold(
+        bw.Deck(*[
+            bw.Deck.Card(
+                f'Card {i}',
+                description=f'The description of the card {i}',
+                marker=f'{i % 60} min ago',
+                figure=bw.Image('logo.png', width=64, height=64)
+            ).add_menu(
+                bw.Button('Open').as_primary()
+            ).link(f'/cards/{i}')
+            for i in range(_scaled(1000, scale))
+        ])
+    )
+
+
+def navigation(scale):
+    """The nested `Navigation` (10 x 10 x 10 tabs)."""
+    n = _scaled(10, scale)
+
+    def make_navigation(depth, path):
+        return bw.Navigation(*[
+            bw.Navigation.Item(
+                f'Tab {path}{i}',
+                make_navigation(depth - 1, f'{path}{i}.') if depth > 1
+                else bw.Text(f'The content of the tab {path}{i}'),
+                i == 0
+            )
+            for i in range(n)
+        ])
+
+    return _cold(make_navigation(3, ''))
+
+
+def _demo(view):
+    def workload(scale):  # pylint: disable=unused-argument
+        with contextlib.redirect_stdout(io.StringIO()):
+            # The demo application prints a banner on import.
+            demo_app = importlib.import_module('demo.demo_app')
+        login_user = importlib.import_module('flask_login').login_user
+
+        app = demo_app.demo_app
+        user = demo_app.USERS.get_user(
+            'j.belfort@notexist.com', 'HardWork@2021'
+        )
+
+        def render():
+            with app.test_request_context():
+                login_user(user)
+                return str(getattr(demo_app, view)())
+        return render
+    workload.__doc__ = f'The demo "{view}" page.'
+    return workload
+
+
+def _docs(view):
+    def workload(scale):  # pylint: disable=unused-argument
+        doc_app = importlib.import_module('docs.doc_app')
+
+        def render():
+            # The rendered pages are cached (unlike in the original code,
+            # see the reference run), so the cache is cleared to measure
+            # the page rendering rather than a cache hit.
+            getattr(doc_app, '_pages', {}).clear()
+            return str(getattr(doc_app, view)())
+        return render
+    workload.__doc__ = f'The docs "{view}" page.'
+    return workload
+
+
+WORKLOADS = {
+    'table': table,
+    'table-columnar': table_columnar,
+    'table-transforms-0': _table_transforms(0),
+    'table-transforms-3': _table_transforms(3),
+    'table-transforms-10': _table_transforms(10),
+    'table-activity': _table_activity(False),
+    'table-activity-memoized': _table_activity(True),
+    'table-page': table_page,
+    'table-page-sorted': table_page_sorted,
+    'table-page-filtered': table_page_filtered,
+    'form': form,
+    'list': list_,
+    'panel': panel,
+    'deck': deck,
+    'navigation': navigation,
+    'demo-portfolio': _demo('portfolio'),
+    'demo-discovery': _demo('discovery'),
+    'demo-account': _demo('account'),
+    'demo-activity': _demo('activity'),
+    'docs-home': _docs('home'),
+    'docs-layout': _docs('layout'),
+    'docs-base': _docs('base'),
+    'docs-components': _docs('components')
+}
+"""The benchmark workloads by names."""
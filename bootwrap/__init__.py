@@ -1,15 +1,38 @@
 """
 Wrapper for Bootstrap components.
+
+The modules are imported lazily, on the first access to any of their
+exported names, so tools needing a single component start quickly.
 """
 
 # flake8: noqa
 # pylint: disable=unused-variable
 
-from .menu import Menu
-from .page import Page
-from .auth import Signup as SignupPage
-from .auth import Login as LoginPage
+import importlib
+
+from . import components
+
+_EXPORTS = {
+    'Menu': ('.menu', 'Menu'),
+    'Page': ('.page', 'Page'),
+    'SignupPage': ('.auth', 'Signup'),
+    'LoginPage': ('.auth', 'Login')
+}
+
+__all__ = list(_EXPORTS) + components.__all__
+
+
+def __getattr__(name):
+    if name in _EXPORTS:
+        module, attribute = _EXPORTS[name]
+        value = getattr(importlib.import_module(module, __name__), attribute)
+    elif name in components.__all__:
+        value = getattr(components, name)
+    else:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    globals()[name] = value
+    return value
+
 
-# The components __init__.py includes an exact list of importing elements,
-# so we are safe to use the '*' import hear.
-from .components import *
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
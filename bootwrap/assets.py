@@ -0,0 +1,87 @@
+"""
+The generic page assets.
+"""
+
+import re
+import hashlib
+import functools
+
+
+GENERIC_CSS = 'generic.css'
+"""The generic page style sheet."""
+
+GENERIC_JS = 'generic.js'
+"""The generic page script."""
+
+LIVE_JS = 'live.js'
+"""The live-update page script (the fragments, patches and channels)."""
+
+MIMETYPES = {
+    GENERIC_CSS: 'text/css',
+    GENERIC_JS: 'application/javascript',
+    LIVE_JS: 'application/javascript'
+}
+"""The asset MIME types."""
+
+
+@functools.lru_cache(maxsize=None)
+def load(name):
+    """Loads a minified asset.
+
+    The asset is loaded and minified just once per process.
+
+    Args:
+        name (str): The asset name (`GENERIC_CSS`, `GENERIC_JS` or
+            `LIVE_JS`).
+
+    Returns:
+        str: The minified asset content.
+    """
+    if name not in MIMETYPES:
+        raise ValueError(f'Unknown asset: {name};')
+    # Imported here since it is slow to import and only needed once.
+    import importlib.resources  # pylint: disable=import-outside-toplevel
+    if hasattr(importlib.resources, 'files'):
+        content = importlib.resources.files(__package__).joinpath(name)\
+            .read_text(encoding='utf-8')
+    else:
+        # Python < 3.9 has no `files()`.
+        content = importlib.resources.read_text(__package__, name)
+    return re.sub('\\n|\\s\\s+', ' ', content)
+
+
+@functools.lru_cache(maxsize=None)
+def hashed_name(name):
+    """Makes a content-hashed asset file name.
+
+    The file name changes whenever the asset content changes, so the asset
+    can be served with long-lived cache headers.
+
+    >>> hashed_name('generic.css')
+    >>> generic.1f0b6a4c8e2d.css
+
+    Args:
+        name (str): The asset name (`GENERIC_CSS`, `GENERIC_JS` or
+            `LIVE_JS`).
+
+    Returns:
+        str: The content-hashed asset file name.
+    """
+    digest = hashlib.sha256(load(name).encode('utf-8')).hexdigest()[:12]
+    stem, extension = name.rsplit('.', 1)
+    return f'{stem}.{digest}.{extension}'
+
+
+def find(filename):
+    """Finds an asset by its content-hashed file name.
+
+    Args:
+        filename (str): The content-hashed asset file name.
+
+    Returns:
+        str: The asset name or `None` if there is no such asset.
+    """
+    for name in MIMETYPES:
+        if hashed_name(name) == filename:
+            return name
+    return None
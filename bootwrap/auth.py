@@ -1,3 +1,5 @@
+import functools
+
 from .page import Page
 
 from .components import (
@@ -18,29 +20,40 @@ PASSWORD_TIPS = (
     '$, #, @, !,%,^,&,*).'
 )
 
-WC_EMAIL = TextInput(
-    'Your email',
-    'email',
-    placeholder='you@email.com'
-).for_email().add_classes('form-group')
-
-WC_NAME = TextInput(
-    'Your name',
-    'name',
-    placeholder='Your Name'
-).add_classes('form-group')
-
-WC_PASSWORD = TextInput(
-    'Your password',
-    'password',
-    placeholder='********'
-).for_password().add_classes('form-group')
-
-WC_CONF_PASSWORD = TextInput(
-    'Confirm your password',
-    'password',
-    placeholder='********'
-).for_password().add_classes('form-group')
+# The shared inputs are built on the first use rather than at import time.
+_INPUTS = {
+    'WC_EMAIL': lambda: TextInput(
+        'Your email',
+        'email',
+        placeholder='you@email.com'
+    ).for_email().add_classes('form-group'),
+    'WC_NAME': lambda: TextInput(
+        'Your name',
+        'name',
+        placeholder='Your Name'
+    ).add_classes('form-group'),
+    'WC_PASSWORD': lambda: TextInput(
+        'Your password',
+        'password',
+        placeholder='********'
+    ).for_password().add_classes('form-group'),
+    'WC_CONF_PASSWORD': lambda: TextInput(
+        'Confirm your password',
+        'password',
+        placeholder='********'
+    ).for_password().add_classes('form-group')
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _input(name):
+    return _INPUTS[name]()
+
+
+def __getattr__(name):
+    if name not in _INPUTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    return _input(name)
 
 
 class KeyActionActivator(Javascript):
@@ -86,9 +99,9 @@ class KeyActionActivator(Javascript):
             submap={
                 'email_regex': EMAIL_REGEX,
                 'password_regex': PASSWORD_REGEX,
-                'wc_email': WC_EMAIL,
-                'wc_password': WC_PASSWORD,
-                'wc_conf_password': WC_CONF_PASSWORD,
+                'wc_email': _input('WC_EMAIL'),
+                'wc_password': _input('WC_PASSWORD'),
+                'wc_conf_password': _input('WC_CONF_PASSWORD'),
                 'wc_to_activate': wc_to_activate
             })
 
@@ -156,10 +169,10 @@ class Signup(Auth):
 
         wc_form = Form(
             wc_form_title,
-            WC_EMAIL,
-            WC_NAME,
-            WC_PASSWORD,
-            WC_CONF_PASSWORD,
+            _input('WC_EMAIL'),
+            _input('WC_NAME'),
+            _input('WC_PASSWORD'),
+            _input('WC_CONF_PASSWORD'),
             wc_password_hint,
             Panel(
                 wc_sign_up, wc_cancel
@@ -199,8 +212,8 @@ class Login(Auth):
 
         wc_form = Form(
             wc_form_title,
-            WC_EMAIL,
-            WC_PASSWORD,
+            _input('WC_EMAIL'),
+            _input('WC_PASSWORD'),
             Panel(
                 wc_login, wc_cancel
             ).add_classes("d-flex justify-content-end")
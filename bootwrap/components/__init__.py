@@ -1,47 +1,75 @@
 """
 Base web components.
+
+The component modules are imported lazily, on the first access to any of
+their exported names, so importing a single component does not pay for all
+the others.
 """
 
 # flake8: noqa
 # pylint: disable=unused-variable
 
-from .anchor import Anchor
-from .badge import Badge
-from .base import (
-    WebComponent,
-    ClassMixin,
-    ActionMixin,
-    AppearanceMixin,
-    OutlineMixin,
-    AvailabilityMixin,
-    Breakpoint,
-    Action
-)
-from .button import Button, ButtonGroup
-from .deck import Deck
-from .dialog import Dialog
-from .form import (
-    Form,
-    Input,
-    CheckboxInput,
-    Freehand,
-    TextInput,
-    NumericInput,
-    SelectInput,
-    JsonInput,
-    HiddenInput,
-    FileInput,
-    InputGroup
-)
-from .icon import Icon, Spinner
-from .image import Image
-from .javascript import Javascript
-from .link import Link
-from .list import List
-from .navigation import Navigation
-from .panel import Panel
-from .separator import Separator
-from .table import Table, TableEntity
-from .text import Text
-from .toast import Toast
-from .utils import attr, inject
+import importlib
+
+_EXPORTS = {
+    'Anchor': '.anchor',
+    'Badge': '.badge',
+    'WebComponent': '.base',
+    'ClassMixin': '.base',
+    'ActionMixin': '.base',
+    'AppearanceMixin': '.base',
+    'OutlineMixin': '.base',
+    'AvailabilityMixin': '.base',
+    'Breakpoint': '.base',
+    'Action': '.base',
+    'AsyncValue': '.base',
+    'iter_components': '.base',
+    'Button': '.button',
+    'ButtonGroup': '.button',
+    'Deck': '.deck',
+    'Dialog': '.dialog',
+    'Form': '.form',
+    'Input': '.form',
+    'CheckboxInput': '.form',
+    'Freehand': '.form',
+    'TextInput': '.form',
+    'NumericInput': '.form',
+    'SelectInput': '.form',
+    'JsonInput': '.form',
+    'HiddenInput': '.form',
+    'FileInput': '.form',
+    'InputGroup': '.form',
+    'Icon': '.icon',
+    'Spinner': '.icon',
+    'Image': '.image',
+    'Javascript': '.javascript',
+    'Link': '.link',
+    'List': '.list',
+    'Navigation': '.navigation',
+    'Panel': '.panel',
+    'Separator': '.separator',
+    'Table': '.table',
+    'TableEntity': '.table',
+    'Text': '.text',
+    'Toast': '.toast',
+    'attr': '.utils',
+    'inject': '.utils',
+    'iter_inject': '.utils',
+    'render_options': '.utils',
+    'set_render_options': '.utils',
+    'rendering': '.utils'
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name):
+    if name not in _EXPORTS:
+        raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+    value = getattr(importlib.import_module(_EXPORTS[name], __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -13,7 +13,7 @@ from .base import (
 )
 from .panel import Panel
 from .dialog import Dialog
-from .utils import attr, inject
+from .utils import Template
 
 
 class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
@@ -33,6 +33,60 @@ class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
         output = Anchor('Google Search').link('https://www.google.com/')
     """
 
+    _LINK = Template('''
+        <a {id=identifier}
+            {class=classes}
+            {href=href}>
+            {inner}
+        </a>
+    ''')
+
+    _TOGGLE_PANEL = Template('''
+        <a {id=identifier}
+            {class=classes}
+            {href=href}
+            {data-bs-toggle=data_toggle}
+            {role=role}
+            {data-bs-target=href}>
+            {inner}
+        </a>
+    ''')
+
+    _TOGGLE_DIALOG = Template('''
+        <a {id=identifier}
+            {class=classes}
+            {href=href}
+            data-bs-toggle="modal"
+            role="modal">
+            {inner}
+        </a>
+    ''')
+
+    _DISMISS = Template('''
+        <a {id=identifier}
+            {class=classes}
+            href="#"
+            data-bs-dismiss="modal">
+            {inner}
+        </a>
+    ''')
+
+    _SUBMIT = Template('''
+        <button {id=identifier}
+            {class=classes}
+            type="submit">
+            {inner}
+        </button>
+    ''')
+
+    _DEFAULT = Template('''
+        <a {id=identifier}
+            {name=name}
+            {class=classes}>
+            {inner}
+        </a>
+    ''')
+
     def __init__(self, inner=None):
         super().__init__()
         self._inner = inner
@@ -42,8 +96,9 @@ class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
         if isinstance(self._inner, WebComponent):
             name = self._inner.identifier
 
+        classes = self.classes
         if self._category is not None:
-            self.add_classes(f'text-{self._category}')
+            classes = self._compose_classes(f'text-{self._category}')
 
         if self._action == Action.LINK:
             if isinstance(self._target, WebComponent):
@@ -51,13 +106,12 @@ class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
             else:  # type(target) == str
                 href = self._target
 
-            return f'''
-                <a {attr("id", self.identifier)}
-                    {attr("class", self.classes)}
-                    {attr("href", href)}>
-                    {inject(self._inner)}
-                </a>
-            '''
+            return Anchor._LINK.render(
+                identifier=self.identifier,
+                classes=classes,
+                href=href,
+                inner=self._inner
+            )
         elif self._action == Action.TOGGLE:
             if isinstance(self._target, Panel):
                 data_toggle = 'tab'
@@ -67,39 +121,31 @@ class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
                         data_toggle = 'collapse'
                         role = 'collapse'
 
-                return f'''
-                    <a {attr('id', self.identifier)}
-                        {attr('class', self.classes)}
-                        {attr("href", f'#{self._target.identifier}')}
-                        {attr("data-bs-toggle", data_toggle)}
-                        {attr("role", role)}
-                        data-bs-target="#{self._target.identifier}">
-                        {inject(self._inner)}
-                    </a>
-                '''
+                return Anchor._TOGGLE_PANEL.render(
+                    identifier=self.identifier,
+                    classes=classes,
+                    href=f'#{self._target.identifier}',
+                    data_toggle=data_toggle,
+                    role=role,
+                    inner=self._inner
+                )
             elif isinstance(self._target, Dialog):
-                return f'''
-                    <a {attr("id", self.identifier)}
-                        {attr("class",self.classes)}
-                        {attr("href", f'#{self._target.identifier}')}
-                        {attr("data-bs-toggle", "modal")}
-                        {attr("role", 'modal')}>
-                        {inject(self._inner)}
-                    </a>
-                '''
+                return Anchor._TOGGLE_DIALOG.render(
+                    identifier=self.identifier,
+                    classes=classes,
+                    href=f'#{self._target.identifier}',
+                    inner=self._inner
+                )
             raise TypeError(
                 'The toggle operation cannot be applied to the '
                 f'{type(self._target)} web component;',
             )
         elif self._action == Action.DISMISS:
-            return f'''
-                <a {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    {attr("href", f'#')}
-                    data-bs-dismiss="modal">
-                    {inject(self._inner)}
-                </a>
-            '''
+            return Anchor._DISMISS.render(
+                identifier=self.identifier,
+                classes=classes,
+                inner=self._inner
+            )
         elif self._action == Action.SUBMIT:
             warnings.warn(
                 'Avoid using an anchor for performing submit action and use '
@@ -108,19 +154,15 @@ class Anchor(WebComponent, ClassMixin, ActionMixin, AppearanceMixin):
                 category=RuntimeWarning
             )
 
-            self.add_classes('btn')
-            return f'''
-                <button {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    type="submit">
-                    {inject(self._inner)}
-                </button>
-            '''
+            return Anchor._SUBMIT.render(
+                identifier=self.identifier,
+                classes=self._compose_classes(classes, 'btn'),
+                inner=self._inner
+            )
         else:
-            return f'''
-                <a {attr("id", self.identifier)}
-                    {attr("name", name)}
-                    {attr("class", self.classes)}>
-                    {inject(self._inner)}
-                </a>
-            '''
+            return Anchor._DEFAULT.render(
+                identifier=self.identifier,
+                name=name,
+                classes=classes,
+                inner=self._inner
+            )
@@ -3,7 +3,7 @@ A badge.
 """
 
 from .base import WebComponent, ClassMixin, AppearanceMixin
-from .utils import attr
+from .utils import Template
 
 
 class Badge(WebComponent, ClassMixin, AppearanceMixin):
@@ -17,6 +17,13 @@ class Badge(WebComponent, ClassMixin, AppearanceMixin):
         output = Badge('Some Badge').as_dark()
     """
 
+    _TEMPLATE = Template('''
+        <span {id=identifier}
+            {class=classes}>
+            {label}
+        </span>
+    ''')
+
     def __init__(self, label):
         super().__init__()
         self.__label = label
@@ -29,9 +36,8 @@ class Badge(WebComponent, ClassMixin, AppearanceMixin):
         if self.classes:
             classes += f' {self.classes}'
 
-        return f'''
-            <span {attr("id", self.identifier)}
-                {attr('class', classes)}>
-                {self.__label}
-            </span>
-        '''
+        return Badge._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=classes,
+            label=self.__label
+        )
@@ -2,8 +2,296 @@
 Base web component and mixins.
 """
 
-import uuid
 import enum
+import functools
+import itertools
+import weakref
+
+from .utils import (
+    iter_inject,
+    render_options,
+    render_scope,
+    rendering,
+    _in_render,
+    _scope
+)
+
+
+# Every web component change is stamped with a version drawn from a
+# process-wide counter, so a later change always has a greater version.
+# The version of a web component is the latest version of its whole tree:
+# the web components are linked to the ones nested in them (see `_link`),
+# so a change is propagated to all the web components it is nested in.
+_version_counter = itertools.count(1)
+
+# The attributes keeping web component internals rather than its state.
+_INTERNALS = frozenset(
+    ['_render_memo', '_variant_of', '_version', '_state', '_linked',
+     '_relink', '_parents']
+)
+
+# The internals which are never shared with a variant of a web component
+# (see `WebComponent._variant`).
+_UNSHARED = frozenset(
+    ['_render_memo', '_version', '_state', '_linked', '_relink', '_parents']
+)
+
+
+def _changed(component):
+    """Records a change of the web component state."""
+    version = next(_version_counter)
+    attrs = component.__dict__
+    attrs['_state'] = attrs['_version'] = version
+    if not attrs.get('_parents'):
+        return
+    visited = {id(component)}
+    stack = [component]
+    while stack:
+        parents = stack.pop().__dict__.get('_parents')
+        if not parents:
+            continue
+        for key, ref in list(parents.items()):
+            parent = ref()
+            if parent is None:
+                del parents[key]
+            elif id(parent) not in visited:
+                visited.add(id(parent))
+                attrs = parent.__dict__
+                attrs['_version'] = version
+                # The changed web component must be linked again, so the
+                # path to it is walked on the next link.
+                attrs['_relink'] = True
+                stack.append(parent)
+
+
+def _link(root):
+    """Links the web components of a tree to the ones nested in them.
+
+    Every nested web component keeps weak references to the web components
+    it is nested in, so its changes are propagated to them. The versions
+    are brought up to date while linking. Only the web components changed
+    since they were linked (and the paths to them) are walked.
+    """
+    versions = {}
+    stack = [(root, None)]
+    while stack:
+        component, children = stack.pop()
+        attrs = component.__dict__
+        if children is not None:
+            # All the nested web components are linked.
+            version = max(
+                [component._version] + [versions[id(c)] for c in children]
+            )
+            attrs['_version'] = versions[id(component)] = version
+            attrs['_linked'] = component._state
+            attrs['_relink'] = False
+            continue
+        if id(component) in versions:
+            continue
+        versions[id(component)] = component._version
+        linked = attrs.get('_linked') == component._state
+        if linked and not attrs.get('_relink'):
+            continue
+        children = component._children()
+        if not linked:
+            ref = weakref.ref(component)
+            for child in children:
+                parents = child.__dict__.get('_parents')
+                if parents is None:
+                    parents = child.__dict__['_parents'] = {}
+                parents[id(component)] = ref
+        stack.append((component, children))
+        stack.extend((child, None) for child in children)
+
+
+def _linked_version(component):
+    """Gets the version of a web component tree (linking it if needed)."""
+    attrs = component.__dict__
+    if attrs.get('_linked') != component._state or attrs.get('_relink'):
+        _link(component)
+    return component._version
+
+
+def _tree_version(*roots):
+    """Gets the latest version of the web components in the trees.
+
+    Args:
+        *roots (list): The web components (`None` and other values are
+            ignored, the async values are looked through).
+
+    Returns:
+        int: The version.
+    """
+    return max(map(_linked_version, _nested(roots)), default=0)
+
+
+# Identifiers are drawn from a process-wide counter and encoded in
+# hexadecimal, so they are short, unique and cheap to make.
+_identifier_counter = itertools.count()
+_identifier_prefix = 'w'
+
+
+def _memoize_render(render):
+    """Memoizes the output of a web component `__str__` method.
+
+    Args:
+        render (func): The `__str__` method to memoize.
+
+    Returns:
+        func: The memoized `__str__` method.
+    """
+    @functools.wraps(render)
+    def wrapper(self):
+        if not _in_render.get():
+            # The render starts here, the web components made from now on
+            # are temporary (see `WebComponent.__new__`).
+            token = _in_render.set(True)
+            try:
+                return wrapper(self)
+            finally:
+                _in_render.reset(token)
+
+        options = render_options()
+        scope = None
+        if options.deterministic:
+            scope = _scope.get()
+            if scope is None:
+                # The deterministic render starts here.
+                with rendering():
+                    return wrapper(self)
+
+        # The temporary web components are rendered just once, so their
+        # output is not memoized.
+        attrs = self.__dict__
+        if '_state' not in attrs:
+            if scope is None:
+                return render(self)
+            return _render_owned(render, self, scope)
+
+        # A memoized output is valid within the same identifier scope only,
+        # because the identifiers it references are allocated in the scope.
+        memo = attrs.get('_render_memo')
+        if memo is not None and memo[1] == options and \
+                memo[2] is scope and _linked_version(self) <= memo[0]:
+            return memo[3]
+        # The output is valid until any web component of the tree changes,
+        # that is gets a version greater than the one drawn here.
+        version = next(_version_counter)
+        if scope is None:
+            output = render(self)
+        else:
+            output = _render_owned(render, self, scope)
+        attrs['_render_memo'] = (version, options, scope, output)
+        return output
+    return wrapper
+
+
+def _render_owned(render, component, scope):
+    """Renders a web component owning the deterministic identifiers
+    allocated while it is rendered."""
+    owner = _enter_owner(scope, component)
+    try:
+        return render(component)
+    finally:
+        scope.leave(owner)
+
+
+def _own_chunks(iter_render):
+    """Makes a web component `iter_render` method own the deterministic
+    identifiers allocated while its chunks are produced.
+
+    Args:
+        iter_render (func): The `iter_render` method to wrap.
+
+    Returns:
+        func: The wrapped `iter_render` method.
+    """
+    @functools.wraps(iter_render)
+    def wrapper(self, *args, **kwargs):
+        # The identifier scope is there within deterministic renders only.
+        scope = render_scope()
+        if scope is None:
+            return iter_render(self, *args, **kwargs)
+        owner = _enter_owner(scope, self)
+        try:
+            chunks = iter_render(self, *args, **kwargs)
+        finally:
+            scope.leave(owner)
+        return _iter_owned(scope, owner, chunks)
+    return wrapper
+
+
+def _iter_owned(scope, component, chunks):
+    """Makes a web component the owner while the next chunk is produced."""
+    chunks = iter(chunks)
+    while True:
+        scope.enter(component)
+        try:
+            chunk = next(chunks, None)
+        finally:
+            scope.leave(component)
+        if chunk is None:
+            return
+        yield chunk
+
+
+def _reduce_temporary(component, protocol):
+    """Pickles a temporary web component as a web component of the
+    original class (the temporary classes cannot be looked up by name)."""
+    del protocol
+    return _uninitialized, (type(component).__base__,), \
+        component.__getstate__()
+
+
+def _uninitialized(cls):
+    """Makes an uninitialized web component (while unpickling)."""
+    return object.__new__(cls)
+
+
+def _temporary_class(cls):
+    """Gets the class of the temporary web components of a class.
+
+    The web components made while rendering are dropped once rendered, so
+    their changes are not tracked: the temporary class differs from the
+    original one only by assigning attributes as plain Python objects do.
+
+    Args:
+        cls (type): The web component class.
+
+    Returns:
+        type: The temporary web component class.
+    """
+    temporary = cls.__dict__.get('_temporary_class')
+    if temporary is None:
+        temporary = type(cls)(cls.__name__, (cls,), {
+            '__module__': cls.__module__,
+            '__qualname__': cls.__qualname__,
+            '__setattr__': object.__setattr__,
+            '__reduce_ex__': _reduce_temporary
+        })
+        # The temporary components made of the temporary ones (for example,
+        # their variants) are of the same class.
+        temporary._temporary_class = temporary
+        cls._temporary_class = temporary
+    return temporary
+
+
+def _enter_owner(scope, component):
+    """Makes a web component the innermost owner of a deterministic render.
+
+    A web component rendered on its own (rather than as a part of another
+    one) gets the identifiers of its whole tree allocated up front, so they
+    depend on the tree only and not on the order of rendering.
+
+    Returns:
+        obj: The owner (the original web component of a variant).
+    """
+    component = component.__dict__.get('_variant_of', component)
+    if not scope.owners and component not in scope:
+        for nested in iter_components(component):
+            scope.identifier(nested)
+    scope.enter(component)
+    return component
 
 
 class WebComponent:
@@ -16,6 +304,14 @@ class WebComponent:
     will be generated a `TypeError`. To ensure correct handling of your
     custom component, do not forget to inherit the `WebComponent` class.
 
+    The rendered output of a web component is memoized, so rendering the
+    same component again (with the same render options) is cheap. The
+    memoized output is invalidated as soon as the web component or any of
+    its nested web components changes its state (for example, by calling
+    `add_classes`, `as_primary` or `link`). Note, in-place changes of the
+    objects passed to a web component (such as a table body list) are not
+    tracked, call `invalidate` after making them.
+
     Example:
         from bootwrap import WebComponent
 
@@ -31,29 +327,366 @@ class WebComponent:
                 '''
     """
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if '__str__' in cls.__dict__:
+            cls.__str__ = _memoize_render(cls.__dict__['__str__'])
+        if 'iter_render' in cls.__dict__:
+            cls.iter_render = _own_chunks(cls.__dict__['iter_render'])
+            cls._streamed = True
+
     def __init__(self):
         super(WebComponent, self).__init__()
-        self.__identifier = str(uuid.uuid4())
+
+    # The version of the web component tree and of its own state (see
+    # `_changed`).
+    _version = 0
+    _state = 0
+
+    # Whether the web component is rendered chunk by chunk, that is it
+    # overrides `iter_render` (the other ones are rendered with `str`).
+    _streamed = False
+
+    def __new__(cls, *args, **kwargs):
+        # The web components made while rendering are temporary: they are
+        # dropped once rendered, so their changes are not tracked.
+        if _in_render.get():
+            cls = _temporary_class(cls)
+        return super().__new__(cls)
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        _changed(self)
+
+    def __getstate__(self):
+        # The memoized render output is never valid in another process and
+        # the links to the enclosing web components cannot be copied.
+        state = self.__dict__.copy()
+        for name in ('_render_memo', '_parents', '_linked', '_relink'):
+            state.pop(name, None)
+        return state
 
     @property
     def identifier(self):
         """A unique web component identifier.
 
-        Every `WebComponent` has a unique identifier (ex. cfe040e6-df5f-4a3a-
-        b96e-b0cefc31bbd9). This identifier is used for referencing between
-        components inside a page. This property returns this identifier as
-        `str`.
+        Every `WebComponent` has a unique identifier (ex. w1f3). This
+        identifier is used for referencing between components inside a page.
+        This property returns this identifier as `str`.
+
+        The identifier is allocated on the first access, so web components
+        which are never referenced (for example, temporary components created
+        while rendering) do not spend any identifier. Within a deterministic
+        render (see the `rendering` function) identifiers are allocated per
+        render instead, in the web component tree order.
 
         When you create a custom  `WebComponent` it is advisable to set its
         tag attribute `id` equals to `identifier`.
 
         Example:
             header = CustomHeader('Hello World")
-            print(header.classes)
+            print(header.identifier)
+
+            # Result: w1f3
+        """
+        # The identifier scope is there within deterministic renders only
+        # (it is got directly, since identifiers are used in every render).
+        scope = _scope.get()
+        if scope is not None:
+            return scope.identifier(self.__dict__.get('_variant_of', self))
+
+        attrs = self.__dict__
+        identifier = attrs.get('_WebComponent__identifier')
+        if identifier is None:
+            # Allocating the identifier does not change the web component
+            # look, so it must not invalidate memoized render outputs.
+            identifier = '%s%x' % (
+                _identifier_prefix, next(_identifier_counter)
+            )
+            attrs['_WebComponent__identifier'] = identifier
+        return identifier
+
+    def iter_render(self):
+        """Renders the web component chunk by chunk.
+
+        The chunks are yielded in the document order, so joining them
+        gives exactly the same HTML as `str(component)`. By default the
+        whole component is rendered as a single chunk; container components
+        override this method to stream their children one by one.
+
+        Example:
+            from flask import Response
+
+            panel = Panel(...)
+            response = Response(panel.iter_render(), mimetype='text/html')
+        """
+        yield str(self)
+
+    async def arender(self):
+        """Renders the web component resolving its async values first.
+
+        All the `AsyncValue` placeholders found in the web component tree
+        are resolved concurrently, so the rendering takes as long as the
+        slowest of them rather than all of them together.
+
+        Returns:
+            str: The web component HTML.
+
+        Example:
+            html = await panel.arender()
+        """
+        await resolve(self)
+        return str(self)
+
+    def _children(self):
+        """Gets the web components nested in this web component.
+
+        By default the web components are looked up in the instance
+        attributes (including lists, tuples and dicts of them). A web
+        component holding large data (such as a table body) overrides this
+        method to skip it.
+
+        Returns:
+            iterable: The nested web components.
+        """
+        found = []
+        for name, value in vars(self).items():
+            if name not in _INTERNALS and value is not None and \
+                    value.__class__ is not str:
+                _nested(value, found)
+        return found
+
+    def invalidate(self):
+        """Invalidates the memoized render output.
+
+        The changes made through the web component methods are tracked, but
+        the in-place changes of the data passed to the web component are
+        not. Call this method after making them, so the web component (and
+        the web components it is nested in) is rendered again.
+
+        Example:
+            rows = [["AAPL", 90], ["AMZN", 80]]
+            table = Table(["Symbol", "Price"], rows)
+            ...
+            rows[0][1] = 91
+            table.invalidate()
+        """
+        _changed(self)
+
+    def _variant(self):
+        """Makes a shallow copy of the web component.
 
-            # Result: cfe040e6-df5f-4a3a-b96e-b0cefc31bbd9
+        The copy shares the identifier and content with this web component,
+        so it can be adjusted (for example, by adding classes) and rendered
+        in place of the original without changing the original.
+
+        Returns:
+            obj (WebComponent): The copy of this web component.
         """
-        return self.__identifier
+        # The identifier is allocated before copying to be shared. Within a
+        # deterministic render the variant is identified as its original.
+        self.identifier
+        other = WebComponent.__new__(self.__class__)
+        attrs = other.__dict__
+        attrs.update(self.__dict__)
+        for name in _UNSHARED.intersection(attrs):
+            del attrs[name]
+        attrs.setdefault('_variant_of', self)
+        if not _in_render.get():
+            _changed(other)
+        return other
+
+
+def _nested(value, found=None):
+    """Collects the web components found in a value.
+
+    Returns:
+        list: The web components.
+    """
+    if found is None:
+        found = []
+    if isinstance(value, WebComponent):
+        found.append(value)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            if item is not None and item.__class__ is not str:
+                _nested(item, found)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _nested(item, found)
+    elif isinstance(value, AsyncValue):
+        if value.resolved:
+            _nested(value.value, found)
+    return found
+
+
+def iter_components(*roots):
+    """Walks the web components tree depth-first.
+
+    Every web component is yielded once, even if it is referenced several
+    times (for example, as a nested one and as an action target).
+
+    Args:
+        *roots (list): The web components to start from (`None` and other
+            values are ignored, the async values are looked through).
+
+    Returns:
+        generator: The web components in the tree.
+    """
+    visited = set()
+    stack = list(reversed(_nested(roots)))
+    while stack:
+        component = stack.pop()
+        if id(component) in visited:
+            continue
+        visited.add(id(component))
+        yield component
+        stack.extend(reversed(list(component._children())))
+
+
+class AsyncValue:
+    """A placeholder of a value provided asynchronously.
+
+    The placeholder is accepted wherever a web component expects a content
+    value (a title, a description, a marker, a table cell, etc.). The value
+    is awaited when the web component is rendered with `arender`, along
+    with all the other placeholders of the page, and never again after
+    that. Note, table transforms get the placeholders rather than their
+    values (see the `value` property).
+
+    Args:
+        provider (awaitable|func): The awaitable providing the value, or
+            the function making it (called when the value is resolved).
+
+    Example:
+        from bootwrap import AsyncValue, Deck
+
+        async def fetch_price(symbol):
+            ...
+
+        deck = Deck(
+            Deck.Card('AAPL', description=AsyncValue(fetch_price('AAPL'))),
+            Deck.Card('NVDA', description=AsyncValue(fetch_price('NVDA')))
+        )
+        html = await deck.arender()
+    """
+
+    # The resolved value is rendered chunk by chunk (see `iter_inject`).
+    _streamed = True
+
+    def __init__(self, provider):
+        self.__provider = provider
+        self.__resolved = False
+        self.__value = None
+
+    @property
+    def resolved(self):
+        """Whether the value has been resolved."""
+        return self.__resolved
+
+    @property
+    def value(self):
+        """The resolved value."""
+        if not self.__resolved:
+            raise RuntimeError(
+                'The async value is not resolved yet, render the web '
+                'component with the `arender` method;'
+            )
+        return self.__value
+
+    async def resolve(self):
+        """Awaits the value (just once).
+
+        Returns:
+            obj: The resolved value.
+        """
+        if not self.__resolved:
+            provider = self.__provider
+            if callable(provider):
+                provider = provider()
+            self.__value = await provider
+            self.__resolved = True
+            self.__provider = None
+        return self.__value
+
+    def iter_render(self):
+        """Renders the resolved value chunk by chunk."""
+        return iter_inject(self.value)
+
+    def __str__(self):
+        return ''.join(self.iter_render())
+
+
+def _async_values(value):
+    """Yields the async values found in a value."""
+    if isinstance(value, AsyncValue):
+        yield value
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            yield from _async_values(item)
+    elif isinstance(value, dict):
+        for item in value.values():
+            yield from _async_values(item)
+
+
+async def resolve(*roots):
+    """Resolves the async values of the web components trees.
+
+    The async values are resolved concurrently with `asyncio.gather`. The
+    values turning out to be web components with async values of their own
+    are resolved in the next round.
+
+    Args:
+        *roots (list): The web components to resolve the async values of.
+    """
+    import asyncio  # pylint: disable=import-outside-toplevel
+
+    while True:
+        pending = {
+            id(placeholder): placeholder
+            for placeholder in _async_values(roots)
+            if not placeholder.resolved
+        }
+        owners = []
+        for component in iter_components(*roots):
+            for name, value in vars(component).items():
+                if name not in _INTERNALS:
+                    for placeholder in _async_values(value):
+                        if not placeholder.resolved:
+                            pending[id(placeholder)] = placeholder
+                            owners.append(component)
+        if len(pending) == 0:
+            return
+        await asyncio.gather(
+            *(placeholder.resolve() for placeholder in pending.values())
+        )
+        # The resolved values change how the web components look.
+        for component in owners:
+            component.invalidate()
+
+
+def _resolved(value):
+    """Gets the value of a resolved async value placeholder."""
+    return value.value if isinstance(value, AsyncValue) else value
+
+
+@functools.lru_cache(maxsize=1024)
+def _join_classes(classes, extra):
+    """Joins the web component classes with the render-time ones.
+
+    The same classes are joined over and over again while rendering (the
+    render-time classes are mostly literals), so the results are cached.
+
+    Args:
+        classes (tuple): The web component classes.
+        extra (tuple): The render-time classes (`None` and empty strings
+            are ignored).
+
+    Returns:
+        classes (str): The joined classes or `None` if there are no classes.
+    """
+    joined = ' '.join(filter(None, classes + extra)).split()
+    return ' '.join(dict.fromkeys(joined)) or None
 
 
 class ClassMixin:
@@ -65,7 +698,7 @@ class ClassMixin:
 
     def __init__(self):
         super(ClassMixin, self).__init__()
-        self.__classes = []
+        self.__classes = ()
 
     def add_classes(self, classes):
         """Adds other classes.
@@ -86,10 +719,14 @@ class ClassMixin:
             # Note, that Button inherits ClassMixin.
             button = Button("Hello").add_classes("ms-1 me-1")
         """
+        # The classes are kept as a tuple, so copies of this web component
+        # (see `WebComponent._variant`) never share changes with it.
+        updated = list(self.__classes)
         for c in classes.split(' '):
             if len(c) > 0:
-                if c not in self.__classes:
-                    self.__classes.append(c)
+                if c not in updated:
+                    updated.append(c)
+        self.__classes = tuple(updated)
         return self
 
     @property
@@ -109,6 +746,22 @@ class ClassMixin:
             return ' '.join(self.__classes)
         return None
 
+    def _compose_classes(self, *classes):
+        """Composes the web component classes with the render-time classes.
+
+        Unlike `add_classes` this method does not change the web component,
+        so it is safe to use while rendering.
+
+        Args:
+            *classes (str): The render-time classes to append, `None` and
+                empty strings are ignored.
+
+        Returns:
+            classes (str): The composed classes or `None` if there are no
+                classes at all.
+        """
+        return _join_classes(self.__classes, classes)
+
     def m(self, size):
         """Sets margin for all four sides to the specified size.
 
@@ -14,7 +14,7 @@ from .base import (
 from .panel import Panel
 from .dialog import Dialog
 from .icon import Icon
-from .utils import attr, inject
+from .utils import Template, inject
 
 
 class Button(WebComponent, ClassMixin, ActionMixin, AppearanceMixin,
@@ -32,6 +32,86 @@ class Button(WebComponent, ClassMixin, ActionMixin, AppearanceMixin,
         output = Button('Google Search').link('https://www.google.com/')
     """
 
+    _MENU = Template('''
+        <div class="btn-group">
+            {host}
+            <div class="dropdown-menu dropdown-menu-right">
+                {menu}
+            </div>
+        </div>
+    ''')
+
+    _MENU_ELLIPSIS = Template('''
+        <i {id=identifier}
+            {class=classes}
+            style="cursor: pointer"
+            data-bs-toggle="dropdown"
+            onclick="return false;">
+        </i>
+    ''')
+
+    _MENU_TOGGLE = Template('''
+        <button {id=identifier}
+            {class=classes}
+            type="button"
+            data-bs-toggle="dropdown"
+            aria-haspopup="true"
+            aria-expanded="false"
+            onclick="return false;">
+            {name}
+        </button>
+    ''')
+
+    _LINK = Template('''
+        <a {id=identifier}
+            {class=classes}
+            {href=href}
+            role="button">
+            {name}
+        </a>
+    ''')
+
+    _TOGGLE = Template('''
+        <button {id=identifier}
+            {class=classes}
+            type="button"
+            {data-bs-toggle=data_toggle}
+            {data-bs-target=target}
+            onclick="return false;"
+            {disabled=disabled}>
+            {name}
+        </button>
+    ''')
+
+    _DISMISS = Template('''
+        <button {id=identifier}
+            {class=classes}
+            type="button"
+            data-bs-dismiss="modal"
+            onclick="return false;"
+            {disabled=disabled}>
+            {name}
+        </button>
+    ''')
+
+    _SUBMIT = Template('''
+        <button {id=identifier}
+            {class=classes}
+            type="submit"
+            {disabled=disabled}>
+            {name}
+        </button>
+    ''')
+
+    _DEFAULT = Template('''
+        <button {id=identifier}
+            {class=classes}
+            onclick="return false;"
+            {disabled=disabled}>
+            {name}
+        </button>
+    ''')
+
     def __init__(self, name):
         super().__init__()
         self.__name = name
@@ -65,60 +145,45 @@ class Button(WebComponent, ClassMixin, ActionMixin, AppearanceMixin,
 
 
     def __str__(self):
-        self.add_classes('btn')
+        classes = ['btn']
 
         if self._category:
             if self._border:
-                self.add_classes(f'btn-outline-{self._category}')
+                classes.append(f'btn-outline-{self._category}')
             else:
-                self.add_classes(f'btn-{self._category}')
+                classes.append(f'btn-{self._category}')
 
         button_name = self.__name
         if self.__icon:
             if self.__right_side:
                 button_name = f"{self.__name}{inject(self.__icon)}"
             else:
-                button_name = f"{inject(self.__icon)}{self.__name}"   
+                button_name = f"{inject(self.__icon)}{self.__name}"
         
 
         if self._menu:
-            for item in self._menu:
-                item.add_classes('dropdown-item')
+            menu = [
+                item._variant().add_classes('dropdown-item')
+                for item in self._menu
+            ]
 
             if self.__name == '...':
-                self.add_classes('fas fa-ellipsis-v')
-                host = f'''
-                    <i {attr('id', self.identifier)}
-                        {attr('class', self.classes)}
-                        style="cursor: pointer"
-                        data-bs-toggle="dropdown"
-                        onclick="return false;">
-                    </i>
-                '''
+                classes.append('fas fa-ellipsis-v')
+                host = Button._MENU_ELLIPSIS.render(
+                    identifier=self.identifier,
+                    classes=self._compose_classes(*classes)
+                )
             else:
-                self.add_classes('dropdown-toggle')
-                host = f'''
-                    <button {attr('id', self.identifier)}
-                        {attr('class', self.classes)}
-                        type="button"
-                        data-bs-toggle="dropdown"
-                        aria-haspopup="true"
-                        aria-expanded="false"
-                        onclick="return false;">
-                        {button_name}
-                    </button>
-                '''
-            return f'''
-                <div class="btn-group">
-                    {host}
-                    <div class="dropdown-menu dropdown-menu-right">
-                        {inject(*self._menu)}
-                    </div>
-                </div>
-            '''
+                classes.append('dropdown-toggle')
+                host = Button._MENU_TOGGLE.render(
+                    identifier=self.identifier,
+                    classes=self._compose_classes(*classes),
+                    name=button_name
+                )
+            return Button._MENU.render(host=host, menu=menu)
         elif self._action == Action.LINK:
             if self._disabled:
-                self.add_classes('disabled')
+                classes.append('disabled')
 
             # At this point, we only need to check whether the specified
             # target is a web component or a string. The ActionMixin makes
@@ -128,77 +193,47 @@ class Button(WebComponent, ClassMixin, ActionMixin, AppearanceMixin,
             else:  # type(target) == str
                 href = self._target
 
-            return f'''
-                <a {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    {attr('href', href)}
-                    role="button">
-                    {button_name}
-                </a>
-            '''
+            return Button._LINK.render(
+                identifier=self.identifier,
+                classes=self._compose_classes(*classes),
+                href=href,
+                name=button_name
+            )
         elif self._action == Action.TOGGLE:
             if isinstance(self._target, Panel):
                 data_toggle = 'tab'
                 if self._target.classes is not None:
                     if 'collapse' in self._target.classes:
                         data_toggle = 'collapse'
-
-                return f'''
-                    <button {attr('id', self.identifier)}
-                        {attr('class', self.classes)}
-                        type="button"
-                        data-bs-toggle="{data_toggle}"
-                        data-bs-target="#{self._target.identifier}"
-                        onclick="return false;"
-                        {attr('disabled', self._disabled)}>
-                        {button_name}
-                    </button>
-                '''
             elif isinstance(self._target, Dialog):
-                return f'''
-                    <button {attr('id', self.identifier)}
-                        {attr('class', self.classes)}
-                        type="button"
-                        data-bs-toggle="modal"
-                        data-bs-target="#{self._target.identifier}"
-                        onclick="return false;"
-                        {attr('disabled', self._disabled)}>
-                        {button_name}
-                    </button>
-                '''
-            raise TypeError(
-                'The toggle operation cannot be applied to the '
-                f'{type(self._target)} web component;',
+                data_toggle = 'modal'
+            else:
+                raise TypeError(
+                    'The toggle operation cannot be applied to the '
+                    f'{type(self._target)} web component;',
+                )
+
+            return Button._TOGGLE.render(
+                identifier=self.identifier,
+                classes=self._compose_classes(*classes),
+                data_toggle=data_toggle,
+                target=f'#{self._target.identifier}',
+                disabled=self._disabled,
+                name=button_name
             )
         elif self._action == Action.DISMISS:
-            return f'''
-                <button {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    type="button"
-                    data-bs-dismiss="modal"
-                    onclick="return false;"
-                    {attr('disabled', self._disabled)}>
-                    {button_name}
-                </button>
-            '''
+            template = Button._DISMISS
         elif self._action == Action.SUBMIT:
-            return f'''
-                <button {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    type="submit"
-                    {attr('disabled', self._disabled)}>
-                    {button_name}
-                </button>
-            '''
+            template = Button._SUBMIT
         else:
-            return f'''
-                <button {attr('id', self.identifier)}
-                    {attr('class', self.classes)}
-                    onclick="return false;"
-                    {attr('disabled', self._disabled)}>
-                    {button_name}
-                </button>
-            '''
+            template = Button._DEFAULT
+
+        return template.render(
+            identifier=self.identifier,
+            classes=self._compose_classes(*classes),
+            disabled=self._disabled,
+            name=button_name
+        )
 
 class ButtonGroup(WebComponent, ClassMixin):
     """A web component for a button group.
@@ -218,16 +253,22 @@ class ButtonGroup(WebComponent, ClassMixin):
 
         output = ButtonGroup(button1, button2, button3)
     """
+
+    _TEMPLATE = Template('''
+        <div {id=identifier}
+            {class=classes}
+            role="group">
+            {buttons}
+        </div>
+    ''')
+
     def __init__(self, *buttons):
         super().__init__()
         self.__buttons = buttons
 
     def __str__(self):
-        self.add_classes("btn-group")
-        return f'''
-            <div {attr("id", self.identifier)}
-                {attr("class", self.classes)}
-                role="group">
-                {inject(*self.__buttons)}
-            </div>
-        '''
\ No newline at end of file
+        return ButtonGroup._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=self._compose_classes("btn-group"),
+            buttons=self.__buttons
+        )
@@ -2,10 +2,11 @@
 A collection of items.
 """
 
-from .base import ActionMixin, WebComponent, ClassMixin
+from .base import ActionMixin, WebComponent, ClassMixin, _resolved
 from .button import Button
 from .text import Text
-from .utils import attr, inject
+from .utils import Template, _render_template
+from .parallel import render_all
 
 
 class Deck(WebComponent, ClassMixin):
@@ -48,6 +49,18 @@ class Deck(WebComponent, ClassMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <div {id=identifier}
+            {class=classes}>
+            {cards}
+        </div>
+        <style>
+            div.card {{
+                cursor:pointer
+            }}
+        </style>
+    ''')
+
     def __init__(self, *cards):
         super().__init__()
 
@@ -86,6 +99,33 @@ class Deck(WebComponent, ClassMixin):
                 "https://www.google.com")
         """
 
+        _MARKER = Template('''
+            <div class="text-right mb-2">
+                {marker}
+            </div>
+        ''')
+
+        _ACTIONS = Template('''
+            <div class="card-footer text-right">
+                {actions}
+            </div>
+        ''')
+
+        _TEMPLATE = Template('''
+            <div {id=identifier}
+                {class=classes}>
+                <a {onclick=onclick}>
+                    {figure}
+                </a>
+                <div class="card-body" {onclick=onclick}>
+                    {marker}
+                    {title}
+                    {description}
+                </div>
+                {actions}
+            </div>
+        ''')
+
         def __init__(self, title, description=None, marker=None, figure=None):
             super().__init__()
             self._title = title
@@ -121,75 +161,62 @@ class Deck(WebComponent, ClassMixin):
             return self
 
         def __str__(self):
-            wc_title = self._title
+            wc_title = _resolved(self._title)
             if isinstance(wc_title, str):
                 wc_title = Text(wc_title).as_heading(5).\
                     add_classes('card-title')
             else:
-                wc_title.add_classes('card-title')
+                wc_title = wc_title._variant().add_classes('card-title')
 
-            wc_marker = self._marker
+            wc_marker = _resolved(self._marker)
             if wc_marker:
                 if isinstance(wc_marker, str):
                     wc_marker = Text(wc_marker).as_small().as_muted()
-                wc_marker = f'''
-                    <div class="text-right mb-2">
-                        {inject(wc_marker)}
-                    </div>
-                '''
+                wc_marker = Deck.Card._MARKER.render(marker=wc_marker)
 
             wc_actions = None
             if self._menu:
                 if self._pack_actions:
-                    wc_actions = f'''
-                        <div class="card-footer text-right">
-                            {inject(Button("...").add_menu(*self._menu))}
-                        </div>
-                    '''
+                    wc_actions = Deck.Card._ACTIONS.render(
+                        actions=Button("...").add_menu(*self._menu)
+                    )
                 else:
-                    wc_actions = f'''
-                        <div class="card-footer text-right">
-                            {inject(*self._menu)}
-                        </div>
-                    '''
+                    wc_actions = Deck.Card._ACTIONS.render(
+                        actions=self._menu
+                    )
 
             onclick = None
             if self._target:
                 onclick = f"location.href='{self._target}';"
 
-            if self._figure:
-                self._figure.add_classes("card-img-top")
-
-            self.add_classes('card')
-            return f'''
-                <div {attr("id", self.identifier)}
-                    {attr('class', self.classes)}>
-                    <a {attr('onclick', onclick)}>
-                        {inject(self._figure)}
-                    </a>
-                    <div class="card-body" {attr('onclick', onclick)}>
-                        {inject(wc_marker)}
-                        {inject(wc_title)}
-                        {inject(self._description)}
-                    </div>
-                    {inject(wc_actions)}
-                </div>
-            '''  # NOQA
+            wc_figure = _resolved(self._figure)
+            if wc_figure:
+                wc_figure = wc_figure._variant().add_classes("card-img-top")
+
+            return Deck.Card._TEMPLATE.render(
+                identifier=self.identifier,
+                classes=self._compose_classes('card'),
+                onclick=onclick,
+                figure=wc_figure,
+                marker=wc_marker,
+                title=wc_title,
+                description=self._description,
+                actions=wc_actions
+            )
+
+    def iter_render(self):
+        """Renders the deck chunk by chunk, a card at a time."""
+        return self.__render(streamed=True)
 
     def __str__(self):
-        style = '''
-            <style>
-                div.card {
-                    cursor:pointer
-                }
-            </style>
-        '''
-
-        self.add_classes('card-deck grid-container')
-        return f'''
-            <div {attr("id", self.identifier)}
-                {attr('class', self.classes)}>
-                {inject(*self._cards)}
-            </div>
-            {style}
-        '''
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the deck as a whole or chunk by chunk."""
+        return _render_template(
+            Deck._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            classes=self._compose_classes('card-deck grid-container'),
+            cards=render_all(self._cards)
+        )
@@ -3,7 +3,7 @@ A dialog
 """
 
 from .base import WebComponent, AppearanceMixin
-from .utils import inject
+from .utils import Template, _render_template
 
 
 class Dialog(WebComponent, AppearanceMixin):
@@ -27,41 +27,62 @@ class Dialog(WebComponent, AppearanceMixin):
         output = Panel(dialog, button)
     """
 
+    _TEMPLATE = Template('''
+        <div {id=identifier} class="modal">
+            <div class="modal-dialog" role="document">
+                <div class="modal-content">
+                    <div class="modal-header">
+                        <h5 {class=classes}>
+                            {title}
+                        </h5>
+                        <button type="button"
+                            class="btn-close"
+                            data-bs-dismiss="modal"
+                            aria-label="Close">
+                        </button>
+                    </div>
+                    <div class="modal-body">
+                        {content}
+                    </div>
+                    {actions}
+                </div>
+            </div>
+        </div>
+    ''')
+
+    _ACTIONS = Template('''
+        <div class="modal-footer">
+            {actions}
+        </div>
+    ''')
+
     def __init__(self, title, content, *actions):
         super().__init__()
         self.__title = title
         self.__content = content
         self.__actions = actions
 
+    def iter_render(self):
+        """Renders the dialog chunk by chunk, streaming its content."""
+        return self.__render(streamed=True)
+
     def __str__(self):
-        modal_footer = None
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the dialog as a whole or chunk by chunk."""
+        actions = None
         if len(self.__actions) > 0:
-            modal_footer = f'''
-                <div class="modal-footer">
-                    {inject(*self.__actions)}
-                </div>
-            '''
+            actions = _render_template(
+                Dialog._ACTIONS, streamed, actions=self.__actions
+            )
 
-        return f'''
-            <div id="{self.identifier}" class="modal">
-                <div class="modal-dialog" role="document">
-                    <div class="modal-content">
-                        <div class="modal-header">
-                            <h5 class="modal-title text-{self._category}">
-                                {self.__title}
-                            </h5>
-                            <button type="button"
-                                class="btn-close"
-                                data-bs-dismiss="modal"
-                                aria-label="Close">
-                                
-                            </button>
-                        </div>
-                        <div class="modal-body">
-                            {inject(self.__content)}
-                        </div>
-                        {inject(modal_footer)}
-                    </div>
-                </div>
-            </div>
-        '''
+        return _render_template(
+            Dialog._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            classes=f'modal-title text-{self._category}',
+            title=self.__title,
+            content=self.__content,
+            actions=actions
+        )
@@ -14,7 +14,7 @@ from .base import (
     AppearanceMixin,
     OutlineMixin,
 )
-from .utils import attr, tag, inject
+from .utils import Template, attr, tag, inject, _render_template
 from .text import Text  #
 
 
@@ -38,6 +38,16 @@ class Form(WebComponent, ClassMixin):
         ).on_submit('go/to/this/url')
     """
 
+    _TEMPLATE = Template("""
+        <form {id=identifier}
+            {action=href}
+            {class=classes}
+            method="POST"
+            enctype="multipart/form-data">
+            {components}
+        </form>
+    """)
+
     def __init__(self, *components):
         super().__init__()
         self.__components = components
@@ -60,16 +70,23 @@ class Form(WebComponent, ClassMixin):
         self.__href = href
         return self
 
+    def iter_render(self):
+        """Renders the form chunk by chunk, a field at a time."""
+        return self.__render(streamed=True)
+
     def __str__(self):
-        return f"""
-            <form {attr('id', self.identifier)}
-                {attr('action', self.__href)}
-                {attr('class', self.classes)}
-                method="POST"
-                enctype="multipart/form-data">
-                {inject(*self.__components)}
-            </form>
-        """
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the form as a whole or chunk by chunk."""
+        return _render_template(
+            Form._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            href=self.__href,
+            classes=self.classes,
+            components=self.__components
+        )
 
 
 class Input(ABC, WebComponent, ClassMixin, AvailabilityMixin):
@@ -80,6 +97,29 @@ class Input(ABC, WebComponent, ClassMixin, AvailabilityMixin):
         name (str): The input name.
     """
 
+    _LABELED = Template("""
+        <div {class=classes}>
+            <label {class=label_classes} {for=identifier}>
+                {label}
+            </label>
+            <div {class=receiver_classes}>
+                {receiver}
+                {tip}
+            </div>
+        </div>
+    """)
+
+    _UNLABELED = Template("""
+        {receiver}
+        {tip}
+    """)
+
+    _TIP = Template("""
+        <small class="form-text text-secondary" style="font-size: 0.75em;">
+            {tip}
+        </small>
+    """)
+
     def __init__(self, label, name):
         super().__init__()
         self._label = label
@@ -105,41 +145,32 @@ class Input(ABC, WebComponent, ClassMixin, AvailabilityMixin):
         """A component for rendering a receiver."""
 
     def __str__(self):
-        self.add_classes("form-group")
-
-        tips_html = ""
+        tip = None
         if hasattr(self, "_tip") and self._tip:
-            tips_html = f"""
-                <small class="form-text text-secondary" style="font-size: 0.75em;">
-                    {self._tip}
-                </small>
-            """
+            tip = Input._TIP.render(tip=self._tip)
 
         if self._label:
-            label_classes = None
-            receiver_classes = None
-            if not self.__label_on_top:
-                self.add_classes("row")
+            if self.__label_on_top:
+                classes = self._compose_classes("form-group")
+                label_classes = None
+                receiver_classes = None
+            else:
+                classes = self._compose_classes("form-group row")
                 label_classes = "col-sm-4 col-form-label"
                 receiver_classes = "col-sm-8"
 
-            return f"""
-                <div {attr('class', self.classes)}>
-                    <label {attr('class', label_classes)} {attr('for', self.identifier)}>
-                        {self._label}
-                    </label>
-                    <div {attr('class', receiver_classes)}>
-                        {self._receiver()}
-                        {tips_html}
-                    </div>
-                </div>
-            """
+            return Input._LABELED.render(
+                identifier=self.identifier,
+                classes=classes,
+                label_classes=label_classes,
+                receiver_classes=receiver_classes,
+                label=self._label,
+                receiver=self._receiver(),
+                tip=tip
+            )
 
         # This part handles the case where there is no label.
-        return f"""
-            {self._receiver()}
-            {tips_html}
-        """
+        return Input._UNLABELED.render(receiver=self._receiver(), tip=tip)
 
 
 class CheckboxInput(Input, AppearanceMixin, OutlineMixin):
@@ -164,6 +195,52 @@ class CheckboxInput(Input, AppearanceMixin, OutlineMixin):
         )
     """
 
+    _LABEL_ON_LEFT = Template("""
+        <div class="form-group row">
+            <label class="col-sm-4 col-form-label d-flex align-items-center"
+                {for=identifier}>
+                {label}
+            </label>
+            <div class="col-sm-8 d-flex align-items-center">
+                <input {id=identifier}
+                    {name=name}
+                    class="form-check-input"
+                    {value=value}
+                    type="checkbox"
+                    autocomplete="off"
+                    {checked=checked}
+                    {disabled=disabled}>
+                </input>
+                <input type="hidden" name="{name}" value="false">
+                </input>
+            </div>
+        </div>
+    """)
+
+    _INPUT_N_LABEL = Template("""
+        <input {id=identifier}
+            {name=name}
+            {value=value}
+            {class=input_classes}
+            type="{type}"
+            autocomplete="off"
+            {checked=checked}
+            {disabled=disabled}>
+        </input>
+        <label {class=label_classes}
+            {for=identifier}>
+            {label}
+            <input type="hidden" name="{name}" value="false">
+            </input>
+        </label>
+    """)
+
+    _TEMPLATE = Template("""
+        <div {class=classes}>
+            {input_n_label}
+        </div>
+    """)
+
     def __init__(self, label, name, checked=False):
         super().__init__(label, name)
         self.__checked = checked
@@ -274,37 +351,23 @@ class CheckboxInput(Input, AppearanceMixin, OutlineMixin):
         return ""
 
     def __str__(self):
+        value = "true" if self.__value is None else self.__value
         if self.__label_on_left:
-            label_classes = "col-sm-4 col-form-label d-flex align-items-center"
-            receiver_classes = "col-sm-8 d-flex align-items-center"
-            return f"""
-                <div {attr('class', 'form-group row')}>
-                    <label {attr('class', label_classes)}
-                        {attr('for', self.identifier)}>
-                        {self._label}
-                    </label>
-                    <div {attr('class', receiver_classes)}>
-                        <input {attr('id', self.identifier)}
-                            {attr('name', self._name)}
-                            {attr('class', 'form-check-input')}
-                            {attr('value', "true" if self.__value is None else self.__value)}
-                            type="checkbox"
-                            autocomplete="off"
-                            {attr('checked', self.__checked)}
-                            {attr('disabled', self._disabled)}>
-                        </input>    
-                        <input type="hidden" name="{self._name}" value="false">
-                        </input> 
-                    </div>
-                </div>
-            """
+            return CheckboxInput._LABEL_ON_LEFT.render(
+                identifier=self.identifier,
+                name=self._name,
+                value=value,
+                label=self._label,
+                checked=self.__checked,
+                disabled=self._disabled
+            )
         else:
-            self.add_classes("form-check")
+            classes = ["form-check"]
             type = "checkbox" if self.__value is None else "radio"
             if self.__inline:
-                self.add_classes("form-check-inline")
+                classes.append("form-check-inline")
             if self.__switch:
-                self.add_classes("form-switch")
+                classes.append("form-switch")
 
             # Sets input class (for the button look)
             input_classes = "form-check-input"
@@ -318,32 +381,25 @@ class CheckboxInput(Input, AppearanceMixin, OutlineMixin):
                     else:
                         label_classes += f" btn-{self._category}"
 
-            wc_input_n_label = f"""
-                <input {attr('id', self.identifier)}
-                    {attr('name', self._name)}
-                    {attr('value', "true" if self.__value is None else self.__value)}
-                    {attr('class', input_classes)}
-                    type="{type}"
-                    autocomplete="off"
-                    {attr('checked', self.__checked)}
-                    {attr('disabled', self._disabled)}>
-                </input>    
-                <label {attr('class', label_classes)} 
-                    {attr('for', self.identifier)}>
-                    {self._label or ''}
-                    <input type="hidden" name="{self._name}" value="false">
-                    </input> 
-                </label>
-            """
+            wc_input_n_label = CheckboxInput._INPUT_N_LABEL.render(
+                identifier=self.identifier,
+                name=self._name,
+                value=value,
+                input_classes=input_classes,
+                label_classes=label_classes,
+                type=type,
+                label=self._label,
+                checked=self.__checked,
+                disabled=self._disabled
+            )
 
             if self.__button:
                 return wc_input_n_label
             else:
-                return f"""
-                    <div {attr('class', self.classes)}>
-                        {wc_input_n_label}
-                    </div>
-                """
+                return CheckboxInput._TEMPLATE.render(
+                    classes=self._compose_classes(*classes),
+                    input_n_label=wc_input_n_label
+                )
 
 
 class Freehand(Input):
@@ -356,6 +412,28 @@ class Freehand(Input):
         placeholder (str): The input placeholder.
     """
 
+    _TEXTAREA = Template("""
+        <textarea {id=identifier}
+            {name=name}
+            class="form-control"
+            {rows=rows}
+            {readonly=readonly}
+            {disabled=disabled}>
+            {value}
+        </textarea>
+    """)
+
+    _INPUT = Template("""
+        <input {id=identifier}
+            {name=name}
+            {value=value}
+            type="{type}"
+            class="form-control"
+            {placeholder=placeholder}
+            {readonly=readonly}
+            {disabled=disabled}/>
+    """)
+
     def __init__(self, label, name, value, placeholder):
         super().__init__(label, name)
         self.__value = value
@@ -379,27 +457,24 @@ class Freehand(Input):
                 f'The <class "TextInput"> of type "{self._type}" '
                 + f"can not have {self._rows} rows."
             )
-            return f"""
-                <textarea {attr('id', self.identifier)}
-                    {attr('name', self._name)}
-                    class="form-control"
-                    {attr('rows', self._rows)}
-                    {attr('readonly', self._readonly)}
-                    {attr('disabled', self._disabled)}>
-                    {self.__value or ''}
-                </textarea>
-            """
+            return Freehand._TEXTAREA.render(
+                identifier=self.identifier,
+                name=self._name,
+                rows=self._rows,
+                readonly=self._readonly,
+                disabled=self._disabled,
+                value=self.__value or ''
+            )
         else:
-            return f"""
-                <input {attr('id', self.identifier)}
-                    {attr('name', self._name)}
-                    {attr('value', self.__value)}
-                    type="{self._type}"
-                    class="form-control"
-                    {attr('placeholder', self.__placeholder)}
-                    {attr('readonly', self._readonly)}
-                    {attr('disabled', self._disabled)}/>
-            """
+            return Freehand._INPUT.render(
+                identifier=self.identifier,
+                name=self._name,
+                value=self.__value,
+                type=self._type,
+                placeholder=self.__placeholder,
+                readonly=self._readonly,
+                disabled=self._disabled
+            )
 
 
 class TextInput(Freehand):
@@ -541,6 +616,42 @@ class SelectInput(Input):
         )
     """
 
+    _RADIO = Template("""
+        <div class="form-check me-3">
+            <input {id=identifier}
+                {name=name}
+                {value=value}
+                type="radio"
+                class="form-check-input"
+                autocomplete="off"
+                {checked=checked}
+                {disabled=disabled}/>
+            <label class="form-check-label me-1"
+                {for=identifier}>
+                {label}
+            </label>
+        </div>
+    """)
+
+    _SELECT = Template("""
+        <select {id=identifier}
+            {name=name}
+            class="form-control"
+            autocomplete="off"
+            {disabled=disabled}>
+            {options}
+        </select>
+    """)
+
+    _OPTION = Template("""
+        <option {id=identifier}
+            {value=value}
+            {selected=selected}
+            {disabled=disabled}>
+            {name}
+        </option>
+    """)
+
     def __init__(self, label, name, value=None, options=None):
         super().__init__(label, name)
         self.__value = value
@@ -599,50 +710,33 @@ class SelectInput(Input):
 
     def _receiver(self):
         if self.__radio:
-            options = []
-            for option in self.__options:
-                options.append(
-                    f"""
-                    <div class="form-check me-3">
-                        <input {attr('id', option.identifier)}
-                            {attr('name', self._name)}
-                            {attr('value', option.value)}
-                            type="radio"
-                            class="form-check-input"
-                            autocomplete="off"
-                            {attr('checked', option.value == self.__value)}
-                            {attr('disabled', option.disabled)}/>
-                        <label class="form-check-label me-1"
-                            {attr('for', option.identifier)}>
-                            {option.name}
-                        </label>
-                    </div>
-                """
+            return inject(*[
+                SelectInput._RADIO.render(
+                    identifier=option.identifier,
+                    name=self._name,
+                    value=option.value,
+                    checked=option.value == self.__value,
+                    disabled=option.disabled,
+                    label=option.name
                 )
-            return inject(*options)
+                for option in self.__options
+            ])
         else:
-            options = []
-            for option in self.__options:
-                options.append(
-                    f"""
-                    <option {attr('id', option.identifier)}
-                        {attr('value', option.value)}
-                        {attr('selected', option.value == self.__value)}
-                        {attr('disabled', option.disabled)}>
-                        {option.name}
-                    </option>
-                """
-                )
-
-            return f"""
-                <select {attr('id', self.identifier)}
-                    {attr('name', self._name)}
-                    class="form-control"
-                    autocomplete="off"
-                    {attr('disabled', self._disabled)}>
-                    {inject(*options)}
-                </select>
-            """
+            return SelectInput._SELECT.render(
+                identifier=self.identifier,
+                name=self._name,
+                disabled=self._disabled,
+                options=[
+                    SelectInput._OPTION.render(
+                        identifier=option.identifier,
+                        value=option.value,
+                        selected=option.value == self.__value,
+                        disabled=option.disabled,
+                        name=option.name
+                    )
+                    for option in self.__options
+                ]
+            )
 
 
 class JsonInput(Input):
@@ -720,17 +814,23 @@ class HiddenInput(Input):
         )
     """
 
+    _TEMPLATE = Template("""
+        <input {id=identifier}
+            {name=name}
+            {value=value}
+            type="hidden"/>
+    """)
+
     def __init__(self, name, value=None):
         super().__init__(None, name)
         self.__value = value
 
     def _receiver(self):
-        return f"""
-            <input {attr('id', self.identifier)}
-                {attr('name', self._name)}
-                {attr('value', self.__value)}
-                type="hidden"/>
-        """
+        return HiddenInput._TEMPLATE.render(
+            identifier=self.identifier,
+            name=self._name,
+            value=self.__value
+        )
 
     def __str__(self):
         return self._receiver()
@@ -756,6 +856,24 @@ class FileInput(Input):
         )
     """
 
+    _TEMPLATE = Template("""
+        <div class="input-group">
+            <span class="form-control input-group-append"></span>
+            <div class="input-group-append">
+                <span {class=browse_button_class}
+                    onclick="$(this).parent().find('input[type=file]').click();">
+                    Browse
+                </span>
+                <input {id=identifier}
+                    {name=name}
+                    onchange="$(this).parent().parent().find('.form-control').html($(this).val().split(/[\\|/]/).pop());"
+                    style="display: none;"
+                    type="file"
+                    {disabled=disabled}/>
+            </div>
+        </div>
+    """)
+
     def __init__(self, label, name):
         super().__init__(label, name)
 
@@ -764,23 +882,12 @@ class FileInput(Input):
         if self._disabled:
             browse_button_class += " disabled"
 
-        return f"""
-            <div class="input-group">
-                <span class="form-control input-group-append"></span>
-                <div class="input-group-append">
-                    <span class="{browse_button_class}"
-                        onclick="$(this).parent().find('input[type=file]').click();">
-                        Browse
-                    </span>
-                    <input {attr('id', self.identifier)}
-                        {attr('name', self._name)}
-                        onchange="$(this).parent().parent().find('.form-control').html($(this).val().split(/[\\|/]/).pop());"
-                        style="display: none;"
-                        type="file"
-                        {attr('disabled', self._disabled)}/>
-                </div>
-            </div>
-        """
+        return FileInput._TEMPLATE.render(
+            identifier=self.identifier,
+            name=self._name,
+            browse_button_class=browse_button_class,
+            disabled=self._disabled
+        )
 
 
 class InputGroup(WebComponent, ClassMixin):
@@ -811,6 +918,15 @@ class InputGroup(WebComponent, ClassMixin):
         output=Form(ig1,ig2,ig3,ig4,ig5,ig6)
     """
 
+    _TEMPLATE = Template("""
+        <div {id=identifier}
+            {class=classes}
+            role="group">
+            {inputs}
+        </div>
+        {tip}
+    """)
+
     def __init__(self, *inputs):
         super().__init__()
         self.__inputs = inputs
@@ -834,24 +950,19 @@ class InputGroup(WebComponent, ClassMixin):
         return self
 
     def __str__(self):
-        self.add_classes("input-group")
-        for input in self.__inputs:
-            if isinstance(input, Text):
-                input.add_classes("input-group-text")
+        inputs = [
+            input._variant().add_classes("input-group-text")
+            if isinstance(input, Text) else input
+            for input in self.__inputs
+        ]
 
-        tips_html = ""
+        tip = None
         if hasattr(self, "_tip") and self._tip:
-            tips_html = f"""
-                <small class="form-text text-secondary" style="font-size: 0.75em;">
-                    {self._tip}
-                </small>
-            """
-
-        return f"""
-            <div {attr("id", self.identifier)}
-                {attr("class", self.classes)}
-                role="group">
-                {inject(*self.__inputs)}
-            </div>
-            {tips_html}
-        """
+            tip = Input._TIP.render(tip=self._tip)
+
+        return InputGroup._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=self._compose_classes("input-group"),
+            inputs=inputs,
+            tip=tip
+        )
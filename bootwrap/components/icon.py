@@ -7,7 +7,7 @@ from .base import (
     ClassMixin,
     AppearanceMixin
 )
-from .utils import attr
+from .utils import Template
 
 
 class Icon(WebComponent, ClassMixin, AppearanceMixin):
@@ -32,21 +32,26 @@ class Icon(WebComponent, ClassMixin, AppearanceMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <i {id=identifier}
+            {class=classes}>
+        </i>
+    ''')
+
     def __init__(self, name):
         super().__init__()
         self.__name = name
 
     def __str__(self):
-        self.add_classes(self.__name)
+        classes = [self.__name]
 
         if self._category is not None:
-            self.add_classes('text-%s' % self._category)
+            classes.append('text-%s' % self._category)
 
-        return f'''
-            <i {attr('id', self.identifier)}
-                {attr('class', self.classes)}>
-            </i>
-        '''
+        return Icon._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=self._compose_classes(*classes)
+        )
 
 
 class Spinner(WebComponent, ClassMixin, AppearanceMixin):
@@ -68,32 +73,36 @@ class Spinner(WebComponent, ClassMixin, AppearanceMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <span {id=identifier}
+            {class=classes}>
+        </span>
+        <style>
+            @keyframes spinner-border {{
+                to {{ transform: rotate(360deg); }}
+            }}
+
+            .spinner{{
+                display: inline-block;
+                vertical-align: text-bottom;
+                height: 16px;
+                width: 16px;
+                border: .15em solid currentColor;
+                border-right-color: transparent;
+                border-radius: 50%;
+                -webkit-animation: spinner-border .75s linear infinite;
+                animation: spinner-border .75s linear infinite;
+            }}
+        </style>
+    ''')
+
     def __str__(self):
-        self.add_classes('spinner')
+        classes = ['spinner']
 
         if self._category is not None:
-            self.add_classes('text-%s' % self._category)
-
-        return f'''
-            <span {attr('id', self.identifier)}
-                {attr('class', self.classes)}>
-            </span>
-        ''' + '''
-            <style>
-                @keyframes spinner-border {
-                    to { transform: rotate(360deg); }
-                }
-
-                .spinner{
-                    display: inline-block;
-                    vertical-align: text-bottom;
-                    height: 16px;
-                    width: 16px;
-                    border: .15em solid currentColor;
-                    border-right-color: transparent;
-                    border-radius: 50%;
-                    -webkit-animation: spinner-border .75s linear infinite;
-                    animation: spinner-border .75s linear infinite;
-                }
-            </style>
-        '''
+            classes.append('text-%s' % self._category)
+
+        return Spinner._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=self._compose_classes(*classes)
+        )
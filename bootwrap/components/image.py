@@ -6,7 +6,7 @@ from .base import (
     WebComponent,
     ClassMixin
 )
-from .utils import attr
+from .utils import Template
 
 
 class Image(WebComponent, ClassMixin):
@@ -24,6 +24,15 @@ class Image(WebComponent, ClassMixin):
         output = Image("logo.png")
     """
 
+    _TEMPLATE = Template('''
+        <img {id=identifier}
+            {class=classes}
+            {src=src}
+            {width=width}
+            {height=height}
+            {alt=alt}/>
+    ''')
+
     def __init__(self, src, width=None, height=None, alt=None):
         super().__init__()
         self.__src = src
@@ -32,11 +41,11 @@ class Image(WebComponent, ClassMixin):
         self.__alt = alt
 
     def __str__(self):
-        return f'''
-            <img {attr("id", self.identifier)}
-                {attr('class', self.classes)}
-                {attr('src', self.__src)}
-                {attr('width', self.__width)}
-                {attr('height', self.__height)}
-                {attr('alt', self.__alt)}/>
-        '''
+        return Image._TEMPLATE.render(
+            identifier=self.identifier,
+            classes=self.classes,
+            src=self.__src,
+            width=self.__width,
+            height=self.__height,
+            alt=self.__alt
+        )
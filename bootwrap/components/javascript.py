@@ -3,7 +3,7 @@ A javascript.
 """
 
 from .base import WebComponent
-from .utils import attr
+from .utils import Template
 
 
 class Javascript(WebComponent):
@@ -14,7 +14,7 @@ class Javascript(WebComponent):
             relative.
         script (str): The javascript code.
         submap (dict): The map with substitutions, binding the javascript
-            with Python objects.
+            with Python objects (default=None).
 
     Example:
         from bootwrap import Page, Javascript
@@ -27,6 +27,19 @@ class Javascript(WebComponent):
             ...
         )
     """
+
+    _SOURCE = Template('''
+        <script {src=src}
+            type="application/javascript">
+        </script>
+    ''')
+
+    _SCRIPT = Template('''
+        <script type="application/javascript">
+            {script}
+        </script>
+    ''')
+
     def __init__(self, src=None, script=None, submap=None):
         super().__init__()
         self.__src = src
@@ -35,23 +48,15 @@ class Javascript(WebComponent):
 
     def __str__(self):
         if self.__src:
-            output = f'''
-                <script {attr('src', self.__src)}
-                    type="application/javascript">
-                </script>
-            '''
+            output = Javascript._SOURCE.render(src=self.__src)
         else:
             script = self.__script
-            for name, wc in self.__submap.items():
+            for name, wc in (self.__submap or {}).items():
                 if isinstance(wc, WebComponent):
                     substitution = str(wc.identifier)
                 else:
                     substitution = str(wc)
                 script = script.replace(name, substitution)
 
-            output = f'''
-                <script type="application/javascript">
-                    {script}
-                </script>
-            '''
+            output = Javascript._SCRIPT.render(script=script)
         return output
@@ -3,7 +3,7 @@ An external resource link.
 """
 
 from .base import WebComponent
-from .utils import attr
+from .utils import Template
 
 
 class Link(WebComponent):
@@ -31,6 +31,13 @@ class Link(WebComponent):
             ...
         )
     """
+
+    _TEMPLATE = Template('''
+        <link {rel=rel}
+            {type=ctype}
+            {href=href}/>
+    ''')
+
     def __init__(self, href, rel='stylesheet', ctype='text/css'):
         super().__init__()
         self.__rel = rel
@@ -38,8 +45,8 @@ class Link(WebComponent):
         self.__href = href
 
     def __str__(self):
-        return f'''
-            <link {attr('rel', self.__rel)}
-                {attr('type', self.__ctype)}
-                {attr('href', self.__href)}/>
-        '''
+        return Link._TEMPLATE.render(
+            rel=self.__rel,
+            ctype=self.__ctype,
+            href=self.__href
+        )
@@ -2,11 +2,12 @@
 A collection of items.
 """
 
-from .base import WebComponent, ClassMixin, ActionMixin
+from .base import WebComponent, ClassMixin, ActionMixin, _resolved
 from .anchor import Anchor
 from .button import Button
 from .text import Text
-from .utils import attr, inject
+from .utils import Template, _render_template
+from .parallel import render_all
 
 
 class List(WebComponent, ClassMixin):
@@ -49,6 +50,13 @@ class List(WebComponent, ClassMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <div {id=identifier}
+            {class=classes}>
+            {items}
+        </div>
+    ''')
+
     def __init__(self, *items):
         super().__init__()
 
@@ -88,6 +96,31 @@ class List(WebComponent, ClassMixin):
             )
         """
 
+        _ACTIONS = Template('''
+            <div class="d-flex align-items-start">
+                {actions}
+            </div>
+        ''')
+
+        _TEMPLATE = Template('''
+            <div {id=identifier} {class=classes}>
+                <div class="d-flex w-100 justify-content-between">
+                    <div class="d-flex flex-grow-1" {onclick=onclick}
+                        style="cursor: {cursor};">
+                        {figure}
+                        <div class="ms-2 me-2 w-100">
+                            <div class="d-flex w-100 justify-content-between">
+                                {title}
+                                {marker}
+                            </div>
+                            {description}
+                        </div>
+                    </div>
+                    {actions}
+                </div>
+            </div>
+        ''')
+
         def __init__(self, title, description=None, marker=None, figure=None):
             super().__init__()
             self._title = title
@@ -154,12 +187,12 @@ class List(WebComponent, ClassMixin):
             return self
 
         def __str__(self):
-            wc_title = self._title
+            wc_title = _resolved(self._title)
             if wc_title:
                 if isinstance(wc_title, str):
                     wc_title = Text(wc_title).as_heading(5)
 
-            wc_marker = self._marker
+            wc_marker = _resolved(self._marker)
             if wc_marker:
                 if isinstance(wc_marker, str):
                     wc_marker = Text(wc_marker).as_small()
@@ -169,71 +202,48 @@ class List(WebComponent, ClassMixin):
                 if self._pack_actions:
                     wc_actions = Button('...').add_menu(*self._menu)
                 else:
-                    for action in self._menu:
-                        action.ms(1)
-                    wc_actions = inject(*self._menu)
+                    wc_actions = [
+                        action._variant().ms(1) for action in self._menu
+                    ]
                 
                 # Wrap actions in a div with event stopping
-                wc_actions = f'''
-                    <div class="d-flex align-items-start">
-                        {inject(wc_actions)}
-                    </div>
-                '''
+                wc_actions = List.Item._ACTIONS.render(actions=wc_actions)
 
             onclick = None
             if self._target:
                 onclick = f"location.href='{self._target}'; return false;"
 
-            self.add_classes(
+            classes = self._compose_classes(
                 'list-group-item list-group-item-action flex-column '
-                'align-items-start'
+                'align-items-start',
+                'active' if self._selected else None
             )
-            if self._selected:
-                self.add_classes('active')
-
-            # Alternative structure: Separate clickable area from actions
-            # if wc_actions:
-            return f'''
-                <div {attr("id", self.identifier)} {attr('class', self.classes)}>
-                    <div class="d-flex w-100 justify-content-between">
-                        <div class="d-flex flex-grow-1" {attr('onclick', onclick)} style="cursor: {'pointer' if onclick else 'default'};">
-                            {inject(self._figure)}
-                            <div class="ms-2 me-2 w-100">
-                                <div class="d-flex w-100 justify-content-between">
-                                    {inject(wc_title)}
-                                    {inject(wc_marker)}
-                                </div>
-                                {inject(self._description)}
-                            </div>
-                        </div>
-                        {inject(wc_actions)}
-                    </div>
-                </div>
-            '''
-            # else:
-            #     # No actions, use simpler structure
-            #     return f'''
-            #         <div {attr("id", self.identifier)}
-            #             {attr('class', self.classes)}
-            #             {attr('onclick', onclick)}>
-            #             <div class="d-flex w-100 justify-content-between">
-            #                 {inject(self._figure)}
-            #                 <div class="ms-2 me-2 w-100">
-            #                     <div class="d-flex w-100 justify-content-between">
-            #                         {inject(wc_title)}
-            #                         {inject(wc_marker)}
-            #                     </div>
-            #                     {inject(self._description)}
-            #                 </div>
-            #             </div>
-            #         </div>
-            #     '''
+
+            return List.Item._TEMPLATE.render(
+                identifier=self.identifier,
+                classes=classes,
+                onclick=onclick,
+                cursor='pointer' if onclick else 'default',
+                figure=self._figure,
+                title=wc_title,
+                marker=wc_marker,
+                description=self._description,
+                actions=wc_actions
+            )
+
+    def iter_render(self):
+        """Renders the list chunk by chunk, an item at a time."""
+        return self.__render(streamed=True)
 
     def __str__(self):
-        self.add_classes('list-group')
-        return f'''
-            <div {attr("id", self.identifier)}
-                {attr('class', self.classes)}>
-                {inject(*self._items)}
-            </div>
-        '''
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the list as a whole or chunk by chunk."""
+        return _render_template(
+            List._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            classes=self._compose_classes('list-group'),
+            items=render_all(self._items)
+        )
@@ -10,7 +10,7 @@ from .base import (
 )
 from .anchor import Anchor
 from .panel import Panel
-from .utils import attr, inject
+from .utils import Template, _render_template
 
 
 NavigationItem = namedtuple('NavigationItem', 'anchor panel')
@@ -32,6 +32,29 @@ class Navigation(WebComponent, ClassMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <ul {id=identifier}
+            {class=classes}
+            role="tablist">
+            {menus}
+        </ul>
+        <div class="tab-content w-100">
+            {panels}
+        </div>
+    ''')
+
+    _VERTICAL = Template('''
+        <div class="d-flex">
+            {navigation}
+        </div>
+    ''')
+
+    _MENU_ITEM = Template('''
+        <li class="nav-item">
+            {anchor}
+        </li>
+    ''')
+
     def __init__(self, *items):
         super().__init__()
         self.__items = items
@@ -108,7 +131,15 @@ class Navigation(WebComponent, ClassMixin):
         """
         return self.add_classes('nav-pills')
 
+    def iter_render(self):
+        """Renders the navigation chunk by chunk, a tab panel at a time."""
+        return self.__render(streamed=True)
+
     def __str__(self):
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the navigation as a whole or chunk by chunk."""
         menus, panels = [], []
         for item in self.__items:
 
@@ -123,13 +154,7 @@ class Navigation(WebComponent, ClassMixin):
                 anchor_classes += " active"
             anchor = Anchor(item.name).add_classes(anchor_classes).\
                 toggle(panel)
-            menus.append(
-                f'''
-                    <li class="nav-item">
-                        {inject(anchor)}
-                    </li>
-                '''
-            )
+            menus.append(Navigation._MENU_ITEM.render(anchor=anchor))
 
         classes = 'nav'
         if self.__vertical:
@@ -137,20 +162,16 @@ class Navigation(WebComponent, ClassMixin):
         if self.classes:
             classes += f' {self.classes}'
 
-        output = f'''
-            <ul {attr("id", self.identifier)}
-                {attr('class', classes)}
-                role="tablist">
-                {''.join(menus)}
-            </ul>
-            <div class="tab-content w-100">
-                {inject(*panels)}
-            </div>
-        '''
-
+        chunks = _render_template(
+            Navigation._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            classes=classes,
+            menus=menus,
+            panels=panels
+        )
         if self.__vertical:
-            output = f'''
-                <div class="d-flex">{output}</div>
-            '''
-
-        return output
\ No newline at end of file
+            return _render_template(
+                Navigation._VERTICAL, streamed, navigation=chunks
+            )
+        return chunks
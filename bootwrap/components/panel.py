@@ -3,7 +3,8 @@ A panel.
 """
 
 from .base import WebComponent, ClassMixin, AppearanceMixin, OutlineMixin
-from .utils import attr, inject
+from .utils import Template, _render_template
+from .parallel import render_all
 
 
 class Panel(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
@@ -22,6 +23,33 @@ class Panel(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
         output = Panel(comp1, comp2, comp3)
     """
 
+    _TEMPLATE = Template('''
+        <div {id=identifier}
+            {class=classes}>
+            {components}
+        </div>
+    ''')
+
+    _VERTICAL_ITEM = Template('''
+        <div class="row">
+            <div class="col-md">
+                {component}
+            </div>
+        </div>
+    ''')
+
+    _HORIZONTAL = Template('''
+        <div class="row">
+            {components}
+        </div>
+    ''')
+
+    _HORIZONTAL_ITEM = Template('''
+        <div class="col-md">
+            {component}
+        </div>
+    ''')
+
     def __init__(self, *components):
         super().__init__()
         self.__components = components
@@ -176,54 +204,55 @@ class Panel(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
         self.add_classes(f"d-flex align-items-{style}")
         return self
 
+    def iter_render(self):
+        """Renders the panel chunk by chunk, a component at a time."""
+        return self.__render(streamed=True)
+
     def __str__(self):
+        return self.__render(streamed=False)
+
+    def __render(self, streamed):
+        """Renders the panel as a whole or chunk by chunk."""
+        classes = []
         if self._border:
-            self.add_classes(f'border')
+            classes.append('border')
             if self._category:
-                self.add_classes(f'border-{self._category}')
+                classes.append(f'border-{self._category}')
         else:
             if self._category:
-                self.add_classes(f'bg-{self._category}')
-
-        if self.__arrangement:
-            if self.__arrangement == 'vertical':
-
-                def row(element):
-                    return f'''
-                        <div class="row">
-                            <div class="col-md">
-                                {element}
-                            </div>
-                        </div>
-                    '''
-                return f'''
-                    <div {attr("id", self.identifier)}
-                        {attr("class", self.classes)}>
-                        {inject(*map(row, filter(None, self.__components)))}
-                    </div>
-                '''
-            else:  # self.__arrangement == 'horizontal'
-
-                def col(element):
-                    return f'''
-                        <div class="col-md">
-                            {element}
-                        </div>
-                    '''
-                return f'''
-                    <div {attr("id", self.identifier)}
-                        {attr("class", self.classes)}>
-                        <div class="row">
-                            {inject(
-                                *map(col, filter(None, self.__components))
-                            )}
-                        </div>
-                    </div>
-                '''
-
-        return f'''
-            <div {attr("id", self.identifier)}
-                {attr("class", self.classes)}>
-                {inject(*self.__components)}
-            </div>
-        '''
+                classes.append(f'bg-{self._category}')
+
+        components = render_all(self.__components)
+        if self.__arrangement == 'vertical':
+            components = _each(
+                Panel._VERTICAL_ITEM, filter(None, components), streamed
+            )
+        elif self.__arrangement == 'horizontal':
+            components = _render_template(
+                Panel._HORIZONTAL,
+                streamed,
+                components=_each(
+                    Panel._HORIZONTAL_ITEM,
+                    filter(None, components),
+                    streamed
+                )
+            )
+
+        return _render_template(
+            Panel._TEMPLATE,
+            streamed,
+            identifier=self.identifier,
+            classes=self._compose_classes(*classes),
+            components=components
+        )
+
+
+def _each(template, components, streamed):
+    """Renders a template for every component of a panel arrangement."""
+    if streamed:
+        return (
+            chunk
+            for component in components
+            for chunk in template.iter_render(component=component)
+        )
+    return [template.render(component=component) for component in components]
@@ -0,0 +1,182 @@
+"""
+Parallel rendering of large web component collections.
+"""
+
+import atexit
+import pickle
+
+from . import base
+from .utils import inject, render_options, _encode_identifier, _rendering
+
+
+THRESHOLD = 1000
+"""The number of items a collection must have to be rendered in parallel,
+the smaller collections are rendered serially (see the `workers` render
+option)."""
+
+SHARD_SIZE = 100
+"""The minimal number of items in a shard rendered by a worker process."""
+
+
+# The process pools by the number of workers.
+_pools = {}
+
+
+def _pool(workers):
+    """Gets the process pool with the given number of workers.
+
+    The pool is started on the first parallel render and reused, so the
+    worker processes are spawned just once.
+    """
+    pool = _pools.get(workers)
+    if pool is None:
+        # pylint: disable=import-outside-toplevel
+        from concurrent import futures
+        pool = futures.ProcessPoolExecutor(max_workers=workers)
+        _pools[workers] = pool
+    return pool
+
+
+def shutdown():
+    """Shuts down the worker processes.
+
+    It is called at the interpreter exit. The worker processes are started
+    again by the next parallel render.
+    """
+    while _pools:
+        _, pool = _pools.popitem()
+        pool.shutdown()
+
+
+atexit.register(shutdown)
+
+
+def enabled(count):
+    """Checks whether a collection is rendered in parallel.
+
+    Args:
+        count (int): The number of items in the collection.
+
+    Returns:
+        bool: `True` if the collection is rendered in parallel.
+    """
+    options = render_options()
+    return bool(options.workers) and options.workers > 1 \
+        and not options.deterministic and count >= THRESHOLD
+
+
+def _run(payload):
+    """Renders a shard in a worker process."""
+    fn, shard, options, prefix = pickle.loads(payload)
+    # The web components made while rendering the shard get identifiers
+    # unique to the shard, so they never clash with the other shards.
+    previous = base._identifier_prefix
+    base._identifier_prefix = prefix
+    try:
+        with _rendering(options._replace(workers=None), None):
+            return fn(*shard)
+    finally:
+        base._identifier_prefix = previous
+
+
+def map_shards(fn, shards):
+    """Renders the shards in the worker processes.
+
+    The shards are pickled up front. The shards which cannot be pickled
+    (for example, the ones referencing lambda functions) are rendered
+    in the current process instead.
+
+    Args:
+        fn (func): The module-level function rendering a shard, called with
+            the shard items as its arguments.
+        shards (list): The shards (tuples of arguments).
+
+    Returns:
+        generator: The results of rendering the shards in the shards order.
+    """
+    options = render_options()
+    pool = _pool(options.workers)
+    futures = []
+    for shard in shards:
+        prefix = _encode_identifier(
+            next(base._identifier_counter), 'w'
+        ) + '_'
+        try:
+            payload = pickle.dumps((fn, shard, options, prefix))
+        except (pickle.PicklingError, AttributeError, TypeError):
+            futures.append(shard)
+            continue
+        futures.append(pool.submit(_run, payload))
+    for future in futures:
+        if isinstance(future, tuple):
+            yield fn(*future)
+        else:
+            yield future.result()
+
+
+def _render_components(*components):
+    return [inject(component) for component in components]
+
+
+def render_all(components):
+    """Renders a collection of web components in parallel.
+
+    The collection is rendered in parallel only if the `workers` render
+    option is set (see the `rendering` function), the render is not
+    deterministic and the collection has at least `THRESHOLD` items.
+    Otherwise it is returned as it is, to be rendered serially.
+
+    Args:
+        components (list): The web components (or other content values).
+
+    Returns:
+        iterable: The rendered web components in the collection order, or
+            the collection itself.
+
+    Example:
+        with rendering(workers=32):
+            html = str(List(*items))
+    """
+    if not isinstance(components, (list, tuple)) or \
+            not enabled(len(components)):
+        return components
+    # The identifiers are allocated before the web components are copied
+    # to the worker processes, so they are the same in all the processes.
+    for component in base.iter_components(*components):
+        component.identifier
+    return (
+        html
+        for rendered in map_shards(_render_components, shards(components))
+        for html in rendered
+    )
+
+
+def bounds(count):
+    """Splits a number of items into shards for the worker processes.
+
+    There are a few shards per worker (so the workers are evenly loaded),
+    but every shard has at least `SHARD_SIZE` items.
+
+    Args:
+        count (int): The number of items to split.
+
+    Returns:
+        list: The start and stop item indexes of the shards.
+    """
+    shards = max(1, min(render_options().workers * 4, count // SHARD_SIZE))
+    size = -(-count // shards)
+    return [
+        (start, min(start + size, count)) for start in range(0, count, size)
+    ]
+
+
+def shards(items):
+    """Splits the items into shards for the worker processes.
+
+    Args:
+        items (sequence): The items to split.
+
+    Returns:
+        list: The shards (tuples of items).
+    """
+    return [tuple(items[start:stop]) for start, stop in bounds(len(items))]
@@ -2,10 +2,353 @@
 A table.
 """
 
+import bisect
+import functools
+import itertools
+from html import escape
 from enum import Enum
+from collections import OrderedDict
+from collections.abc import Iterable, Hashable
 
 from .base import WebComponent, ClassMixin, Breakpoint
-from .utils import inject, attr
+from .utils import Template, render_options, rendering, _trimmed
+from . import parallel
+
+
+def _to_list(values):
+    """Converts an array to a list of Python values.
+
+    Indexing a NumPy array and formatting its scalars is many times slower
+    than doing the same with a list, so arrays are converted just once per
+    render.
+    """
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return values
+
+
+def _select(values, indexes):
+    """Selects values by indexes without copying the other values.
+
+    A contiguous range is cut as a slice (a view for a NumPy array).
+    """
+    if isinstance(indexes, range) and indexes.step == 1:
+        return values[indexes.start:indexes.stop]
+    if hasattr(values, 'ndim'):
+        return values[list(indexes)]
+    return [values[i] for i in indexes]
+
+
+def _moved(keys, positions):
+    """Finds the kept rows to move to restore the order of a new body.
+
+    The rows staying in place are the longest sequence of rows whose
+    previous order is kept (the longest increasing subsequence of their
+    previous positions), so the fewest rows are moved.
+
+    Args:
+        keys (list): The keys of the kept rows in the new order.
+        positions (dict): The previous positions of the rows by keys.
+
+    Returns:
+        list: The `[key, next key]` of the moved rows in the new order,
+            where the next key is the key of the kept row to move the row
+            before (`None` to move it to the end).
+    """
+    tails = []
+    tail_positions = []
+    links = []
+    for index, row_key in enumerate(keys):
+        position = positions[row_key]
+        length = bisect.bisect_left(tail_positions, position)
+        links.append(tails[length - 1] if length else None)
+        if length == len(tails):
+            tails.append(index)
+            tail_positions.append(position)
+        else:
+            tails[length] = index
+            tail_positions[length] = position
+
+    in_place = set()
+    index = tails[-1] if tails else None
+    while index is not None:
+        in_place.add(index)
+        index = links[index]
+    return [
+        [row_key, keys[index + 1] if index + 1 < len(keys) else None]
+        for index, row_key in enumerate(keys) if index not in in_place
+    ]
+
+
+class _Uncached(Exception):
+    """Carries a transformation result which must not be cached."""
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+
+
+def _memoized(fn, maxsize):
+    """Memoizes a transformation function in a bounded LRU cache.
+
+    Values of different types are cached apart (so `1` and `True` do not
+    share a result); unhashable values are transformed without caching.
+    The web components are never cached, since every row must get its own
+    one (with its own identifier).
+    """
+    def caching(value):
+        result = fn(value)
+        if isinstance(result, WebComponent):
+            # The cache keeps no results of the calls raising exceptions.
+            raise _Uncached(result)
+        return result
+    cached = functools.lru_cache(maxsize=maxsize, typed=True)(caching)
+
+    def transform(value):
+        try:
+            return cached(value)
+        except _Uncached as uncached:
+            return uncached.result
+        except TypeError:
+            if isinstance(value, Hashable):
+                raise
+            return fn(value)
+    transform.cache_info = cached.cache_info
+    return transform
+
+
+def _compile_row(width, handlers, key=None):
+    """Compiles a function rendering the table rows of a given width.
+
+    The function has a fixed sequence of column handlers resolved from the
+    body transformations: a column without a transformation is reduced to
+    formatting its value between constant strings. The source is compiled
+    once per transformations layout and render options, so per render it
+    takes just binding the transformations.
+
+    Args:
+        width (int): The number of columns in a row.
+        handlers (dict): The column handlers by column indexes, each is
+            a list of (function, values) pairs for the value, cell and row
+            entities.
+        key (int): The index of the column keying the rows (default none).
+
+    Returns:
+        func: The function taking a row and its index and returning the
+            row HTML.
+    """
+    namespace = {}
+    layout = []
+    for column in range(width):
+        handler = handlers.get(column, (None,) * 6)
+        kinds = []
+        for prefix, fn, values in zip(
+                ('v', 'c', 'r'), handler[0::2], handler[1::2]):
+            if values is not None:
+                namespace[f'{prefix}v{column}'] = values
+                kinds.append('v')
+            elif fn is not None:
+                namespace[f'{prefix}f{column}'] = fn
+                kinds.append('f')
+            else:
+                kinds.append('')
+        layout.append(tuple(kinds))
+    namespace.update(
+        escape=escape,
+        trimmed=_trimmed,
+        render_row=Table.Body._ROW.compile(),
+        render_keyed_row=Table.Body._KEYED_ROW.compile(),
+        render_first_cell=Table.Body._FIRST_CELL.compile(),
+        render_cell=Table.Body._CELL.compile()
+    )
+    exec(_row_code(tuple(layout), key, render_options()), namespace)
+    return namespace['render']
+
+
+def _row_renderer(handlers, width, key):
+    """Makes a function rendering the rows.
+
+    Args:
+        handlers (dict): The transformation handlers per column.
+        width (int): The number of columns in most of the rows.
+        key (int): The index of the column keying the rows or `None`.
+
+    Returns:
+        func: The function taking a row and its position among the rendered
+            rows and returning the row HTML.
+    """
+    render_row = _compile_row(
+        width, handlers, key if key is not None and key < width else None
+    )
+
+    def render(row, row_index):
+        if len(row) == width:
+            return render_row(row, row_index)
+        return _render_row(row, row_index, handlers, key)
+    return render
+
+
+def _render_rows(rows, handlers, width, key):
+    """Renders a shard of rows in a worker process."""
+    render = _row_renderer(handlers, width, key)
+    return ''.join(render(row, i) for i, row in enumerate(rows))
+
+
+def _render_row(row, row_index, handlers, key):
+    """Renders a row of a width other than the compiled one."""
+    render_cell = Table.Body._CELL.compile()
+    row_classes = []
+    record = []
+    for column, value in enumerate(row):
+        render = render_cell if record \
+            else Table.Body._FIRST_CELL.compile()
+        handler = handlers.get(column)
+        if handler is None:
+            record.append(render(classes='', value=str(value)))
+            row_classes.append('')
+            continue
+        value_fn, values, cell_fn, cells, row_fn, classes = handler
+        record.append(
+            render(
+                classes=cells[row_index] if cells is not None
+                else cell_fn(value) if cell_fn is not None
+                else '',
+                value=str(
+                    values[row_index] if values is not None
+                    else value_fn(value) if value_fn is not None
+                    else value
+                )
+            )
+        )
+        row_classes.append(
+            classes[row_index] if classes is not None
+            else row_fn(value) if row_fn is not None
+            else ''
+        )
+    if key is not None and key < len(row):
+        return Table.Body._KEYED_ROW.render(
+            classes=' '.join(row_classes),
+            key=escape(str(row[key])),
+            cells=''.join(record)
+        )
+    return Table.Body._ROW.render(
+        classes=' '.join(row_classes),
+        cells=''.join(record)
+    )
+
+
+@functools.lru_cache(maxsize=256)
+def _row_code(layout, key, options):
+    """Generates the code of a row rendering function.
+
+    Args:
+        layout (tuple): The kinds of the value, cell and row handlers per
+            column: 'f' for a function, 'v' for vectorized values and ''
+            for none.
+        key (int): The index of the column keying the rows or `None`.
+        options (RenderOptions): The render options the code is made for.
+
+    Returns:
+        code: The code defining the `render(row, i)` function.
+    """
+    def split(template, **values):
+        # A marker value splits a rendered template into constant parts.
+        before, after = template.render(**values).split('\0')
+        if options.compact and after.startswith(' '):
+            # The whitespace behind the content is the trimmed content one
+            # (see `Template`), so the content must be trimmed as well.
+            return before, after[1:], before.endswith(' ')
+        return before, after, None
+
+    def literal(text):
+        return text.replace('{', '{{').replace('}', '}}')
+
+    def entity(prefix, kind, column):
+        if kind == 'v':
+            return f'{prefix}v{column}[i]'
+        return f'{prefix}f{column}(v{column})'
+
+    statements = []
+    cells = []
+    exact_cells = []
+    trimmed = []
+    row_classes = []
+    for column, (value_kind, cell_kind, row_kind) in enumerate(layout):
+        value = entity('v', value_kind, column) if value_kind \
+            else f'v{column}'
+        template, render = (Table.Body._CELL, 'render_cell') if column \
+            else (Table.Body._FIRST_CELL, 'render_first_cell')
+        if cell_kind:
+            classes = entity('c', cell_kind, column)
+            cell = f'{render}(classes={classes}, value=str({value}))'
+            if options.compact:
+                # The cells may be rendered twice (see below).
+                statements.append(f't{column} = {cell}')
+                cell = f't{column}'
+            cells.append(f'{{{cell}}}')
+            exact_cells.append(cells[-1])
+            row_classes.append(
+                f'{{{entity("r", row_kind, column)}}}' if row_kind else ''
+            )
+            continue
+
+        before, after, spaced = split(template, classes='', value='\0')
+        if spaced is None:
+            cells.append(f'{literal(before)}{{{value}!s}}{literal(after)}')
+            exact_cells.append(cells[-1])
+        else:
+            if value_kind == 'f':
+                statements.append(f't{column} = {value}')
+                value = f't{column}'
+            cells.append(f'{literal(before)}{{{value}!s}} {literal(after)}')
+            exact_cells.append(
+                f'{literal(before)}{{trimmed(str({value}), {spaced})}}'
+                f'{literal(after)}'
+            )
+            trimmed.append(after)
+        row_classes.append(
+            f'{{{entity("r", row_kind, column)}}}' if row_kind else ''
+        )
+
+    cells = 'f' + repr(''.join(cells))
+    if trimmed:
+        # The values are trimmed (see `Template`) only if any of them is
+        # blank or ends with a whitespace, that is if the row has doubled
+        # whitespaces in front of a cell end.
+        statements.append(f'cells = {cells}')
+        condition = ' or '.join(
+            f'{whitespace + " " + after!r} in cells'
+            for after in dict.fromkeys(trimmed)
+            for whitespace in ' \n'
+        )
+        statements.append(f'if {condition}:')
+        statements.append(f'    cells = f{"".join(exact_cells)!r}')
+        cells = 'cells'
+
+    unpacking = ', '.join(f'v{column}' for column in range(len(layout)))
+    if key is not None:
+        body = (
+            f'return render_keyed_row(classes=f{repr(" ".join(row_classes))}, '
+            f'key=escape(str(v{key})), cells={cells})'
+        )
+    elif any(row_classes):
+        body = (
+            f'return render_row(classes=f{repr(" ".join(row_classes))}, '
+            f'cells={cells})'
+        )
+    else:
+        # The cells always end with a whitespace in the compact mode, so
+        # there is nothing to trim.
+        before, after, _ = split(Table.Body._ROW, classes='', cells='\0')
+        body = (
+            f'return f{repr(literal(before))} + {cells} + '
+            f'f{repr(literal(after))}'
+        )
+    source = ''.join(
+        f'    {line}\n' for line in [f'{unpacking}, = row', *statements, body]
+    )
+    source = f'def render(row, i):\n{source}'
+    return compile(source, '<table row>', 'exec')
 
 
 class TableEntity(Enum):
@@ -21,9 +364,17 @@ class TableEntity(Enum):
 class Table(WebComponent, ClassMixin):
     """A web component for a table.
 
+    The body is either a list of rows, a dict of columns or a NumPy 2D
+    array. For a dict of columns the head defaults to the dict keys. Any
+    other iterable of rows (a generator, DB cursor, etc.) is streamed:
+    rows are pulled while rendering and emitted in chunks through
+    `iter_render`, so the memory stays flat however long the body is.
+    A streamed body can be rendered just once unless the iterable can be
+    iterated again.
+
     Args:
         head (list): The table head (1D array).
-        body (list): The table body (2D array).
+        body (list|dict|ndarray|iterable): The table body (2D array).
 
     Example:
         from bootwrap import Table
@@ -38,14 +389,51 @@ class Table(WebComponent, ClassMixin):
         )
     """
 
+    _TEMPLATE = Template('''
+        <table {id=identifier}
+            {class=classes}>
+            {head}
+            {body}
+        </table>
+    ''')
+
+    _PAGER = Template('''
+        <nav aria-label="Table pages">
+            <ul class="pagination">
+                {items}
+            </ul>
+        </nav>
+    ''')
+
+    _PAGER_ITEM = Template('''
+        <li {class=classes}>
+            <a class="page-link" {href=href}>{label}</a>
+        </li>
+    ''')
+
     def __init__(self, head, body):
         super().__init__()
+        if head is None and isinstance(body, dict):
+            head = list(body)
         self.__head = Table.Head(head)
         self.__body = Table.Body(body)
+        self.__pagination = None
 
     class Head(WebComponent):
         """The table head."""
 
+        _TEMPLATE = Template('''
+            <thead {class=classes}>
+                <tr>
+                    {columns}
+                </tr>
+            </thead>
+        ''')
+
+        _COLUMN = Template('''
+            <th scope="col">{name}</th>
+        ''')
+
         def __init__(self, head):
             if head is None:
                 self.__head = []
@@ -105,46 +493,292 @@ class Table(WebComponent, ClassMixin):
             if len(self) == 0:
                 return ''
             else:
-                columns = []
-                for name in self.__head:
-                    columns.append(f'''
-                        <th scope="col">{name}</th>
-                    ''')
-                return f'''
-                    <thead {attr('class', self.__class)}>
-                        <tr>
-                            {inject(*columns)}
-                        </tr>
-                    </thead>
-                '''
+                return Table.Head._TEMPLATE.render(
+                    classes=self.__class,
+                    columns=[
+                        Table.Head._COLUMN.render(name=name)
+                        for name in self.__head
+                    ]
+                )
 
     class Body(WebComponent):
         """The table body."""
 
+        _OPEN = '<tbody>'
+        _CLOSE = '</tbody>'
+
+        _ROW = Template('''
+            <tr {class=classes}>
+                {cells}
+            </tr>
+        ''')
+
+        _KEYED_ROW = Template('''
+            <tr {class=classes} data-key="{key}">
+                {cells}
+            </tr>
+        ''')
+
+        _FIRST_CELL = Template('''
+            <td scope="row"
+                {class=classes}>
+                {value}
+            </td>
+        ''')
+
+        _CELL = Template('''
+            <td {class=classes}>
+                {value}
+            </td>
+        ''')
+
+        CHUNK_SIZE = 256
+        """The number of rows rendered into a single streamed chunk."""
+
+        MEMOIZE_SIZE = 1024
+        """The number of distinct values a memoized transformation keeps
+        the results for."""
+
+        INDEX_CACHE_SIZE = 16
+        """The number of sort and filter indexes a body keeps."""
+
         def __init__(self, body):
-            if body is None:
-                self.__body = []
-            else:
-                if not isinstance(body, list):
-                    raise TypeError(
-                        'Parameter "body" must be 2D <list>,'
-                        f' but got {type({body})};'
-                    )
+            self.__body = []
+            self.__columns = None
+            self.__stream = None
+            if isinstance(body, list):
                 self.__body = body
+            elif isinstance(body, dict):
+                self.__columns = list(body.values())
+            elif getattr(body, 'ndim', None) == 2:
+                # A NumPy (or alike) 2D array is split into column views.
+                self.__columns = [body[:, i] for i in range(body.shape[1])]
+            elif isinstance(body, Iterable) and \
+                    not isinstance(body, (str, bytes)):
+                # Any other iterable of rows (a generator, DB cursor, etc.)
+                # is streamed while rendering and never held in memory.
+                self.__stream = body
+            elif body is not None:
+                raise TypeError(
+                    'Parameter "body" must be 2D <list>, <dict> of columns, '
+                    f'2D array or iterable of rows, but got {type({body})};'
+                )
+            if self.__columns is not None:
+                if len({len(column) for column in self.__columns}) > 1:
+                    raise ValueError(
+                        'The body columns must be of the same length;'
+                    )
             self.__trans = {}
+            self.__vectorized = set()
+            self.__key = None
+            self.__indexes = OrderedDict()
 
         def __len__(self):
+            if self.__stream is not None:
+                if not hasattr(self.__stream, '__len__'):
+                    raise TypeError('The streamed body length is unknown;')
+                return len(self.__stream)
+            if self.__columns is not None:
+                return len(self.__columns[0]) if self.__columns else 0
             return len(self.__body)
 
-        def transform(self, index, entity, fn):
+        def column(self, index, indexes=None):
+            """Gets the values of a body column.
+
+            Args:
+                index (int): The column index.
+                indexes (sequence): The indexes of rows to get the values
+                    of (default all).
+
+            Returns:
+                sequence: The column values (the column itself for
+                    a columnar body).
+            """
+            if self.__stream is not None:
+                raise TypeError('The streamed body columns are unavailable;')
+            if self.__columns is not None:
+                if indexes is None:
+                    return self.__columns[index]
+                return _select(self.__columns[index], indexes)
+            if indexes is None:
+                return [row[index] for row in self.__body]
+            return [self.__body[i][index] for i in indexes]
+
+        def rows(self, indexes=None):
+            """Gets the body rows.
+
+            Args:
+                indexes (sequence): The indexes of rows to get
+                    (default all).
+
+            Returns:
+                iterable: The body rows.
+            """
+            if self.__stream is not None:
+                if indexes is None:
+                    return self.__stream
+                if not isinstance(indexes, range) or indexes.step != 1:
+                    raise TypeError(
+                        'The streamed body rows can be taken in order only;'
+                    )
+                return itertools.islice(
+                    self.__stream, indexes.start, indexes.stop
+                )
+            if self.__columns is not None:
+                if indexes is None:
+                    return zip(*map(_to_list, self.__columns))
+                return zip(*[
+                    _to_list(_select(column, indexes))
+                    for column in self.__columns
+                ])
+            if indexes is None:
+                return self.__body
+            return (self.__body[i] for i in indexes)
+
+        def pages(self, page_size, where=None):
+            """Gets the number of pages.
+
+            Args:
+                page_size (int): The number of rows in a page.
+                where (func): The predicate of a row selecting the rows
+                    to paginate (default all).
+
+            Returns:
+                int: The number of pages (at least one).
+            """
+            n = len(self) if where is None else len(self.order(where=where))
+            return max(1, -(-n // page_size))
+
+        def page_indexes(
+                self, page, page_size, sort_key=None, reverse=False,
+                where=None):
+            """Gets the indexes of rows in a page.
+
+            The rows are never copied: a page of the body in its own order
+            is a range of indexes, a page of the sorted or filtered body is
+            a slice of the cached index (see `order`).
+
+            Args:
+                page (int): The page number starting from 1.
+                page_size (int): The number of rows in a page.
+                sort_key (int|func): The column index or function of a row
+                    to sort the rows by (default none).
+                reverse (bool): Whether to sort in the descending order
+                    (default=False).
+                where (func): The predicate of a row selecting the rows
+                    to paginate (default all).
+
+            Returns:
+                sequence: The indexes of rows (of the selected rows for
+                    a filtered streamed body).
+            """
+            if page < 1 or page_size < 1:
+                raise ValueError(
+                    'The page and page size must be positive, '
+                    f'but got {page} and {page_size};'
+                )
+            start = (page - 1) * page_size
+            if self.__stream is not None:
+                if sort_key is not None or reverse:
+                    raise TypeError('The streamed body cannot be sorted;')
+                if where is not None or \
+                        not hasattr(self.__stream, '__len__'):
+                    return range(start, start + page_size)
+            if sort_key is None and not reverse and where is None:
+                n = len(self)
+                return range(min(start, n), min(start + page_size, n))
+            return self.order(sort_key, reverse, where)[
+                start:start + page_size
+            ]
+
+        def order(self, sort_key=None, reverse=False, where=None):
+            """Gets the index of rows sorting and filtering the body.
+
+            The indexes are built on the first use and cached (up to
+            `INDEX_CACHE_SIZE` of them), so the subsequent renders of pages
+            just slice them. A function key or predicate is cached by its
+            identity, so reuse the same function object. Call `reindex`
+            after changing the body data in place.
+
+            Args:
+                sort_key (int|func): The column index or function of a row
+                    to sort the rows by (default none).
+                reverse (bool): Whether to sort in the descending order
+                    (default=False).
+                where (func): The predicate of a row selecting the rows
+                    (default all).
+
+            Returns:
+                sequence: The row indexes.
+            """
+            if self.__stream is not None:
+                raise TypeError('The streamed body cannot be indexed;')
+            n = len(self)
+            if sort_key is None and where is None:
+                return range(n - 1, -1, -1) if reverse else range(n)
+
+            key = (sort_key, reverse, where)
+            indexes = self.__indexes.get(key)
+            if indexes is not None:
+                self.__indexes.move_to_end(key)
+                return indexes
+
+            if where is not None:
+                mask = [bool(where(row)) for row in self.rows()]
+                indexes = [
+                    i for i in self.order(sort_key, reverse) if mask[i]
+                ]
+            else:
+                if callable(sort_key):
+                    keys = [sort_key(row) for row in self.rows()]
+                else:
+                    keys = _to_list(self.column(sort_key))
+                indexes = sorted(
+                    range(n), key=keys.__getitem__, reverse=reverse
+                )
+
+            self.__indexes[key] = indexes
+            if len(self.__indexes) > Table.Body.INDEX_CACHE_SIZE:
+                self.__indexes.popitem(last=False)
+            return indexes
+
+        def _children(self):
+            # The rows are data, they are never scanned for web components
+            # (and a streamed body cannot be iterated ahead of rendering).
+            return ()
+
+        def reindex(self):
+            """Drops the cached sort and filter indexes.
+
+            It must be called after changing the body data in place.
+            """
+            self.__indexes.clear()
+            self.invalidate()
+
+        def transform(
+                self, index, entity, fn, vectorized=False, memoize=False):
             """Defines a function to transform a cell value
 
+            A vectorized function is called just once per render with the
+            whole column (a list, or the array itself for a columnar body)
+            and must return a sequence of the transformed values, one per
+            row.
+
+            A memoized function is called once per distinct value (keeping
+            up to `MEMOIZE_SIZE` most recent ones), which suits columns with
+            few distinct values. The returned web components are not cached
+            though, every row gets its own one (and its own identifier).
+
             Args:
                 index (int): The column index to which transformation
                     is applied;
                 entity (Entity): The entity to which transformation
                     is applied;
-                fn (func): The function to use for transformation.
+                fn (func): The function to use for transformation;
+                vectorized (bool): Whether the function transforms the
+                    whole column (default=False);
+                memoize (bool): Whether the function results are cached
+                    per distinct value (default=False).
 
             Example:
                 from bootwrap import Table, TableEntity, Text
@@ -167,13 +801,15 @@ class Table(WebComponent, ClassMixin):
                 table.body.transform(
                     0,
                     TableEntity.ROW,
-                    lambda v: "bg-warning" if v == "val2" else ""
+                    lambda v: "bg-warning" if v == "val2" else "",
+                    memoize=True
                 )
 
                 table.body.transform(
                     1,
                     TableEntity.VALUE,
-                    lambda v: f"<code>{v}</code>"
+                    lambda column: [f"<code>{v}</code>" for v in column],
+                    vectorized=True
                 )
 
                 output = table
@@ -184,77 +820,350 @@ class Table(WebComponent, ClassMixin):
                     TableEntity.CELL: None,
                     TableEntity.ROW: None
                 }
+            if vectorized and self.__stream is not None:
+                raise ValueError(
+                    'The streamed body does not support vectorized '
+                    'transformations;'
+                )
+            if vectorized and memoize:
+                raise ValueError(
+                    'The vectorized transformations cannot be memoized;'
+                )
             if self.__trans[index][entity] is None:
+                if memoize:
+                    fn = _memoized(fn, Table.Body.MEMOIZE_SIZE)
                 self.__trans[index][entity] = fn
+                if vectorized:
+                    self.__vectorized.add((index, entity))
+                self.invalidate()
             else:
                 raise ValueError(
                     f'The transformation for {entity} in column {index} '
                     'already defined;'
                 )
 
-        def __str__(self):
-            def get_cell_value(column, value):
-                if column in self.__trans:
-                    if self.__trans[column][TableEntity.VALUE] is not None:
-                        return self.__trans[column][TableEntity.VALUE](
-                            value
-                        )
-                return value
+        def __transformed_columns(self, indexes):
+            """Applies the vectorized transformations.
 
-            def get_cell_classes(column, value):
-                if column in self.__trans:
-                    if self.__trans[column][TableEntity.CELL] is not None:
-                        return self.__trans[column][TableEntity.CELL](
-                            value
-                        )
-                return ''
+            Args:
+                indexes (sequence): The indexes of rows to transform
+                    (`None` for all).
+
+            Returns:
+                dict: The transformed column values by the column index
+                    and entity.
+            """
+            transformed = {}
+            if not self.__vectorized:
+                return transformed
+            n = len(self) if indexes is None else len(indexes)
+            for index, entity in self.__vectorized:
+                values = self.__trans[index][entity](
+                    self.column(index, indexes)
+                )
+                if len(values) != n:
+                    raise ValueError(
+                        f'The vectorized transformation for {entity} in '
+                        f'column {index} must return {n} values, '
+                        f'but got {len(values)};'
+                    )
+                transformed[index, entity] = _to_list(values)
+            return transformed
+
+        def iter_render(
+                self, chunk_size=None, sort_key=None, reverse=False,
+                where=None):
+            """Renders the body in chunks of rows.
+
+            Args:
+                chunk_size (int): The number of rows in a chunk
+                    (default=`CHUNK_SIZE`).
+                sort_key (int|func): The column index or function of a row
+                    to sort the rows by (default none).
+                reverse (bool): Whether to sort in the descending order
+                    (default=False).
+                where (func): The predicate of a row selecting the rows
+                    to render (default all).
+
+            Returns:
+                generator: The body HTML chunks.
+            """
+            indexes = None
+            if self.__stream is None and (
+                    sort_key is not None or reverse or where is not None):
+                indexes = self.order(sort_key, reverse, where)
+            elif sort_key is not None or reverse:
+                raise TypeError('The streamed body cannot be sorted;')
+            return self.__iter_render(indexes, chunk_size, where)
+
+        def iter_render_page(
+                self, page, page_size, sort_key=None, reverse=False,
+                where=None, chunk_size=None):
+            """Renders a page of the body in chunks of rows.
+
+            Args:
+                page (int): The page number starting from 1.
+                page_size (int): The number of rows in a page.
+                sort_key (int|func): The column index or function of a row
+                    to sort the rows by (default none).
+                reverse (bool): Whether to sort in the descending order
+                    (default=False).
+                where (func): The predicate of a row selecting the rows
+                    to paginate (default all).
+                chunk_size (int): The number of rows in a chunk
+                    (default=`CHUNK_SIZE`).
+
+            Returns:
+                generator: The page HTML chunks.
+            """
+            return self.__iter_render(
+                self.page_indexes(page, page_size, sort_key, reverse, where),
+                chunk_size,
+                where
+            )
+
+        def render_page(
+                self, page, page_size, sort_key=None, reverse=False,
+                where=None):
+            """Renders a page of the body.
+
+            It is meant for endpoints serving the subsequent pages of
+            a paginated table.
+
+            Args:
+                page (int): The page number starting from 1.
+                page_size (int): The number of rows in a page.
+                sort_key (int|func): The column index or function of a row
+                    to sort the rows by (default none).
+                reverse (bool): Whether to sort in the descending order
+                    (default=False).
+                where (func): The predicate of a row selecting the rows
+                    to paginate (default all).
+
+            Returns:
+                str: The `<tbody>` HTML of the page (empty if there are no
+                    rows in the page).
+
+            Example:
+                from flask import Flask, request
+                from bootwrap import Table
+
+                app = Flask(__name__)
+                table = Table(["Column 1"], [[i] for i in range(1000)])
+
+                @app.route('/rows')
+                def rows():
+                    return table.body.render_page(
+                        int(request.args.get('page', 1)), 25
+                    )
+            """
+            return ''.join(
+                self.iter_render_page(
+                    page, page_size, sort_key, reverse, where
+                )
+            )
+
+        def key_by(self, index):
+            """Defines the column keying the body rows.
 
-            def get_row_classes(column, value):
-                if column in self.__trans:
-                    if self.__trans[column][TableEntity.ROW] is not None:
-                        return self.__trans[column][TableEntity.ROW](
-                            value
+            Every row is rendered with the `data-key` attribute holding its
+            key, so the rows can be patched in place (see `diff`).
+
+            Args:
+                index (int): The column index.
+
+            Example:
+                from bootwrap import Table
+
+                table = Table(
+                    ["Symbol", "Price"],
+                    [["AAPL", 145.86], ["GOOGL", 2728.72]]
+                )
+                table.body.key_by(0)
+
+                output = table
+            """
+            self.__key = index
+
+        def diff(self, previous):
+            """Computes the row-level difference from a previous body.
+
+            The rows are matched by the key column (see `key_by`), so the
+            keys must be unique. Just the added and changed rows are
+            rendered, in the compact mode to keep the patch small. The rows
+            kept in both bodies but in another order are moved.
+
+            Args:
+                previous (Table.Body): The previous body.
+
+            Returns:
+                dict: The patch with the keys of the `removed` rows, the
+                    `[key, html]` of the `changed` rows, the
+                    `[key, next key]` of the `moved` rows, where the next
+                    key is the key of the kept row to move the row before,
+                    and the `[key, html, next key]` of the `added` rows,
+                    where the next key is the key of the row to insert the
+                    added row before (`None` to append a row).
+
+            Raises:
+                ValueError: If the rows key is not defined or the keys are
+                    not unique.
+            """
+            key = self.__key
+            if key is None:
+                raise ValueError('The body rows key is not defined;')
+            old_rows = {}
+            for row in previous.rows():
+                row_key = str(row[key])
+                if row_key in old_rows:
+                    raise ValueError(f'Duplicate body row key: {row_key};')
+                old_rows[row_key] = tuple(row)
+            positions = {row_key: i for i, row_key in enumerate(old_rows)}
+
+            keys = []
+            kept = []
+            new_keys = set()
+            updated = []
+            for row_index, row in enumerate(self.rows()):
+                row_key = str(row[key])
+                keys.append(row_key)
+                old_row = old_rows.pop(row_key, None)
+                if old_row is None:
+                    # The key is either used by a row seen before or new.
+                    if row_key in positions or row_key in new_keys:
+                        raise ValueError(
+                            f'Duplicate body row key: {row_key};'
                         )
-                return ''
+                    new_keys.add(row_key)
+                    updated.append((row_index, True))
+                    continue
+                kept.append(row_key)
+                if old_row != tuple(row):
+                    updated.append((row_index, False))
+
+            changed = []
+            added = []
+            with rendering(compact=True):
+                self.__render_updated(updated, keys, changed, added)
+            return {
+                'removed': list(old_rows),
+                'changed': changed,
+                'moved': _moved(kept, positions),
+                'added': added
+            }
+
+        def __render_updated(self, updated, keys, changed, added):
+            """Renders the updated rows of a patch.
 
-            if len(self) == 0:
-                return ''
+            Args:
+                updated (list): The pairs of an updated row index and
+                    whether the row is new.
+                keys (list): The keys of all rows.
+                changed (list): The list to add the changed rows to.
+                added (list): The list to add the new rows to.
+            """
+            if not updated:
+                return
+            indexes = [row_index for row_index, _ in updated]
+            rows = list(self.rows(indexes))
+            render_row = self.__row_renderer(indexes, len(rows[0]))
+            for i, ((row_index, is_new), row) in enumerate(zip(updated, rows)):
+                html = render_row(row, i)
+                if is_new:
+                    next_key = keys[row_index + 1] \
+                        if row_index + 1 < len(keys) else None
+                    added.append([keys[row_index], html, next_key])
+                else:
+                    changed.append([keys[row_index], html])
+
+        def __row_renderer(self, indexes, width):
+            """Makes a function rendering the rows.
+
+            Args:
+                indexes (sequence): The indexes of rows to render
+                    (`None` for all).
+                width (int): The number of columns in most of the rows.
+
+            Returns:
+                func: The function taking a row and its position among
+                    the rendered rows and returning the row HTML.
+            """
+            return _row_renderer(self.__handlers(indexes), width, self.__key)
+
+        def __handlers(self, indexes):
+            """Resolves the transformations once per render.
+
+            Every column entity gets either a per-cell function or the
+            values of its vectorized transformation.
+            """
+            transformed = self.__transformed_columns(indexes)
+            handlers = {}
+            for column, trans in self.__trans.items():
+                handler = []
+                for entity in TableEntity:
+                    values = transformed.get((column, entity))
+                    fn = trans[entity] if values is None else None
+                    handler += [fn, values]
+                handlers[column] = handler
+            return handlers
+
+        def __iter_render_parallel(self, indexes):
+            """Renders the rows in the worker processes."""
+            rows = list(self.rows(indexes))
+            handlers = self.__handlers(indexes)
+            width = len(rows[0])
+            shards = [
+                (
+                    rows[start:stop],
+                    {
+                        # The vectorized values are sliced to the shard.
+                        column: [
+                            item if item is None or index % 2 == 0
+                            else item[start:stop]
+                            for index, item in enumerate(handler)
+                        ]
+                        for column, handler in handlers.items()
+                    },
+                    width,
+                    self.__key
+                )
+                for start, stop in parallel.bounds(len(rows))
+            ]
+            yield Table.Body._OPEN
+            yield from parallel.map_shards(_render_rows, shards)
+            yield Table.Body._CLOSE
+
+        def __iter_render(self, indexes, chunk_size, where=None):
+            if self.__stream is not None and where is not None:
+                # A streamed body is filtered on the fly.
+                rows = filter(where, self.__stream)
+                if indexes is not None:
+                    rows = itertools.islice(rows, indexes.start, indexes.stop)
+                indexes = None
+            elif self.__stream is None and parallel.enabled(
+                    len(self) if indexes is None else len(indexes)):
+                yield from self.__iter_render_parallel(indexes)
+                return
             else:
-                records = []
-                for row in self.__body:
-                    row_classes = []
-                    record = []
-                    for column, value in enumerate(row):
-                        cell_value = get_cell_value(column, value)
-                        cell_classes = get_cell_classes(column, value)
-                        row_classes.append(
-                            get_row_classes(column, value)
-                        )
+                rows = iter(self.rows(indexes))
+            first_row = next(rows, None)
+            if first_row is None:
+                return
+            rows = itertools.chain((first_row,), rows)
+            chunk_size = chunk_size or Table.Body.CHUNK_SIZE
+            render_row = self.__row_renderer(indexes, len(first_row))
+
+            chunk = [Table.Body._OPEN]
+            for row_index, row in enumerate(rows):
+                chunk.append(render_row(row, row_index))
+                if len(chunk) >= chunk_size:
+                    yield ''.join(chunk)
+                    chunk = []
+            chunk.append(Table.Body._CLOSE)
+            yield ''.join(chunk)
 
-                        if len(record) == 0:
-                            record.append(f'''
-                                <td scope="row"
-                                    {attr("class", cell_classes)}>
-                                    {cell_value}
-                                </td>
-                            ''')
-                        else:
-                            record.append(f'''
-                                <td {attr("class", cell_classes)}>
-                                    {cell_value}
-                                </td>
-                            ''')
-                    records.append(f'''
-                        <tr {attr("class", " ".join(row_classes))}>
-                            {"".join(record)}
-                        </tr>
-                    ''')
-
-                return f'''
-                    <tbody>
-                        {inject(*records)}
-                    </tbody>
-                '''
+        def __str__(self):
+            return ''.join(self.iter_render())
 
     @property
     def head(self):
@@ -266,6 +1175,24 @@ class Table(WebComponent, ClassMixin):
         """The table body."""
         return self.__body
 
+    def invalidate(self):
+        """Invalidates the memoized render output.
+
+        Call it after changing the table data in place (the sort and filter
+        indexes are kept, see `Table.Body.reindex`).
+
+        Example:
+            rows = [["AAPL", 90], ["AMZN", 80]]
+            table = Table(["Symbol", "Price"], rows)
+            ...
+            rows[0][1] = 91
+            table.invalidate()
+        """
+        # The table data is held by the head and body.
+        self.__head.invalidate()
+        self.__body.invalidate()
+        super().invalidate()
+
     def as_striped(self):
         """Adds zebra-striping to any table row within the table body.
 
@@ -374,14 +1301,145 @@ class Table(WebComponent, ClassMixin):
         self.add_classes(f'table-responsive-{breakpoint}')
         return self
 
-    def __str__(self):
+    def paginate(
+            self, page_size, page=1, sort_key=None, reverse=False,
+            href='?page={page}', where=None):
+        """Makes the table render a single page of rows with pager controls.
+
+        The subsequent pages can be served by a small endpoint rendering
+        the page `<tbody>` with `Table.Body.render_page`.
+
+        Args:
+            page_size (int): The number of rows in a page.
+            page (int): The page number starting from 1 (default=1).
+            sort_key (int|func): The column index or function of a row
+                to sort the rows by (default none).
+            reverse (bool): Whether to sort in the descending order
+                (default=False).
+            href (str): The pager link format with the `{page}`
+                placeholder (default='?page={page}').
+            where (func): The predicate of a row selecting the rows
+                to paginate (default all).
+
+        Returns:
+            obj (self): The instance of this class.
+
+        Example:
+            from bootwrap import Table
+
+            output = Table(
+                ["Column 1", "Column 2", "Column 3"],
+                [
+                    [f"Value {i}1", f"Value {i}2", f"Value {i}3"]
+                    for i in range(1, 10)
+                ]
+            ).paginate(3, page=2)
+        """
+        self.__pagination = (page_size, page, sort_key, reverse, href, where)
+        return self
+
+    def __pager_items(self, page_size, page, href, where):
+        pages = self.__body.pages(page_size, where)
+        shown = sorted(
+            {1, pages} | set(range(max(1, page - 2), min(pages, page + 2) + 1))
+        )
+        render_item = Table._PAGER_ITEM.render
+
+        yield render_item(
+            classes='page-item disabled' if page <= 1 else 'page-item',
+            href=href.format(page=page - 1) if page > 1 else None,
+            label='Previous'
+        )
+        previous = 0
+        for number in shown:
+            if number > previous + 1:
+                yield render_item(
+                    classes='page-item disabled', label='&hellip;'
+                )
+            yield render_item(
+                classes='page-item active' if number == page else 'page-item',
+                href=href.format(page=number),
+                label=number
+            )
+            previous = number
+        yield render_item(
+            classes='page-item disabled' if page >= pages else 'page-item',
+            href=href.format(page=page + 1) if page < pages else None,
+            label='Next'
+        )
+
+    def diff(self, previous, adopt_identifier=False):
+        """Computes the row-level patch turning a previously rendered table
+        into this one.
+
+        The rows are matched by the body key column (see `Table.Body.key_by`)
+        and the patch is meant to be sent to the browser as JSON and applied
+        with the `bootwrapPatchTable` function of the live-update page
+        script (see the `Page` `live` argument), so just the added, changed
+        and removed rows travel over the wire.
+
+        The patch targets the element of the previous table. To diff the
+        tables of the following ticks against this one, let it adopt the
+        identifier of the previous table, so their patches target the same
+        table element.
+
+        Args:
+            previous (Table): The previously rendered table.
+            adopt_identifier (bool): Whether this table takes over the
+                identifier of the previous one (default=False).
+
+        Returns:
+            dict: The patch targeting the previous table element, see
+                `Table.Body.diff`.
+
+        Example:
+            from bootwrap import Table
+
+            before = Table(["Symbol", "Price"], [["AAPL", 145.86]])
+            before.body.key_by(0)
+
+            after = Table(["Symbol", "Price"], [["AAPL", 146.10]])
+            after.body.key_by(0)
+
+            patch = after.diff(before, adopt_identifier=True)
+
+            output = before
+        """
+        patch = self.__body.diff(previous.body)
+        patch['target'] = previous.identifier
+        if adopt_identifier and self is not previous:
+            self._WebComponent__identifier = patch['target']
+        return patch
+
+    def iter_render(self):
+        """Renders the table chunk by chunk, a chunk of body rows at a time
+        (see `Table.Body.iter_render`)."""
         classes = 'table'
         if self.classes:
             classes += f' {self.classes}'
 
-        return f'''
-            <table id="{self.identifier}"
-                {attr('class', classes)}>
-                {self.__head} {self.__body}
-            </table>
-        '''
+        if self.__pagination is None:
+            return Table._TEMPLATE.iter_render(
+                identifier=self.identifier,
+                classes=classes,
+                head=self.__head,
+                body=self.__body
+            )
+
+        page_size, page, sort_key, reverse, href, where = self.__pagination
+        return itertools.chain(
+            Table._TEMPLATE.iter_render(
+                identifier=self.identifier,
+                classes=classes,
+                head=self.__head,
+                body=self.__body.iter_render_page(
+                    page, page_size, sort_key, reverse, where
+                )
+            ),
+            Table._PAGER.iter_render(
+                items=self.__pager_items(page_size, page, href, where)
+            )
+        )
+
+    def __str__(self):
+        return ''.join(self.iter_render())
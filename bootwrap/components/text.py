@@ -8,7 +8,8 @@ from .base import (
     WebComponent,
     ClassMixin,
     AppearanceMixin,
-    OutlineMixin
+    OutlineMixin,
+    _resolved
 )
 from .utils import attr, tag
 
@@ -190,34 +191,44 @@ class Text(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
         return self
 
     def __str__(self):
+        classes = ()
         if self._category:
-            self.add_classes(f'text-{self._category}')
+            classes = (f'text-{self._category}',)
 
         if self._border:
-            self.add_classes(f'border')
+            classes += ('border',)
             if self._category:
-                self.add_classes(f'border-{self._category}')
+                classes += (f'border-{self._category}',)
 
         attrs = [
             attr("id", self.identifier),
-            attr("class", self.classes)
+            attr("class", self._compose_classes(*classes))
         ]
+        content = _resolved(self.__content)
+        # The single lines which do not start with a whitespace (the vast
+        # majority of texts) have nothing to dedent.
+        if '\n' in content or content[:1].isspace():
+            content = dedent(content)
 
         if self.__level:
-            return tag(f'h{self.__level}', attrs, dedent(self.__content))
+            return tag(f'h{self.__level}', attrs, content)
         else:
             if self.__language:
                 return tag(
                     'pre',
                     attrs,
-                    tag('code', [attr('class', f"language-{self.__language}")], dedent(self.__content))
+                    tag(
+                        'code',
+                        [attr('class', f"language-{self.__language}")],
+                        content
+                    )
                 )
             else:
                 if self.__paragraph:
-                    return tag('p', attrs, dedent(self.__content))
+                    return tag('p', attrs, content)
                 elif self.__strong:
-                    return tag('strong', attrs, dedent(self.__content))
+                    return tag('strong', attrs, content)
                 elif self.__small:
-                    return tag('small', attrs, dedent(self.__content))
+                    return tag('small', attrs, content)
                 else:
-                    return tag('span', attrs, dedent(self.__content))
\ No newline at end of file
+                    return tag('span', attrs, content)
\ No newline at end of file
@@ -6,7 +6,7 @@ from .base import WebComponent, ClassMixin, AppearanceMixin, OutlineMixin
 from .anchor import Anchor
 from .button import Button
 from .text import Text
-from .utils import attr, inject
+from .utils import Template
 
 
 class Toast(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
@@ -48,6 +48,55 @@ class Toast(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
         )
     """
 
+    _HEADED = Template('''
+        <div class="position-fixed bottom-0 end-0 p-3" style="z-index: 10">
+            <div {id=identifier}
+                {class=classes}
+                role="alert"
+                aria-live="assertive"
+                aria-atomic="true"
+                {data-bs-autohide=autohide}
+                {data-bs-delay=hide_delay}>
+                <div class="toast-header">
+                    {figure}
+                    {title}
+                    {marker}
+                    <button type="button"
+                        class="btn-close"
+                        data-bs-dismiss="toast"
+                        aria-label="Close">
+                    </button>
+                </div>
+                <div class="toast-body">
+                    {description}
+                </div>
+            </div>
+        </div>
+    ''')
+
+    _PLAIN = Template('''
+        <div class="position-fixed bottom-0 end-0 p-3" style="z-index: 10">
+            <div {id=identifier}
+                {class=classes}
+                role="alert"
+                aria-live="assertive"
+                aria-atomic="true"
+                {data-bs-autohide=autohide}
+                {data-bs-delay=hide_delay}>
+                <div class="d-flex">
+                    <div class="toast-body">
+                        {description}
+                    </div>
+                    <button type="button"
+                        class="btn-close me-2 m-auto"
+                        data-bs-dismiss="toast"
+                        aria-label="Close">
+                    </button>
+                </div>
+            </div>
+        </div>
+    ''')
+
     def __init__(self, title=None, description=None, marker=None, figure=None, hide_delay=None):
         super().__init__()
         self._title =  title
@@ -62,23 +111,24 @@ class Toast(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
                 )
         
     def __str__(self):
-        self.add_classes("toast")
+        classes = ["toast"]
 
         if self._border:
-            self.add_classes(f'border')
+            classes.append('border')
             if self._category:
-                self.add_classes(f'border-{self._category}')
-                self.add_classes(f'text-{self._category}')
+                classes.append(f'border-{self._category}')
+                classes.append(f'text-{self._category}')
         else:
             if self._category:
-                self.add_classes(f'text-bg-{self._category}')
+                classes.append(f'text-bg-{self._category}')
 
-        if self._hide_delay is None:
+        hide_delay = self._hide_delay
+        if hide_delay is None:
             autohide = "true"
         else:
-            if self._hide_delay == 0:
+            if hide_delay == 0:
                 autohide = "false"
-                self._hide_delay = None
+                hide_delay = None
             else:
                 autohide = "true"
 
@@ -86,6 +136,8 @@ class Toast(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
         if wc_title:
             if isinstance(wc_title, str):
                 wc_title = Text(wc_title)
+            else:
+                wc_title = wc_title._variant()
             if isinstance(wc_title, Text):
                 wc_title.as_strong()
             wc_title.add_classes("me-auto")
@@ -94,59 +146,31 @@ class Toast(WebComponent, ClassMixin, AppearanceMixin, OutlineMixin):
             if wc_marker:
                 if isinstance(wc_marker, str):
                     wc_marker = Text(wc_marker)
+                elif isinstance(wc_marker, Text):
+                    wc_marker = wc_marker._variant()
                 if isinstance(wc_marker, Text):
                     wc_marker.as_small()
 
             wc_figure = self._figure
             if wc_figure:
-                wc_figure.add_classes("me-2")
-
-            return f'''
-                <div class="position-fixed bottom-0 end-0 p-3" style="z-index: 10">
-                    <div {attr("id", self.identifier)}
-                        {attr('class', self.classes)}
-                        role="alert"
-                        aria-live="assertive"
-                        aria-atomic="true"
-                        {attr('data-bs-autohide', autohide)}
-                        {attr('data-bs-delay', self._hide_delay)}>
-                        <div class="toast-header">
-                            {inject(self._figure)}
-                            {inject(wc_title)}
-                            {inject(wc_marker)}
-                            <button type="button"
-                                class="btn-close"
-                                data-bs-dismiss="toast"
-                                aria-label="Close">
-                            </button>
-                        </div>
-                        <div class="toast-body">
-                            {inject(self._description)}
-                        </div>
-                    </div>
-                </div>
-            '''
+                wc_figure = wc_figure._variant().add_classes("me-2")
+
+            return Toast._HEADED.render(
+                identifier=self.identifier,
+                classes=self._compose_classes(*classes),
+                autohide=autohide,
+                hide_delay=hide_delay,
+                figure=wc_figure,
+                title=wc_title,
+                marker=wc_marker,
+                description=self._description
+            )
         else:
-            self.add_classes("align-items-center")
-            return f'''
-                <div class="position-fixed bottom-0 end-0 p-3" style="z-index: 10">
-                    <div {attr("id", self.identifier)}
-                        {attr('class', self.classes)}
-                        role="alert"
-                        aria-live="assertive"
-                        aria-atomic="true"
-                        {attr('data-bs-autohide', autohide)}
-                        {attr('data-bs-delay', self._hide_delay)}>
-                        <div class="d-flex">
-                            <div class="toast-body">
-                                {inject(self._description)}
-                            </div>
-                            <button type="button"
-                                class="btn-close me-2 m-auto"
-                                data-bs-dismiss="toast"
-                                aria-label="Close">
-                            </button>
-                        </div>
-                    </div>
-                </div>
-            '''
\ No newline at end of file
+            classes.append("align-items-center")
+            return Toast._PLAIN.render(
+                identifier=self.identifier,
+                classes=self._compose_classes(*classes),
+                autohide=autohide,
+                hide_delay=hide_delay,
+                description=self._description
+            )
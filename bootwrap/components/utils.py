@@ -2,6 +2,222 @@
 web components utilities.
 """
 
+import re
+import types
+import contextlib
+import contextvars
+from collections import namedtuple
+from textwrap import dedent
+
+
+RenderOptions = namedtuple(
+    'RenderOptions', ['compact', 'deterministic', 'workers']
+)
+"""The render options.
+
+Attributes:
+    compact (bool): If `True` the markup produced by web components is
+        whitespace-normalized (the whitespaces inside `<pre>`, `<textarea>`
+        and `<script>` elements are kept as they are).
+    deterministic (bool): If `True` the web component identifiers are
+        allocated per render in the web component tree order (the web
+        components made while rendering get identifiers derived from the
+        ones rendering them), so rendering the same web components again
+        produces exactly the same markup.
+    workers (int): If more than one, large collections of web components
+        (list items, deck cards, panel components and table rows) are
+        rendered in parallel by a pool of the given number of worker
+        processes (see the `bootwrap.components.parallel` module). The
+        parallel rendering never applies to deterministic renders.
+"""
+
+_default_options = RenderOptions(
+    compact=False, deterministic=False, workers=None
+)
+_options = contextvars.ContextVar('render_options')
+_scope = contextvars.ContextVar('render_scope', default=None)
+# Whether a web component is being rendered (see `WebComponent.__setattr__`).
+_in_render = contextvars.ContextVar('in_render', default=False)
+
+# The trailing whitespaces of the content values merged in the compact mode
+# (the whitespace runs of the hand-written markup are made of them).
+_TRAILING_WHITESPACES = ' \n'
+
+
+def _encode_identifier(number, prefix='w'):
+    """Encodes a web component identifier number in hexadecimal.
+
+    The letter prefix makes identifiers valid HTML ids and CSS selectors.
+    """
+    return '%s%x' % (prefix, number)
+
+
+class _IdentifierScope:
+    """The web component identifiers allocated within a deterministic render.
+
+    The scope keeps the web components it has allocated identifiers for, so
+    they cannot be garbage collected (and their `id` reused) while rendering.
+    The scope identifiers have their own prefix, so they never clash with
+    the identifiers allocated outside of deterministic renders (for example,
+    the ones rendered into a string before the page rendering started).
+
+    The web components being rendered are the scope owners. A web component
+    referenced for the first time while an owner is rendered (that is, made
+    by the owner while rendering) gets an identifier derived from the owner
+    one, so it does not depend on what else has been rendered before.
+    """
+
+    def __init__(self):
+        self.__identifiers = dict()
+        self.__allocated = []
+        self.__owners = []
+        self.__owned = dict()
+
+    def __contains__(self, component):
+        return id(component) in self.__identifiers
+
+    @property
+    def allocated(self):
+        """The web components in the order identifiers were allocated."""
+        return self.__allocated
+
+    @property
+    def owners(self):
+        """The web components being rendered (the innermost is the last)."""
+        return self.__owners
+
+    def identifier(self, component):
+        entry = self.__identifiers.get(id(component))
+        if entry is None:
+            if self.__owners:
+                owner = self.__owners[-1]
+                number = self.__owned.get(id(owner), 0)
+                self.__owned[id(owner)] = number + 1
+                identifier = self.identifier(owner) + \
+                    _encode_identifier(number, '_')
+            else:
+                identifier = _encode_identifier(len(self.__allocated), 'd')
+            entry = (component, identifier)
+            self.__identifiers[id(component)] = entry
+            self.__allocated.append(component)
+        return entry[1]
+
+    def assign(self, component, identifier):
+        """Gives the web component the identifier, unless it has one."""
+        if id(component) not in self.__identifiers:
+            self.__identifiers[id(component)] = (component, identifier)
+            self.__allocated.append(component)
+
+    def enter(self, component):
+        """Makes the web component the innermost owner."""
+        self.identifier(component)
+        self.__owners.append(component)
+
+    def leave(self, component):
+        """Removes the web component from the owners."""
+        for index in range(len(self.__owners) - 1, -1, -1):
+            if self.__owners[index] is component:
+                del self.__owners[index]
+                return
+
+
+def render_options():
+    """Gets the render options in effect.
+
+    Returns:
+        RenderOptions: The current render options.
+    """
+    return _options.get(_default_options)
+
+
+def render_scope():
+    """Gets the identifier scope of the deterministic render in progress.
+
+    Returns:
+        obj: The identifier scope or `None` if no deterministic render is
+            in progress.
+    """
+    return _scope.get()
+
+
+def set_render_options(**options):
+    """Sets the default render options for the whole process.
+
+    >>> set_render_options(compact=True)
+
+    Args:
+        **options (dict): The render options to change (see `RenderOptions`).
+    """
+    global _default_options
+    _default_options = _default_options._replace(**options)
+
+
+@contextlib.contextmanager
+def _rendering(options, scope):
+    options_token = _options.set(options)
+    scope_token = _scope.set(scope)
+    try:
+        yield
+    finally:
+        _scope.reset(scope_token)
+        _options.reset(options_token)
+
+
+def _enter(options):
+    """Resolves the render options and the identifier scope to apply."""
+    options = render_options()._replace(**options)
+    scope = None
+    if options.deterministic:
+        scope = _scope.get() or _IdentifierScope()
+    return options, scope
+
+
+@contextlib.contextmanager
+def rendering(**options):
+    """Changes the render options within the `with` block.
+
+    If the `deterministic` option is on, all the web components rendered
+    within the block share the same identifier scope (a new one is started,
+    unless a deterministic render is already in progress).
+
+    >>> with rendering(compact=True):
+    >>>     html = str(page)
+
+    Args:
+        **options (dict): The render options to change (see `RenderOptions`).
+    """
+    with _rendering(*_enter(options)):
+        yield
+
+
+def iter_rendering(chunks, **options):
+    """Applies the render options to the chunks produced by an iterator.
+
+    Unlike the `rendering` context manager, the options are applied only
+    while the next chunk is produced, so it is safe to use with generators
+    which consumed lazily (or not till the end). All the chunks share the
+    same identifier scope.
+
+    Args:
+        chunks (iterator): The rendered chunks.
+        **options (dict): The render options to change (see `RenderOptions`).
+
+    Yields:
+        str: The rendered chunks.
+    """
+    options, scope = _enter(options)
+    chunks = iter(chunks)
+    while True:
+        with _rendering(options, scope):
+            token = _in_render.set(True)
+            try:
+                chunk = next(chunks, None)
+            finally:
+                _in_render.reset(token)
+        if chunk is None:
+            return
+        yield chunk
+
 
 def attr(name, value):
     """Makes a HTML tag attribute.
@@ -18,23 +234,22 @@ def attr(name, value):
     Returns:
         result (str): The constructed attribute.
     """
-    if value is not None:
-        if isinstance(value, bool):
-            return name if value else ''
-        else:
-            if isinstance(value, str):
-                if len(value.strip()) > 0:
-                    return '%s="%s"' % (name, value.strip())
-            elif isinstance(value, int):
-                return '%s=%d' % (name, value)
-            else:
-                raise TypeError(
-                    'Unsupported type of attribute value. '
-                    'Attribute type can be either <str> or <int>, '
-                    f'but got "{type(value)}".'
-                )
-
-    return ''
+    if value is None:
+        return ''
+    if isinstance(value, str):
+        value = value.strip()
+        if value:
+            return '%s="%s"' % (name, value)
+        return ''
+    if isinstance(value, bool):
+        return name if value else ''
+    if isinstance(value, int):
+        return '%s=%d' % (name, value)
+    raise TypeError(
+        'Unsupported type of attribute value. '
+        'Attribute type can be either <str> or <int>, '
+        f'but got "{type(value)}".'
+    )
 
 
 def inject(*components):
@@ -55,5 +270,358 @@ def inject(*components):
     return ''. join(map(str, filter(None, components)))
 
 
+def iter_inject(*components):
+    """Injects web components chunk by chunk.
+
+    This is a streaming counterpart of the `inject` function. Instead of
+    building a single string, it yields the rendered chunks of every
+    component in the document order. Web components are rendered using
+    their `iter_render` method, so large nested components never need
+    to be fully rendered in memory.
+
+    >>> ''.join(iter_inject(
+    >>>    '<snap>a</snap>',
+    >>>    '<snap>b</snap>'
+    >>> ))
+    >>> <snap>a</snap><snap>b</snap>
+
+    Args:
+        components (WebComponents): The web components to inject.
+
+    Yields:
+        str: The rendered chunks of the injected web components.
+    """
+    for component in filter(None, components):
+        if _streamed(component):
+            yield from component.iter_render()
+        else:
+            yield str(component)
+
+
+def _streamed(component):
+    """Checks whether a component is rendered chunk by chunk.
+
+    The web components rendered as a single chunk (see the `_streamed`
+    attribute of `WebComponent`) are rendered with `str` right away.
+    """
+    streamed = getattr(component, '_streamed', None)
+    if streamed is None:
+        return hasattr(component, 'iter_render')
+    return streamed
+
+
 def tag(name, attrs, inner):
-    return f'<{name} {" ".join(attrs)}>{inner}</{name}>'
+    # The empty attributes are skipped, so they do not leave whitespaces.
+    attrs = ' '.join(filter(None, attrs))
+    if attrs:
+        return f'<{name} {attrs}>{inner}</{name}>'
+    return f'<{name}>{inner}</{name}>'
+
+
+class Template:
+    """A precompiled markup template.
+
+    The template markup is compiled just once (on the first use) into static
+    chunks and slots, so rendering is just filling slots in and joining the
+    chunks together. The markup is dedented while compiling and the leading
+    and trailing whitespaces are reduced to a single new line (so adjacent
+    inline elements are still separated as they are in the hand-written
+    markup).
+
+    A compact version of the markup is compiled as well. It is used when the
+    `compact` render option is on (see the `rendering` function): all the
+    whitespace runs are reduced to a single space (except the whitespaces
+    inside `<pre>`, `<textarea>` and `<script>` elements), whitespaces in
+    front of empty attributes are dropped and the trailing whitespaces of
+    the content slot values are merged with the ones following the slots.
+
+    There are two kinds of slots:
+        `{name}` - a content slot, which value is injected as it is (see the
+        `inject` function for details; `None` is rendered as an empty string);
+        `{attribute=name}` - an attribute slot, which value is rendered using
+        the `attr` function.
+
+    Literal curly brackets must be doubled `{{` and `}}`.
+
+    >>> Template('''
+    >>>     <a {id=identifier}>{inner}</a>
+    >>> ''').render(identifier='a1', inner='Home')
+    >>> <a id="a1">Home</a>
+
+    Args:
+        markup (str): The template markup.
+    """
+
+    __TOKENS = re.compile(r'(\{\{|\}\}|\{[^{}]*\})')
+    __SLOT = re.compile(r'^\{(?:([A-Za-z][\w-]*)=)?([A-Za-z_]\w*)\}$')
+    __VERBATIM = re.compile(
+        r'(<(pre|textarea|script)\b[^>]*>)(.*?)(</\2\s*>)',
+        re.DOTALL | re.IGNORECASE
+    )
+    __WHITESPACES = re.compile(r'\s+')
+
+    def __init__(self, markup):
+        self.__markup = markup
+        self.__parts = None
+        self.__slots = None
+        self.__spaced = None
+        self.__trimmed = None
+
+    @staticmethod
+    def __split(markup):
+        """Splits markup into static parts and slots."""
+        parts, slots = [], []
+        static = ''
+        for token in Template.__TOKENS.split(markup):
+            if token == '{{':
+                static += '{'
+            elif token == '}}':
+                static += '}'
+            elif token.startswith('{'):
+                match = Template.__SLOT.match(token)
+                if match is None:
+                    raise ValueError(f'Invalid template slot: {token};')
+                parts.append(static)
+                static = ''
+                slots.append((len(parts), match.group(2), match.group(1)))
+                parts.append('')
+            else:
+                static += token
+        parts.append(static)
+        return parts, slots
+
+    @staticmethod
+    def __compact(markup):
+        """Normalizes whitespaces in markup."""
+        chunks = Template.__VERBATIM.split(markup)
+        # The split result is [text, open tag, tag name, content, close tag,
+        # text, ...], so only the element content is kept as it is (unless
+        # it is a blank content of an element other than textarea).
+        for index, chunk in enumerate(chunks):
+            if index % 5 == 3:
+                if chunk.isspace() and \
+                        chunks[index - 1].lower() != 'textarea':
+                    chunks[index] = ''
+            elif index % 5 != 2:
+                chunks[index] = Template.__WHITESPACES.sub(' ', chunk)
+        # The tag names are dropped once the contents are handled.
+        del chunks[2::5]
+        return ''.join(chunks)
+
+    @staticmethod
+    def __expressions(parts, slots, compact):
+        """Makes an f-string expression filling the slots in."""
+        parts, spaced, trimmed = list(parts), set(), dict()
+        expressions = dict()
+        for index, name, attribute in slots:
+            if attribute is None:
+                expressions[index] = (
+                    f'{name} if {name}.__class__ is str '
+                    f'else _content({name})'
+                )
+                if compact and parts[index + 1].startswith(' '):
+                    # The whitespace behind a content is merged with the
+                    # trailing whitespace of the content (if any).
+                    parts[index + 1] = parts[index + 1][1:]
+                    # A trimmed content always ends with a whitespace.
+                    trimmed[index] = parts[index - 1].endswith(' ') or (
+                        not parts[index - 1] and index - 2 in trimmed
+                    )
+                    expressions[index] = (
+                        f'_trimmed({expressions[index]}, {trimmed[index]})'
+                    )
+            elif compact and parts[index - 1].endswith(' '):
+                # The whitespace in front of an attribute is emitted only
+                # along with the attribute itself.
+                parts[index - 1] = parts[index - 1][:-1]
+                spaced.add(index)
+                expressions[index] = (
+                    f"'' if {name} is None or {name} is False "
+                    f"else _spaced(attr({attribute!r}, {name}))"
+                )
+            else:
+                # The missing and false attributes are rendered as empty
+                # strings (see the `attr` function) without calling it.
+                expressions[index] = (
+                    f"'' if {name} is None or {name} is False "
+                    f"else attr({attribute!r}, {name})"
+                )
+        chunks = []
+        for index, part in enumerate(parts):
+            if index in expressions:
+                chunks.append(f'f"{{{expressions[index]}}}"')
+            elif part:
+                part = part.replace('{', '{{').replace('}', '}}')
+                chunks.append(f'f{part!r}')
+        return ' '.join(chunks) or repr(''), parts, spaced, trimmed
+
+    def __compile(self):
+        markup = dedent(self.__markup)
+        if markup[:1].isspace():
+            markup = '\n' + markup.lstrip()
+        if markup[-1:].isspace():
+            markup = markup.rstrip() + '\n'
+        parts, slots = Template.__split(markup)
+        # A leading whitespace is dropped in the compact version, the
+        # trailing one is enough to separate adjacent elements.
+        compact_parts, compact_slots = Template.__split(
+            Template.__compact(markup.lstrip())
+        )
+
+        # The render function is generated as f-string expressions, so
+        # filling slots in costs no more than a hand-written f-string.
+        names = list(dict.fromkeys(name for _, name, _ in slots))
+        expression, parts, spaced, trimmed = Template.__expressions(
+            parts, slots, False
+        )
+        compact_expression, compact_parts, compact_spaced, compact_trimmed = \
+            Template.__expressions(compact_parts, compact_slots, True)
+        source = (
+            f'def render({"".join(f"{name}=None, " for name in names)}):\n'
+            f'    if _options.get(_default_options).compact:\n'
+            f'        return {compact_expression}\n'
+            f'    return {expression}\n'
+        )
+        # The function is bound to this module globals, so it sees the
+        # current default render options.
+        namespace = dict()
+        exec(source, globals(), namespace)
+
+        self.__parts = (parts, compact_parts)
+        self.__slots = (slots, compact_slots)
+        self.__spaced = (spaced, compact_spaced)
+        self.__trimmed = (trimmed, compact_trimmed)
+        # From now on the compiled function is called directly.
+        self.render = namespace['render']
+
+    def compile(self):
+        """Compiles the template (unless it is compiled already).
+
+        The references to the `render` method taken before the template is
+        compiled keep calling the generic method, so the code calling the
+        template repeatedly should take the compiled function returned here.
+
+        Returns:
+            func: The compiled render function.
+        """
+        if self.__parts is None:
+            self.__compile()
+        return self.render
+
+    def render(self, **values):
+        """Renders the template.
+
+        Args:
+            **values (dict): The slot values, the missing values are treated
+                as `None`.
+
+        Returns:
+            str: The rendered markup.
+        """
+        return self.compile()(**values)
+
+    def iter_render(self, **values):
+        """Renders the template chunk by chunk.
+
+        Web components filling content slots are rendered using their
+        `iter_render` method (see the `iter_inject` function for details).
+
+        Args:
+            **values (dict): The slot values, the missing values are treated
+                as `None`.
+
+        Yields:
+            str: The rendered chunks.
+        """
+        if self.__parts is None:
+            self.__compile()
+        compact = render_options().compact
+        parts = self.__parts[compact]
+        spaced = self.__spaced[compact]
+        trimmed = self.__trimmed[compact]
+        position = 0
+        for index, name, attribute in self.__slots[compact]:
+            yield parts[position]
+            position = index + 1
+            value = values.get(name)
+            if attribute is not None:
+                if index in spaced:
+                    yield _spaced(attr(attribute, value))
+                else:
+                    yield attr(attribute, value)
+            elif index in trimmed:
+                yield from _iter_trimmed(_iter_content(value), trimmed[index])
+            else:
+                yield from _iter_content(value)
+        yield parts[position]
+
+
+def _render_template(template, streamed, **values):
+    """Renders a template as a whole or chunk by chunk.
+
+    The web components rendering as a whole (rather than streaming their
+    chunks) render the web components they are made of with `str` too,
+    which is much cheaper than joining the chunks of all of them.
+    """
+    if streamed:
+        return template.iter_render(**values)
+    return template.render(**values)
+
+
+def _iter_content(value):
+    """Renders a template content slot value chunk by chunk."""
+    if isinstance(value, (list, tuple, types.GeneratorType)):
+        for component in value:
+            if not component:
+                continue
+            if _streamed(component):
+                yield from component.iter_render()
+            else:
+                yield str(component)
+    elif _streamed(value):
+        yield from value.iter_render()
+    else:
+        yield _content(value)
+
+
+def _spaced(attribute):
+    """Prefixes a non-empty attribute with a space."""
+    return f' {attribute}' if attribute else ''
+
+
+def _trimmed(content, spaced):
+    """Ends a content with a single whitespace.
+
+    A blank content is dropped altogether if it follows a whitespace.
+    """
+    content = content.rstrip(_TRAILING_WHITESPACES)
+    if content or not spaced:
+        return content + ' '
+    return ''
+
+
+def _iter_trimmed(chunks, spaced):
+    """Ends the content chunks with a single whitespace (see `_trimmed`)."""
+    blank = True
+    pending = ''
+    for chunk in chunks:
+        stripped = chunk.rstrip(_TRAILING_WHITESPACES)
+        if stripped:
+            yield pending + stripped
+            blank = False
+            pending = chunk[len(stripped):]
+        else:
+            pending += chunk
+    if not blank or not spaced:
+        yield ' '
+
+
+def _content(value):
+    """Renders a template content slot value."""
+    if value is None:
+        return ''
+    elif isinstance(value, str):
+        return value
+    elif isinstance(value, (list, tuple, types.GeneratorType)):
+        return inject(*value)
+    return str(value)
@@ -0,0 +1,193 @@
+/*
+ * Applies a row-level patch made by `Table.diff` to a rendered table.
+ *
+ * The patch removes, replaces, moves and inserts the table body rows
+ * matched by their `data-key` attributes.
+ */
+function bootwrapPatchTable(patch) {
+    var table = document.getElementById(patch.target);
+    if (!table) {
+        return;
+    }
+    var body = table.tBodies[0] || table.createTBody();
+    var rows = {};
+    Array.prototype.forEach.call(body.rows, function (row) {
+        rows[row.dataset.key] = row;
+    });
+
+    function parse(html) {
+        var container = document.createElement('tbody');
+        container.innerHTML = html;
+        return container.firstElementChild;
+    }
+
+    patch.removed.forEach(function (key) {
+        if (rows[key]) {
+            rows[key].remove();
+            delete rows[key];
+        }
+    });
+    patch.changed.forEach(function (change) {
+        var row = parse(change[1]);
+        if (rows[change[0]]) {
+            rows[change[0]].replaceWith(row);
+            rows[change[0]] = row;
+        }
+    });
+    /* Every moved row goes before its next kept row, and every added row
+       before its next row, so they are placed from the last one. */
+    patch.moved.slice().reverse().forEach(function (move) {
+        var next = move[1] === null ? null : rows[move[1]] || null;
+        if (rows[move[0]]) {
+            body.insertBefore(rows[move[0]], next);
+        }
+    });
+    patch.added.slice().reverse().forEach(function (addition) {
+        var row = parse(addition[1]);
+        var next = addition[2] === null ? null : rows[addition[2]] || null;
+        body.insertBefore(row, next);
+        rows[addition[0]] = row;
+    });
+}
+
+/*
+ * Refreshes a web component with its fragment rendered by the server.
+ *
+ * The fragment is fetched from the URL registered by `register_fragments`
+ * and replaces the element with the web component identifier, so the web
+ * component markup must have a single root element.
+ */
+function bootwrapRefresh(identifier, url) {
+    return fetch(url + '/' + encodeURIComponent(identifier)).then(
+        function (response) {
+            if (!response.ok) {
+                throw new Error(response.statusText);
+            }
+            return response.text();
+        }
+    ).then(function (html) {
+        var element = document.getElementById(identifier);
+        if (element) {
+            var template = document.createElement('template');
+            template.innerHTML = html.trim();
+            element.replaceWith(template.content);
+        }
+    });
+}
+
+/*
+ * Applies a patch made by the `bootwrap.patch.diff` function.
+ *
+ * All the patched elements are looked up before changing any of them, so
+ * the patches address the elements as they were in the previous render.
+ */
+function bootwrapPatch(patch) {
+    var target = document.getElementById(patch.target);
+    if (!target) {
+        return;
+    }
+
+    function parse(html) {
+        var template = document.createElement('template');
+        template.innerHTML = html;
+        return template.content;
+    }
+
+    function sibling(element, index) {
+        for (var i = 0; i < index && element; i++) {
+            element = element.nextElementSibling;
+        }
+        return element;
+    }
+
+    var elements = patch.patches.map(function (change) {
+        var element = sibling(
+            target, change.path.length ? change.path[0] : 0
+        );
+        for (var i = 1; i < change.path.length && element; i++) {
+            element = element.children[change.path[i]];
+        }
+        return element;
+    });
+
+    patch.patches.forEach(function (change, i) {
+        var element = elements[i];
+        if (!element) {
+            return;
+        }
+        if (change.op === 'replace' && change.path.length === 0) {
+            var removed = [];
+            for (var k = 0; k < change.count && element; k++) {
+                removed.push(element);
+                element = element.nextElementSibling;
+            }
+            removed[0].parentNode.insertBefore(parse(change.html), removed[0]);
+            removed.forEach(function (node) {
+                node.remove();
+            });
+        } else if (change.op === 'replace') {
+            element.replaceWith(parse(change.html));
+        } else if (change.op === 'attributes') {
+            Object.keys(change.set).forEach(function (name) {
+                element.setAttribute(name, change.set[name]);
+            });
+            change.remove.forEach(function (name) {
+                element.removeAttribute(name);
+            });
+        } else if (change.op === 'text') {
+            var texts = Array.prototype.filter.call(
+                element.childNodes,
+                function (node) {
+                    return node.nodeType === 3;
+                }
+            );
+            if (texts[change.index]) {
+                texts[change.index].nodeValue = change.text;
+            }
+        }
+    });
+}
+
+/*
+ * Subscribes to a live-update channel registered by `register_channel`.
+ *
+ * A `fragment` event replaces the element of the web component (or its
+ * outermost element, if the web component is wrapped) or appends it to
+ * the parent element, when the page does not have it yet. The toasts
+ * arriving this way are shown. A `patch` event is applied by the
+ * `bootwrapPatch` function.
+ */
+function bootwrapSubscribe(url) {
+    var source = new EventSource(url);
+    source.addEventListener('fragment', function (event) {
+        var data = JSON.parse(event.data);
+        var template = document.createElement('template');
+        template.innerHTML = data.html.trim();
+        var content = template.content;
+        var toasts = content.querySelectorAll('.toast');
+        var element = document.getElementById(data.target);
+        if (element) {
+            var inner = content.getElementById(data.target);
+            while (inner && inner.parentNode !== content) {
+                inner = inner.parentNode;
+                element = element.parentNode;
+            }
+            element.replaceWith(content);
+        } else {
+            var parent = data.parent ?
+                document.getElementById(data.parent) : document.body;
+            if (parent) {
+                parent.appendChild(content);
+            }
+        }
+        if (window.bootstrap) {
+            Array.prototype.forEach.call(toasts, function (toast) {
+                window.bootstrap.Toast.getOrCreateInstance(toast).show();
+            });
+        }
+    });
+    source.addEventListener('patch', function (event) {
+        bootwrapPatch(JSON.parse(event.data));
+    });
+    return source;
+}
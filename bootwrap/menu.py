@@ -2,10 +2,11 @@
 A menu bar.
 """
 
-from .components import Text, inject
+from .components import Text, WebComponent
+from .components.utils import Template
 
 
-class Menu:
+class Menu(WebComponent):
     """A web component for a menu bar at the page top.
 
     Args:
@@ -19,6 +20,34 @@ class Menu:
             specific actions such as login, logout, etc. (default=None).
     """
 
+    _TEMPLATE = Template('''
+        <nav class="navbar navbar-expand-lg navbar-dark bg-dark fixed-top">
+            {logo}
+            {brand}
+            <button class="navbar-toggler"
+                type="button" data-bs-toggle="collapse"
+                data-bs-target="#menu"
+                aria-controls="menu"
+                aria-expanded="false"
+                aria-label="Toggle menu">
+                <span class="navbar-toggler-icon"></span>
+            </button>
+
+            <div class="collapse navbar-collapse" id="menu">
+                <ul class="navbar-nav me-auto">
+                    {anchors}
+                </ul>
+                {actions}
+            </div>
+        </nav>
+    ''')
+
+    _ANCHOR = Template('''
+        <li class="nav-item">
+            {anchor}
+        </li>
+    ''')
+
     def __init__(self, logo=None, brand=None, anchors=None, actions=None):
         super().__init__()
         self.__logo = logo
@@ -35,41 +64,24 @@ class Menu:
         self.__actions = actions
 
     def __str__(self):
-        anchors = ''
+        anchors = None
         if self.__anchors is not None:
-            anchors = '\n'.join([
-                f'''
-                    <li class="nav-item">
-                        {inject(anchor.ms(2).add_classes('nav-link'))}
-                    </li>
-                '''
+            anchors = [
+                Menu._ANCHOR.render(
+                    anchor=anchor._variant().ms(2).add_classes('nav-link')
+                )
                 for anchor in self.__anchors
-            ])
+            ]
 
-        actions = ''
+        actions = None
         if self.__actions is not None:
-            actions = '\n'.join([
-                f'''{inject(action.ms(2))}'''
-                for action in self.__actions
-            ])
-
-        return f'''
-            <nav class="navbar navbar-expand-lg navbar-dark bg-dark fixed-top">
-                {inject(self.__logo, self.__brand)}
-                <button class="navbar-toggler"
-                    type="button" data-bs-toggle="collapse"
-                    data-bs-target="#menu"
-                    aria-controls="menu"
-                    aria-expanded="false"
-                    aria-label="Toggle menu">
-                    <span class="navbar-toggler-icon"></span>
-                </button>
+            actions = [
+                action._variant().ms(2) for action in self.__actions
+            ]
 
-                <div class="collapse navbar-collapse" id="menu">
-                    <ul class="navbar-nav me-auto">
-                        {anchors}
-                    </ul>
-                    {actions}
-                </div>
-            </nav>
-        '''
+        return Menu._TEMPLATE.render(
+            logo=self.__logo,
+            brand=self.__brand,
+            anchors=anchors,
+            actions=actions
+        )
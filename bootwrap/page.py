@@ -2,10 +2,47 @@
 A web-page.
 """
 
-import re
-import pkg_resources
+import hashlib
+import functools
 
-from .components import Link, Javascript, inject
+from . import assets
+from .components import (
+    Link,
+    Javascript,
+    inject,
+    iter_inject,
+    iter_components
+)
+from .components import base
+from .components.utils import (
+    Template,
+    iter_rendering,
+    render_options,
+    render_scope,
+    rendering,
+    _rendering,
+    _IdentifierScope
+)
+
+
+# Collects CSS supporting Bootstrap styles.
+_DEFAULT_LINKS = (
+    Link('https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css'),                 # NOQA
+    Link('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css'),               # NOQA
+    Link('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/default.min.css')        # NOQA
+)
+
+# Collects JS scripts supporting JQuery and code highlights.
+_DEFAULT_SCRIPTS = (
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/jquery/3.7.1/jquery.min.js'),                  # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/popper.js/2.11.8/umd/popper.min.js'),          # NOQA
+    Javascript('https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js'),       # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js'),        # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/python.min.js'), # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/json.min.js'),   # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/yaml.min.js'),   # NOQA
+    Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/bash.min.js')    # NOQA
+)
 
 
 class Page:
@@ -19,15 +56,73 @@ class Page:
             representing the page resources (default=None).
         menu (Menu): The page top level menu (default=None).
         container (WebComponent): The page container (default=None).
+        compact (bool): If `True` the page markup is whitespace-normalized,
+            if `False` it is not, and if `None` the process-wide render
+            options apply (default=None, see the `set_render_options`
+            function).
+        deterministic (bool): If `True` the page is rendered
+            deterministically, so rendering it again produces exactly the same
+            markup (as long as the page content is the same), if `False` it
+            is not, and if `None` the process-wide render options apply
+            (default=None).
+        assets_url (str): The URL path the generic page assets are served
+            from (see the `bootwrap.serving.register_assets` function). If
+            specified the page references the content-hashed assets instead
+            of embedding them (default=None).
+        live (bool): If `True` the page includes the live-update script
+            applying the table patches, fragments and patches pushed
+            by the server (the `bootwrapPatchTable`, `bootwrapRefresh`,
+            `bootwrapPatch` and `bootwrapSubscribe` functions), if `False`
+            it does not (default=False).
+
+    The page shell (everything but the container) is rendered once per
+    distinct page configuration and render options, so rendering a page
+    mostly comes down to rendering its container (and its menu and
+    resources, which are a part of the shell cache key).
+
+    The page indexes its web components by their identifiers on the first
+    fragment render, so any of them can be rendered alone (see
+    `render_fragment`).
     """
 
+    _HEAD = Template('''
+        <!DOCTYPE html>
+        <html lang="en">
+            <head>
+                <meta charset="utf-8"/>
+                <meta name="viewport"
+                    content="width=device-width, initial-scale=1,
+                    shrink-to-fit=no"/>
+                {links}
+                {scripts}
+                {title}
+            </head>
+            <body>
+                {menu}
+                <div class="container-fluid">
+    ''')
+
+    _TAIL = Template('''
+                </div>
+            </body>
+            {script}
+            <style>{style}</style>
+        </html>
+    ''')
+
+    _SCRIPT = Template('''<script>{script}</script>''')
+
     def __init__(
             self,
             favicon=None,
             resources=None,
             title=None,
             menu=None,
-            container=None
+            container=None,
+            compact=None,
+            deterministic=None,
+            assets_url=None,
+            live=False
     ):
         super().__init__()
         self.__favicon = favicon
@@ -35,7 +130,18 @@ class Page:
         self.__title = title
         self.__menu = menu
         self.__container = container
+        self.__assets_url = assets_url
+        self.__live = live
+        self.__options = {
+            name: value
+            for name, value in [
+                ('compact', compact), ('deterministic', deterministic)
+            ]
+            if value is not None
+        }
         self.__vars = {}
+        self.__index = None
+        self.__scope = None
 
     def __html__(self):
         """Renders an HTML page."""
@@ -81,97 +187,283 @@ class Page:
             self.__vars['--body-background-attachment'] = attachment
         return self
 
+    def etag(self):
+        """Makes an entity tag for the page.
+
+        The page is rendered deterministically and hashed chunk by chunk, so
+        the page markup is never held in memory as a whole. The entity tag
+        matches the page markup as long as the page itself is rendered
+        deterministically.
+
+        Returns:
+            str: The entity tag (without quotes).
+
+        Example:
+            from flask import Response, request
+
+            page = Page(..., deterministic=True)
+
+            @app.route('/')
+            def index():
+                etag = page.etag()
+                if etag in request.if_none_match:
+                    return Response(status=304)
+                response = Response(page.iter_render(), mimetype='text/html')
+                response.set_etag(etag)
+                return response
+        """
+        digest = hashlib.blake2b(digest_size=16)
+        chunks = iter_rendering(
+            self.__iter_chunks(), **{**self.__options, 'deterministic': True}
+        )
+        for chunk in chunks:
+            digest.update(chunk.encode('utf-8'))
+        return digest.hexdigest()
+
+    def iter_render(self):
+        """Renders an HTML page chunk by chunk.
+
+        The page `<head>` is yielded first, followed by the menu and the
+        container chunks in the document order, so the generator can be
+        passed directly to a streaming HTTP response. This way a browser
+        starts receiving the page before the whole container is rendered.
+
+        Example:
+            from flask import Response
+
+            @app.route('/')
+            def index():
+                page = Page(...)
+                return Response(page.iter_render(), mimetype='text/html')
+        """
+        # The render options apply (and a deterministic render starts) only
+        # while the page chunks are produced.
+        return iter_rendering(self.__iter_chunks(), **self.__options)
+
+    def __iter_chunks(self):
+        """Renders the page chunks with the render options in effect."""
+        links, scripts, menu, container = roots = self.__roots()
+        scope = render_scope()
+        if scope is not None:
+            # The page web components get the identifiers in the tree order,
+            # so they can be resolved without rendering (see
+            # `render_fragment`).
+            for component in iter_components(*roots):
+                scope.identifier(component)
+
+        # The resources and the menu are rendered first (in the document
+        # order), so the shell is cached by their markup and changing them
+        # after a render is reflected in the next one.
+        resources = None
+        if links or scripts:
+            resources = (inject(*links), inject(*scripts))
+        if menu is not None:
+            menu = str(menu)
+        head, tail = _render_shell(
+            self.__favicon,
+            resources,
+            self.__title,
+            menu,
+            tuple(self.__vars.items()),
+            self.__assets_url,
+            self.__live,
+            render_options()
+        )
+
+        yield head
+        yield from iter_inject(container)
+        yield tail
+
+    def __roots(self):
+        """Gets the page resources (links and scripts), menu and container."""
+        links, scripts = [], []
+        if self.__resources:
+            links, scripts = _split_resources(self.__resources)
+        return links, scripts, self.__menu, self.__container
+
+    async def arender(self):
+        """Renders an HTML page resolving its async values first.
+
+        All the `AsyncValue` placeholders of the page web components are
+        resolved concurrently (see the `WebComponent.arender` method).
+
+        Returns:
+            str: The page HTML.
+
+        Example:
+            @app.route('/')
+            async def index():
+                return await Page(...).arender()
+        """
+        await base.resolve(self.__menu, self.__container)
+        return str(self)
+
+    def render_fragment(self, identifier):
+        """Renders a web component of the page by its identifier.
+
+        Only the web component subtree is rendered, so a part of the page
+        (a dialog, a navigation tab, a table, etc.) can be refreshed without
+        rendering the whole page. Within a deterministically rendered page
+        the identifiers are the ones allocated by the page render, so they
+        are the same for every page instance with the same content.
+
+        Args:
+            identifier (str): The web component identifier.
+
+        Returns:
+            str: The web component HTML.
+
+        Raises:
+            KeyError: If the page has no web component with the identifier.
+
+        Example:
+            page = Page(..., container=Panel(..., table))
+
+            html = page.render_fragment(table.identifier)
+        """
+        options = render_options()._replace(**self.__options)
+        if options.deterministic:
+            component, scope = self.__resolve_deterministic(identifier)
+            with _rendering(options, scope):
+                return str(component)
+
+        component = None
+        if self.__index is not None:
+            component = self.__index.get(identifier)
+        if component is None:
+            # The index is (re)built on the first use and whenever the page
+            # web components may have been changed in place.
+            self.__index = _index(self.__menu, self.__container)
+            component = self.__index[identifier]
+        with rendering(**self.__options):
+            return str(component)
+
+    def __resolve_deterministic(self, identifier):
+        """Resolves an identifier allocated by a deterministic page render.
+
+        The identifiers are allocated by walking the page web components
+        the same way the page render does, without rendering them. The walk
+        is repeated only if any web component has changed since the
+        previous one.
+        """
+        roots = self.__roots()
+        if self.__scope is None or \
+                base._tree_version(*roots) > self.__scope[0]:
+            version = next(base._version_counter)
+            self.__scope = (version, list(iter_components(*roots)))
+        # The scope is new for every fragment, so the identifiers of the web
+        # components made while rendering are the same as in the page.
+        scope = _IdentifierScope()
+        index = {
+            scope.identifier(component): component
+            for component in self.__scope[1]
+        }
+        return index[identifier], scope
+
     def __str__(self):
         """Renders an HTML page."""
+        return ''.join(self.iter_render())
 
-        # Adds customer defined resources which could be CSS or JS files.
-        if self.__resources:
-            links = []
-            scripts = []  
-            for resource in self.__resources:
-                if isinstance(resource, Link):
-                    links.append(resource)
-                elif isinstance(resource, Javascript):
-                    scripts.append(resource)
-                else:
-                    raise TypeError(
-                        'Page resource must be either <class "Link"> or '
-                        f'<class "Javascript">, but got: {type(resource)};',
-                    )
+
+def _index(*roots):
+    """Indexes the web components by their identifiers."""
+    return {
+        component.identifier: component
+        for component in iter_components(*roots)
+    }
+
+
+def _split_resources(resources):
+    """Splits the page resources into the links and the scripts."""
+    links = []
+    scripts = []
+    for resource in resources:
+        if isinstance(resource, Link):
+            links.append(resource)
+        elif isinstance(resource, Javascript):
+            scripts.append(resource)
         else:
-            # Collects CSS supporting Bootstrap styles.
-            links = [
-                Link('https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/css/bootstrap.min.css'),                 # NOQA
-                Link('https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.5.2/css/all.min.css'),               # NOQA
-                Link('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/styles/default.min.css')        # NOQA
-            ]
+            raise TypeError(
+                'Page resource must be either <class "Link"> or '
+                f'<class "Javascript">, but got: {type(resource)};',
+            )
+    return links, scripts
 
-            # Collects JS scripts supporting JQuery and code highlights.
-            scripts = [
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/jquery/3.7.1/jquery.min.js'),                  # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/popper.js/2.11.8/umd/popper.min.js'),          # NOQA
-                Javascript('https://cdn.jsdelivr.net/npm/bootstrap@5.3.3/dist/js/bootstrap.bundle.min.js'),       # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/highlight.min.js'),        # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/python.min.js'), # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/json.min.js'),   # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/yaml.min.js'),   # NOQA
-                Javascript('https://cdnjs.cloudflare.com/ajax/libs/highlight.js/11.9.0/languages/bash.min.js')    # NOQA
-            ]
 
-        # Collects FABICON showing in tab.
-        if self.__favicon:
-            links.append(Link(self.__favicon, 'icon', 'image/x-icon'))
-
-        # Sets the page title.
-        title = None
-        if self.__title:
-            if isinstance(self.__title, str):
-                title = f'''<title>{self.__title}</title>'''
-            else:
-                raise TypeError(
-                    f'Page title must be <str>, but got: {type(title)};',
-                )
-
-        # Creates inner style which will be embedded in the page.
-        root_vars = ''
-        if len(self.__vars) > 0:
-            for name, value in self.__vars.items():
-                root_vars += '%s: %s;' % (name, value)
-        root_vars += '--container-margin-top: %s' % (
-            '90px' if self.__menu else '10px'
+@functools.lru_cache(maxsize=128)
+def _render_shell(favicon, resources, title, menu, variables, assets_url,
+                  live, options):
+    """Renders a page shell.
+
+    Args:
+        favicon (str): The page favicon.
+        resources (tuple): The page links and scripts markup, the default
+            resources are used if `None`.
+        title (str): The page title.
+        menu (str): The page menu markup.
+        variables (tuple): The page CSS variables (name/value pairs).
+        assets_url (str): The URL path to the generic page assets.
+        live (bool): Whether to include the live-update script.
+        options (RenderOptions): The render options (only used as a part of
+            the cache key).
+
+    Returns:
+        tuple: The page head and tail markup.
+    """
+    # Adds customer defined resources which could be CSS or JS files.
+    if resources:
+        links, scripts = map(list, resources)
+    else:
+        links = list(_DEFAULT_LINKS)
+        scripts = list(_DEFAULT_SCRIPTS)
+
+    # Collects FABICON showing in tab.
+    if favicon:
+        links.append(Link(favicon, 'icon', 'image/x-icon'))
+
+    # Sets the page title.
+    if title:
+        if isinstance(title, str):
+            title = f'''<title>{title}</title>'''
+        else:
+            raise TypeError(
+                f'Page title must be <str>, but got: {type(title)};',
+            )
+
+    # Creates inner style which will be embedded in the page.
+    root_vars = ''
+    for name, value in variables:
+        root_vars += '%s: %s;' % (name, value)
+    root_vars += '--container-margin-top: %s' % (
+        '90px' if menu else '10px'
+    )
+    root_vars = ':root{' + root_vars + '}'
+
+    # The generic assets are either embedded in the page or referenced
+    # by their content-hashed file names.
+    names = [assets.GENERIC_JS]
+    if live:
+        names.append(assets.LIVE_JS)
+    if assets_url is None:
+        inner_style = root_vars + assets.load(assets.GENERIC_CSS)
+        inner_script = [
+            Page._SCRIPT.render(script=assets.load(name)) for name in names
+        ]
+    else:
+        url = assets_url.rstrip('/')
+        links.append(
+            Link(f'{url}/{assets.hashed_name(assets.GENERIC_CSS)}')
         )
-        root_vars = ':root{' + root_vars + '}'
-
-
-        inner_style = pkg_resources.resource_string(__name__, 'generic.css').\
-            decode('utf-8')
-        inner_style = root_vars + inner_style
-        inner_style = re.sub('\\n|\\s\\s+', ' ', inner_style)
-
-        # Creates inner script which will be embedded in the page.
-        inner_script = pkg_resources.resource_string(__name__, 'generic.js').\
-            decode('utf-8')
-        inner_script = re.sub('\\n|\\s\\s+', ' ', inner_script)
-
-        return f'''
-            <!DOCTYPE html>
-            <html lang="en">
-                <head>
-                    <meta charset="utf-8"/>
-                    <meta name="viewport"
-                        content="width=device-width, initial-scale=1,
-                        shrink-to-fit=no"/>
-                    {inject(*links)}
-                    {inject(*scripts)}
-                    {inject(title)}
-                </head>
-                <body>
-                    {inject(self.__menu)}
-                    <div class="container-fluid">
-                        {inject(self.__container)}
-                    </div>
-                </body>
-                <script>{inner_script}</script>
-                <style>{inner_style}</style>
-            </html>
-        '''
+        inner_style = root_vars
+        inner_script = [
+            Javascript(f'{url}/{assets.hashed_name(name)}') for name in names
+        ]
+
+    head = Page._HEAD.render(
+        links=links,
+        scripts=scripts,
+        title=title,
+        menu=menu
+    )
+    tail = Page._TAIL.render(script=inner_script, style=inner_style)
+    return head, tail
@@ -0,0 +1,209 @@
+"""
+Patches updating rendered web components in a browser.
+"""
+
+import json
+from html.parser import HTMLParser
+
+
+# The elements which never have content nor end tag.
+_VOID_ELEMENTS = frozenset([
+    'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+    'link', 'meta', 'param', 'source', 'track', 'wbr'
+])
+
+# The approximate size of a replace patch without its markup.
+_REPLACE_COST = 40
+
+
+class _Element:
+    """A parsed HTML element.
+
+    Only the element children are addressed by patches (so whitespace
+    between elements does not matter), while the text children are kept
+    to be compared and addressed by their order among text nodes.
+    """
+
+    __slots__ = ('tag', 'attrs', 'elements', 'texts', 'kinds', 'start', 'end')
+
+    def __init__(self, tag, attrs, start):
+        self.tag = tag
+        self.attrs = attrs
+        self.elements = []
+        self.texts = []
+        self.kinds = []
+        self.start = start
+        self.end = start
+
+    @property
+    def signature(self):
+        return self.tag, self.attrs.get('id')
+
+
+class _Parser(HTMLParser):
+    """Parses HTML markup into a tree of `_Element`s."""
+
+    def __init__(self, markup):
+        super().__init__()
+        self.__markup = markup
+        self.__lines = [0]
+        for line in markup.splitlines(keepends=True):
+            self.__lines.append(self.__lines[-1] + len(line))
+        self.root = _Element(None, {}, 0)
+        self.__stack = [self.root]
+        self.feed(markup)
+        self.close()
+        self.root.end = len(markup)
+
+    def __offset(self):
+        line, column = self.getpos()
+        return self.__lines[line - 1] + column
+
+    def handle_starttag(self, tag, attrs):
+        start = self.__offset()
+        values = {}
+        for name, value in attrs:
+            values.setdefault(name, value or '')
+        element = _Element(tag, values, start)
+        parent = self.__stack[-1]
+        parent.elements.append(element)
+        parent.kinds.append(tag)
+        if tag in _VOID_ELEMENTS:
+            element.end = start + len(self.get_starttag_text())
+        else:
+            self.__stack.append(element)
+
+    def handle_startendtag(self, tag, attrs):
+        self.handle_starttag(tag, attrs)
+        if tag not in _VOID_ELEMENTS:
+            self.handle_endtag(tag)
+
+    def handle_endtag(self, tag):
+        for depth in range(len(self.__stack) - 1, 0, -1):
+            if self.__stack[depth].tag == tag:
+                end = self.__markup.index('>', self.__offset()) + 1
+                for element in self.__stack[depth:]:
+                    element.end = end
+                del self.__stack[depth:]
+                return
+
+    def handle_data(self, data):
+        parent = self.__stack[-1]
+        if parent.kinds and parent.kinds[-1] is None:
+            # Adjacent text is a single text node.
+            parent.texts[-1] += data
+        else:
+            parent.texts.append(data)
+            parent.kinds.append(None)
+
+
+def _markup(value):
+    return value if isinstance(value, str) else str(value)
+
+
+def diff(previous, current):
+    """Makes a patch updating the previous render to the current one.
+
+    Both renders are parsed and compared element by element. Elements of
+    different tags or identifiers are replaced as a whole, the others are
+    patched by changing their attributes and text, so only the changed
+    nodes are sent to a browser. A subtree is replaced as well whenever
+    its patches would be bigger than its markup. The patch is applied by
+    the `bootwrapPatch` script function (see the `Page` `live` argument).
+
+    Render the web components deterministically (see the `rendering`
+    function), so the identifiers are stable between renders and the
+    unchanged web components produce no patches.
+
+    Args:
+        previous (str|WebComponent): The previous render of a web
+            component (or the web component to render).
+        current (str|WebComponent): The current render of the web
+            component (or the web component to render).
+
+    Returns:
+        dict: The patch with the `target` identifier of the previous render
+            root element and the list of `patches`. Every patch has the `op`
+            (`replace`, `attributes` or `text`) and the `path` of element
+            indexes from the target (the first index counts the target
+            siblings) along with the `html`, the `set` and `remove`
+            attributes or the text `index` and `text` respectively.
+
+    Example:
+        from bootwrap import Text, rendering
+        from bootwrap.patch import diff
+
+        with rendering(deterministic=True):
+            previous = str(panel)
+        ...
+        with rendering(deterministic=True):
+            current = str(panel)
+        patch = diff(previous, current)
+    """
+    previous = _markup(previous)
+    current = _markup(current)
+    old = _Parser(previous).root
+    new = _Parser(current).root
+    if len(old.elements) == 0 or 'id' not in old.elements[0].attrs:
+        raise ValueError(
+            'The previous render must start with an identified element;'
+        )
+
+    # The text between the root elements is not addressable.
+    patches = None
+    if [a.tag for a in old.elements] == [b.tag for b in new.elements]:
+        patches = []
+        for index, (a, b) in enumerate(zip(old.elements, new.elements)):
+            patches.extend(_diff_element(a, b, [index], current))
+    if patches is None:
+        patches = [{
+            'op': 'replace',
+            'path': [],
+            'count': len(old.elements),
+            'html': current.strip()
+        }]
+    return {'target': old.elements[0].attrs['id'], 'patches': patches}
+
+
+def _diff_children(old, new, path, markup):
+    """Compares the element children.
+
+    Returns:
+        list: The patches or `None` if the element must be replaced.
+    """
+    if old.kinds != new.kinds:
+        return None
+    patches = []
+    for index, (a, b) in enumerate(zip(old.texts, new.texts)):
+        if a != b:
+            patches.append({
+                'op': 'text', 'path': path, 'index': index, 'text': b
+            })
+    for index, (a, b) in enumerate(zip(old.elements, new.elements)):
+        patches.extend(_diff_element(a, b, path + [index], markup))
+    return patches
+
+
+def _diff_element(old, new, path, markup):
+    html = markup[new.start:new.end]
+    replace = [{'op': 'replace', 'path': path, 'html': html}]
+    if old.signature != new.signature:
+        return replace
+
+    patches = _diff_children(old, new, path, markup)
+    if patches is None:
+        return replace
+    changed = {
+        name: value for name, value in new.attrs.items()
+        if old.attrs.get(name) != value
+    }
+    removed = [name for name in old.attrs if name not in new.attrs]
+    if changed or removed:
+        patches.insert(0, {
+            'op': 'attributes', 'path': path, 'set': changed,
+            'remove': removed
+        })
+    if len(patches) > 1 and \
+            len(json.dumps(patches)) > len(html) + _REPLACE_COST:
+        return replace
+    return patches
@@ -0,0 +1,333 @@
+"""
+Flask helpers for serving pages.
+"""
+
+import json
+import queue
+import threading
+
+from flask import Response, abort
+
+from . import assets
+from .components.utils import (
+    render_options,
+    _rendering,
+    _IdentifierScope
+)
+from .page import Page
+from .patch import diff
+
+
+def register_assets(app, url_path='/bootwrap', max_age=31536000):
+    """Registers a Flask route serving the generic page assets.
+
+    The assets are served by their content-hashed file names with long-lived
+    cache headers, so browsers and CDNs download them just once per release.
+    Pass the returned URL path to the `Page` `assets_url` argument to make
+    pages reference the assets instead of embedding them.
+
+    Args:
+        app (Flask): The Flask application.
+        url_path (str): The URL path to serve the assets from
+            (default='/bootwrap').
+        max_age (int): The cache lifetime in seconds (default=31536000).
+
+    Returns:
+        str: The URL path the assets are served from.
+
+    Example:
+        from flask import Flask
+        from bootwrap import Page
+        from bootwrap.serving import register_assets
+
+        app = Flask(__name__)
+        assets_url = register_assets(app)
+
+        @app.route('/')
+        def index():
+            return str(Page(..., assets_url=assets_url))
+    """
+    url_path = url_path.rstrip('/')
+
+    def bootwrap_asset(filename):
+        name = assets.find(filename)
+        if name is None:
+            abort(404)
+        response = Response(assets.load(name), mimetype=assets.MIMETYPES[name])
+        response.headers['Cache-Control'] = \
+            f'public, max-age={max_age}, immutable'
+        return response
+
+    app.add_url_rule(
+        f'{url_path}/<filename>', 'bootwrap_asset', bootwrap_asset
+    )
+    return url_path
+
+
+def register_fragments(app, rule, page, endpoint=None):
+    """Registers a Flask route rendering the page fragments.
+
+    The route renders a single web component of the page by its identifier
+    (see the `Page.render_fragment` method), so a part of the page can be
+    refreshed with AJAX (see the `bootwrapRefresh` script function of the
+    live-update page script) at a fraction of the whole page rendering
+    cost. If the page is made per request, render it deterministically, so
+    the identifiers stay the same between the page instances.
+
+    Args:
+        app (Flask): The Flask application.
+        rule (str): The URL rule the fragments are served from, the
+            `/<identifier>` part is appended to it.
+        page (Page|func): The page or the function making the page, which
+            is called with the URL rule variables.
+        endpoint (str): The route endpoint name
+            (default='bootwrap_fragment:{rule}').
+
+    Returns:
+        str: The URL path the fragments are served from.
+
+    Example:
+        from flask import Flask
+        from bootwrap import Page
+        from bootwrap.serving import register_fragments
+
+        app = Flask(__name__)
+
+        def portfolio():
+            return Page(..., deterministic=True, live=True)
+
+        register_fragments(app, '/portfolio/fragments', portfolio)
+    """
+    rule = rule.rstrip('/')
+
+    def bootwrap_fragment(identifier, **variables):
+        target = page if isinstance(page, Page) else page(**variables)
+        try:
+            html = target.render_fragment(identifier)
+        except KeyError:
+            abort(404)
+        response = Response(html, mimetype='text/html')
+        response.headers['Cache-Control'] = 'no-cache'
+        return response
+
+    app.add_url_rule(
+        f'{rule}/<identifier>',
+        endpoint or f'bootwrap_fragment:{rule}',
+        bootwrap_fragment
+    )
+    return rule
+
+
+class Channel:
+    """A live-update channel pushing web components to browsers.
+
+    Every browser subscribed to the channel (see the `register_channel`
+    function and the `bootwrapSubscribe` script function) receives the
+    published web components as Server-Sent Events. A web component is
+    sent to a browser as a whole fragment the first time, and as a patch
+    (see the `bootwrap.patch.diff` function) from then on, so only the
+    changed nodes go over the wire. A browser which does not keep up with
+    the events is disconnected, and resynchronized on reconnection.
+
+    Publish web components living as long as the channel (rather than the
+    ones made per request), so their identifiers are the same as in the
+    pages the browsers have loaded. The published web components are
+    rendered deterministically, keeping their own identifiers, so the
+    nested web components get the same identifiers on every publish and
+    only the actual changes make patches.
+
+    Args:
+        heartbeat (float): The seconds between keep-alive comments sent
+            to idle browsers (default=15).
+        backlog (int): The number of events a browser may lag behind
+            (default=256).
+
+    Example:
+        from flask import Flask
+        from bootwrap import Page, Table
+        from bootwrap.serving import Channel, register_channel
+
+        app = Flask(__name__)
+        prices = Table(...)
+        channel = Channel()
+        url = register_channel(app, '/live', channel)
+
+        def on_price_change():
+            channel.publish(prices)
+    """
+
+    def __init__(self, heartbeat=15, backlog=256):
+        self.__heartbeat = heartbeat
+        self.__backlog = backlog
+        self.__lock = threading.Lock()
+        self.__subscribers = []
+        self.__renders = {}
+        # The locks serializing the publishes by web component identifiers.
+        self.__publishing = {}
+
+    class Subscriber:
+        """A browser subscribed to a channel."""
+
+        def __init__(self, backlog):
+            self.events = queue.Queue(backlog)
+            self.synced = set()
+            self.closed = False
+
+    def subscribe(self):
+        """Subscribes to the channel.
+
+        Returns:
+            Channel.Subscriber: The subscriber to pass to `stream`.
+        """
+        subscriber = Channel.Subscriber(self.__backlog)
+        with self.__lock:
+            self.__subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber):
+        """Unsubscribes from the channel.
+
+        Args:
+            subscriber (Channel.Subscriber): The subscriber.
+        """
+        with self.__lock:
+            if subscriber in self.__subscribers:
+                self.__subscribers.remove(subscriber)
+
+    def publish(self, component, parent=None):
+        """Pushes a web component to all the subscribed browsers.
+
+        The concurrent publishes of a web component are sent in the order
+        they are rendered in, while the other web components are rendered
+        and sent meanwhile.
+
+        Args:
+            component (WebComponent): The web component to push.
+            parent (str): The identifier of the element to append the web
+                component to, if a browser page does not have it yet
+                (default=None, the page body).
+        """
+        with self.__lock:
+            publishing = self.__publishing.setdefault(
+                component.identifier, threading.Lock()
+            )
+        with publishing:
+            self.__publish(component, parent)
+
+    def __publish(self, component, parent):
+        identifier, html = _render_published(component)
+        fragment = _event('fragment', {
+            'target': identifier, 'html': html, 'parent': parent
+        })
+        with self.__lock:
+            previous = self.__renders.get(identifier)
+            self.__renders[identifier] = html
+            patch = None
+            if previous is not None:
+                try:
+                    changes = diff(previous, html)
+                    if len(changes['patches']) > 0:
+                        patch = _event('patch', changes)
+                except ValueError:
+                    # The web component root is not identified.
+                    patch = fragment
+            for subscriber in list(self.__subscribers):
+                if identifier not in subscriber.synced:
+                    self.__send(subscriber, fragment)
+                    subscriber.synced.add(identifier)
+                elif patch is not None:
+                    self.__send(subscriber, patch)
+
+    def __send(self, subscriber, event):
+        try:
+            subscriber.events.put_nowait(event)
+        except queue.Full:
+            subscriber.closed = True
+            self.__subscribers.remove(subscriber)
+
+    def stream(self, subscriber=None):
+        """Streams the channel events.
+
+        The stream ends once the subscriber is disconnected. The generator
+        is meant to be passed to a streaming HTTP response with the
+        `text/event-stream` MIME type.
+
+        Args:
+            subscriber (Channel.Subscriber): The subscriber (default=None,
+                a new subscriber is made on the first iteration).
+
+        Returns:
+            generator: The Server-Sent Events.
+        """
+        if subscriber is None:
+            subscriber = self.subscribe()
+        try:
+            yield 'retry: 3000\n\n'
+            while not subscriber.closed:
+                try:
+                    yield subscriber.events.get(timeout=self.__heartbeat)
+                except queue.Empty:
+                    yield ': keep-alive\n\n'
+        finally:
+            self.unsubscribe(subscriber)
+
+
+def _render_published(component):
+    """Renders a published web component deterministically.
+
+    The web component keeps its identifier, while the nested ones get the
+    identifiers derived from it (see the `rendering` function).
+    """
+    identifier = component.identifier
+    scope = _IdentifierScope()
+    scope.assign(component.__dict__.get('_variant_of', component), identifier)
+    options = render_options()._replace(deterministic=True)
+    with _rendering(options, scope):
+        return identifier, str(component)
+
+
+def _event(name, data):
+    return f'event: {name}\ndata: {json.dumps(data)}\n\n'
+
+
+def register_channel(app, rule, channel, endpoint=None):
+    """Registers a Flask route streaming a live-update channel.
+
+    Args:
+        app (Flask): The Flask application.
+        rule (str): The URL rule the channel events are served from.
+        channel (Channel): The channel.
+        endpoint (str): The route endpoint name
+            (default='bootwrap_channel:{rule}').
+
+    Returns:
+        str: The URL path to subscribe to.
+
+    Example:
+        from flask import Flask
+        from bootwrap import Page, Javascript
+        from bootwrap.serving import Channel, register_channel
+
+        app = Flask(__name__)
+        channel = Channel()
+        url = register_channel(app, '/live', channel)
+
+        page = Page(
+            ...,
+            container=Panel(
+                ...,
+                Javascript(script=f'bootwrapSubscribe("{url}");')
+            ),
+            live=True
+        )
+    """
+    def bootwrap_channel():
+        response = Response(channel.stream(), mimetype='text/event-stream')
+        response.headers['Cache-Control'] = 'no-cache'
+        response.headers['X-Accel-Buffering'] = 'no'
+        return response
+
+    app.add_url_rule(
+        rule, endpoint or f'bootwrap_channel:{rule}', bootwrap_channel
+    )
+    return rule
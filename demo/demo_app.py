@@ -94,6 +94,29 @@ def load_user(user_id):
     return USERS.get_user_by_id(user_id)
 
 
+# The menu is shared between pages, so the page shell is rendered once.
+MENU = bw.Menu(
+    logo=bw.Image(
+        'logo.png',
+        width=32,
+        alt='PiggyBank Logo'
+    ),
+    brand=bw.Text('PiggyBank').as_strong().as_light(),
+    anchors=[
+        bw.Anchor('Portfolio').link('/portfolio'),
+        bw.Anchor('Discovery').link('/discovery'),
+        bw.Anchor('Account').link('/account'),
+        bw.Anchor('Activity').link('/activity')
+    ],
+    actions=[
+        bw.Button('Logout').
+        as_outline().
+        as_light().
+        link('/logout')
+    ]
+)
+
+
 class DemoPage(bw.Page):
     """A demo web-pages.
 
@@ -105,26 +128,7 @@ class DemoPage(bw.Page):
     def __init__(self, title, *wc):
         super().__init__(
             favicon='favicon.ico',
-            menu=bw.Menu(
-                logo=bw.Image(
-                    'logo.png',
-                    width=32,
-                    alt='PiggyBank Logo'
-                ),
-                brand=bw.Text('PiggyBank').as_strong().as_light(),
-                anchors=[
-                    bw.Anchor('Portfolio').link('/portfolio'),
-                    bw.Anchor('Discovery').link('/discovery'),
-                    bw.Anchor('Account').link('/account'),
-                    bw.Anchor('Activity').link('/activity')
-                ],
-                actions=[
-                    bw.Button('Logout').
-                    as_outline().
-                    as_light().
-                    link('/logout')
-                ]
-            ),
+            menu=MENU,
             container=bw.Panel(bw.Text(title).as_heading(1), *wc)
         )
 
@@ -302,6 +306,9 @@ def account(action=None):
 def activity():
     return Markup(
         DemoPage(
-            'My Activity', ActivityTable(current_user)
+            'My Activity',
+            ActivityTable(current_user).paginate(
+                10, page=request.args.get('page', 1, type=int)
+            )
         )
     )
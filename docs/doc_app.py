@@ -4,9 +4,14 @@ The web-application for showing the project documentation.
 
 import os
 import re
+import json
+import hashlib
+import inspect
+import functools
+import tempfile
 import textwrap
 import pathlib
-import glob
+from concurrent import futures
 
 import yaml
 
@@ -15,7 +20,13 @@ from markupsafe import Markup
 from bs4 import BeautifulSoup
 
 import bootwrap as bw
-from .doc_generator import generate_class_doc
+from .doc_generator import (
+    generate_class_doc,
+    class_source_hash,
+    take_unsaved,
+    save_cache,
+    _file_hash
+)
 
 
 doc_app = Flask(__name__, static_folder='.', static_url_path='')
@@ -498,6 +509,29 @@ def generate_documentation(config):
         )
 
 
+# The menu is shared between pages, so the page shell is rendered once.
+MENU = bw.Menu(
+    logo=bw.Image(
+        'logo.png',
+        width=32,
+        alt='Bootwrap Logo'
+    ),
+    brand=bw.Text('Bootwrap').as_strong().as_light(),
+    anchors=[
+        bw.Anchor('Home').link('/'),
+        bw.Anchor('Layout').link('/layout'),
+        bw.Anchor('Base').link('/base'),
+        bw.Anchor('Components').link('/components')
+    ],
+    actions=[
+        bw.Button('GitHub').
+        as_outline().
+        as_light().
+        link('https://github.com/mmgalushka/bootwrap')
+    ]
+)
+
+
 class GenericPage(bw.Page):
     """A documentation web-pages.
 
@@ -509,78 +543,322 @@ class GenericPage(bw.Page):
     def __init__(self, content):
         super().__init__(
             favicon='favicon.ico',
-            menu=bw.Menu(
-                logo=bw.Image(
-                    'logo.png',
-                    width=32,
-                    alt='Bootwrap Logo'
-                ),
-                brand=bw.Text('Bootwrap').as_strong().as_light(),
-                anchors=[
-                    bw.Anchor('Home').link('/'),
-                    bw.Anchor('Layout').link('/layout'),
-                    bw.Anchor('Base').link('/base'),
-                    bw.Anchor('Components').link('/components')
-                ],
-                actions=[
-                    bw.Button('GitHub').
-                    as_outline().
-                    as_light().
-                    link('https://github.com/mmgalushka/bootwrap')
-                ]
-            ),
+            menu=MENU,
             container=generate_documentation(content)
         )
 
 
+CONFIG_DIR = pathlib.Path(__file__).parent / 'config'
+
+# The documentation pages (the configuration names) and their HTML-files.
+PAGES = {
+    'home': 'index.html',
+    'layout': 'layout.html',
+    'base': 'base.html',
+    'components': 'components.html'
+}
+
+# The build manifest keeps the inputs hash of every built HTML-file.
+BUILD_MANIFEST = '.build.json'
+
+BOOTWRAP_DIR = pathlib.Path(bw.__file__).parent
+
+# The bootwrap sources every page depends on (relative to `BOOTWRAP_DIR`):
+# the web components core, the page shell and the assets it links to.
+SHARED_SOURCES = (
+    '__init__.py',
+    'assets.py',
+    'page.py',
+    'menu.py',
+    'generic.css',
+    'generic.js',
+    'live.js',
+    'components/__init__.py',
+    'components/base.py',
+    'components/utils.py',
+    'components/parallel.py'
+)
+
+# The bootwrap names this module renders every page with.
+_SHELL_NAMES = frozenset(
+    re.findall(r'\bbw\.(\w+)', pathlib.Path(__file__).read_text())
+)
+
+# The names imported from bootwrap by the examples.
+_IMPORT_PATTERN = re.compile(
+    r'from\s+bootwrap\s+import\s+(\([^)]*\)|[^\n]*)'
+)
+
+
+# The parsed configurations: the page name -> (mtime, config).
+_configs = {}
+
+# The rendered pages: the page name -> (inputs key, page).
+_pages = {}
+
+# The bootwrap names imported by the examples of a source file:
+# the file path -> (hash, names).
+_imported_names = {}
+
+
+def _load_config(name):
+    """Loads a page configuration along with its file modification time."""
+    path = CONFIG_DIR / f'{name}.yaml'
+    mtime = path.stat().st_mtime_ns
+    cached = _configs.get(name)
+    if cached is None or cached[0] != mtime:
+        with path.open('r') as file:
+            cached = mtime, yaml.load(file, Loader=yaml.FullLoader)
+        _configs[name] = cached
+    return cached
+
+
+def load_config(name):
+    """Loads a documentation page configuration.
+
+    The parsed configuration is cached until the configuration file is
+    modified.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        config (list|dict): The page configuration.
+    """
+    return _load_config(name)[1]
+
+
+def _imports(path):
+    """Finds the bootwrap names imported by the examples of a file."""
+    digest = _file_hash(path)
+    cached = _imported_names.get(path)
+    if cached is None or cached[0] != digest:
+        with open(path, 'r') as file:
+            names = {
+                name
+                for imported in _IMPORT_PATTERN.findall(file.read())
+                for name in re.findall(r'\w+', imported)
+            }
+        cached = digest, names
+        _imported_names[path] = cached
+    return cached[1]
+
+
+def page_classes(name):
+    """Finds the bootwrap classes a documentation page renders.
+
+    These are the documented classes, the classes imported by the page
+    examples and by the examples of the documented classes, and the
+    classes this module renders every page with.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        classes (list): The bootwrap classes.
+    """
+    config = load_config(name)
+    partitions = config.values() if isinstance(config, dict) else [config]
+    # The documented classes can be nested (ex. `Deck.Card`).
+    documented = [
+        functools.reduce(getattr, doc['class'].split('.'), bw)
+        for partition in partitions for doc in partition if 'class' in doc
+    ]
+
+    names = _imports(CONFIG_DIR / f'{name}.yaml') | _SHELL_NAMES
+    for c in documented:
+        names |= _imports(inspect.getsourcefile(c))
+    classes = {
+        getattr(bw, name) for name in names
+        if isinstance(getattr(bw, name, None), type)
+    }
+    classes.update(documented)
+    return sorted(classes, key=lambda c: f'{c.__module__}.{c.__qualname__}')
+
+
+def sources_hash(name):
+    """Computes the hash of the sources a documentation page depends on.
+
+    The sources are the shared bootwrap sources (see `SHARED_SOURCES`) and
+    the sources of the classes the page renders (see the `page_classes`
+    and `class_source_hash` functions), so a page is not rebuilt when a
+    web component it does not render is modified.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        digest (str): The sources hash.
+    """
+    digest = hashlib.sha256()
+    for source in SHARED_SOURCES:
+        digest.update(source.encode())
+        digest.update(_file_hash(BOOTWRAP_DIR / source).encode())
+    for c in page_classes(name):
+        digest.update(class_source_hash(c).encode())
+    return digest.hexdigest()
+
+
+def render_page(name):
+    """Renders a documentation page.
+
+    The rendered page is cached until its configuration file or any of
+    the sources it depends on (see the `sources_hash` function) is
+    modified, so the repeated requests of the documentation preview are
+    answered from memory.
+
+    The generated class-documentations are not saved to the on-disk
+    cache (see the `save_cache` function), so the pages can be rendered
+    by concurrent processes.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        page (Markup): The rendered page.
+    """
+    mtime, config = _load_config(name)
+    key = mtime, sources_hash(name)
+    cached = _pages.get(name)
+    if cached is None or cached[0] != key:
+        cached = key, Markup(GenericPage(config))
+        _pages[name] = cached
+    return cached[1]
+
+
+def _preview_page(name):
+    """Renders a page of the documentation preview and saves the generated
+    class-documentations."""
+    page = render_page(name)
+    save_cache()
+    return page
+
+
 @ doc_app.route('/')
 def home():
-    path = pathlib.Path(__file__).parent / 'config/home.yaml'
-    with path.open('r') as file:
-        content = yaml.load(file, Loader=yaml.FullLoader)
-    return Markup(GenericPage(content))
+    return _preview_page('home')
 
 
 @ doc_app.route('/layout')
 def layout():
-    path = pathlib.Path(__file__).parent / 'config/layout.yaml'
-    with path.open('r') as file:
-        content = yaml.load(file, Loader=yaml.FullLoader)
-    return Markup(GenericPage(content))
+    return _preview_page('layout')
 
 
 @ doc_app.route('/base')
 def base():
-    path = pathlib.Path(__file__).parent / 'config/base.yaml'
-    with path.open('r') as file:
-        content = yaml.load(file, Loader=yaml.FullLoader)
-    return Markup(GenericPage(content))
+    return _preview_page('base')
 
 
 @ doc_app.route('/components')
 def components():
-    path = pathlib.Path(__file__).parent / 'config/components.yaml'
-    with path.open('r') as file:
-        content = yaml.load(file, Loader=yaml.FullLoader)
-    return Markup(GenericPage(content))
-
-
-def doc_to_html():
-    current_dir = pathlib.Path(__file__).parent
-    for path in glob.glob(str(current_dir / '*.html')):
-        os.remove(path)
-
-    def save_page(filename, page):
-        page = str(page).\
-            replace('href="/"', 'href="index.html"').\
-            replace('href="/layout"', 'href="layout.html"').\
-            replace('href="/base"', 'href="base.html"').\
-            replace('href="/components"', 'href="components.html"')
-        with (current_dir / filename).open('w') as file:
-            soup = BeautifulSoup(page, features='html.parser')
-            file.write(soup.prettify())
-
-    save_page('index.html', home())
-    save_page('layout.html', layout())
-    save_page('base.html', base())
-    save_page('components.html', components())
+    return _preview_page('components')
+
+
+def page_hash(name):
+    """Computes the hash of a documentation page inputs.
+
+    The inputs are the page configuration, the sources the page depends
+    on (see the `sources_hash` function) and this module, so the page is
+    rebuilt whenever any of them changes.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        digest (str): The inputs hash.
+    """
+    digest = hashlib.sha256()
+    digest.update(pathlib.Path(__file__).read_bytes())
+    path = CONFIG_DIR / f'{name}.yaml'
+    digest.update(path.read_bytes())
+    digest.update(sources_hash(name).encode())
+    return digest.hexdigest()
+
+
+def build_page(name):
+    """Builds the static HTML-file content of a documentation page.
+
+    The links between the pages are replaced by the links between the
+    HTML-files.
+
+    Args:
+        name (str): The page (configuration) name.
+
+    Returns:
+        html (str): The HTML-file content.
+    """
+    page = str(render_page(name))
+    for other, filename in PAGES.items():
+        route = '/' if other == 'home' else f'/{other}'
+        page = page.replace(f'href="{route}"', f'href="{filename}"')
+    return BeautifulSoup(page, features='html.parser').prettify()
+
+
+def _build_page(name):
+    """Builds a page in a worker process.
+
+    The class-documentations generated for the page are returned to the
+    parent process, which saves them to the on-disk cache at once.
+    """
+    return build_page(name), take_unsaved()
+
+
+def _write(path, text):
+    """Writes a file atomically (it is never seen written partially)."""
+    with tempfile.NamedTemporaryFile(
+        'w', dir=path.parent, prefix=f'.{path.name}.', delete=False
+    ) as file:
+        file.write(text)
+    # The temporary files are private, while the documentation is public.
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, path)
+
+
+def doc_to_html(force=False, workers=None, directory=None):
+    """Builds the static HTML-files of the documentation.
+
+    The build is incremental: a page is rebuilt only if its inputs (see
+    the `page_hash` function) have changed since the previous build or
+    its HTML-file is missing. The changed pages are built in parallel
+    worker processes, and the class-documentations generated for them
+    are saved to the on-disk cache once all of them are built.
+
+    Args:
+        force (bool): If `True` rebuilds all the pages.
+        workers (int): The maximal number of worker processes (by default
+            the number of processors).
+        directory (str): The directory to build the HTML-files in (by
+            default the documentation directory).
+
+    Returns:
+        built (list): The names of the rebuilt pages.
+    """
+    current_dir = pathlib.Path(directory or pathlib.Path(__file__).parent)
+    manifest_path = current_dir / BUILD_MANIFEST
+    manifest = {}
+    if manifest_path.exists() and not force:
+        manifest = json.loads(manifest_path.read_text())
+
+    hashes = {name: page_hash(name) for name in PAGES}
+    changed = [
+        name for name, filename in PAGES.items()
+        if manifest.get(filename) != hashes[name]
+        or not (current_dir / filename).exists()
+    ]
+
+    entries = {}
+    if len(changed) > 1 and workers != 1:
+        with futures.ProcessPoolExecutor(max_workers=workers) as pool:
+            pages = []
+            for page, generated in pool.map(_build_page, changed):
+                pages.append(page)
+                entries.update(generated)
+    else:
+        pages = [build_page(name) for name in changed]
+    save_cache(entries)
+
+    for name, page in zip(changed, pages):
+        _write(current_dir / PAGES[name], page)
+        manifest[PAGES[name]] = hashes[name]
+    _write(manifest_path, json.dumps(manifest, indent=4, sort_keys=True))
+    return changed
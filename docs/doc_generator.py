@@ -2,18 +2,45 @@
 Generator of documentation from the Pydoc-strings.
 """
 
+import os
 import re
+import sys
+import json
+import hashlib
 import inspect
+import pathlib
+import tempfile
 import types
 import enum
 
 
-def prettify(text):
-    pattern = re.compile(r"\`[A-Za-z._\(\)]+\`")
+_CODE_PATTERN = re.compile(r"\`[A-Za-z._\(\)]+\`")
+
+_PARAM_PATTERN = re.compile(
+    r"\s*([\*A-Za-z_]+)\s*\(([A-Za-z_\|\.\<\>]+)\)\s*:\s*"
+)
+
+_SECTION_PATTERN = re.compile(
+    r"(?<=\s)(Args|Returns|Example|Demo)\s*:\n", flags=re.S
+)
+
+# The on-disk cache of the generated class-documentations.
+CACHE_PATH = pathlib.Path(__file__).parent / '.class_docs.json'
+
+# The class-documentations: the class path -> (source hash, doc).
+_class_docs = None
 
+# The class paths of the class-documentations missing in the on-disk cache.
+_unsaved = set()
+
+# The source files hashes: the file path -> (mtime, size, hash).
+_file_hashes = {}
+
+
+def prettify(text):
     p = 0
     new_text = ''
-    for m in pattern.finditer(text):
+    for m in _CODE_PATTERN.finditer(text):
         s, e = m.span()
         new_text += text[p:s]
         new_text += ('<code>' + m.group(0)[1:-1] + '</code>')
@@ -31,10 +58,8 @@ def get_params(text):
     Returns:
         parameters (list): The extracted parameters.
     """
-    pat = re.compile(r"\s*([\*A-Za-z_]+)\s*\(([A-Za-z_\|\.\<\>]+)\)\s*:\s*")
-
     tokens = []
-    for m in pat.finditer(text):
+    for m in _PARAM_PATTERN.finditer(text):
         s, e = m.span()
         name, type_ = m.group(1).strip(), m.group(2).strip()
         tokens.append((s, e, name, type_))
@@ -58,15 +83,11 @@ def get_sections(text):
     Returns:
         sections (list): The extracted sections.
     """
-    pattern = re.compile(
-        r"(?<=\s)(Args|Returns|Example|Demo)\s*:\n", flags=re.S
-    )
-
     sections = []
     if text is not None:
         tokens = []
         tokens.append((None, 0, 'Overview'))
-        for m in pattern.finditer(text):
+        for m in _SECTION_PATTERN.finditer(text):
             s, e = m.span()
             header = m.group(0)[:-2]
             tokens.append((s, e, header))
@@ -171,15 +192,122 @@ def generate_property_doc(p):
     }
 
 
+def _file_hash(path):
+    """Hashes a source file (rehashed only if the file is modified)."""
+    stat = os.stat(path)
+    cached = _file_hashes.get(path)
+    if cached is None or cached[:2] != (stat.st_mtime_ns, stat.st_size):
+        with open(path, 'rb') as file:
+            digest = hashlib.sha256(file.read()).hexdigest()
+        cached = stat.st_mtime_ns, stat.st_size, digest
+        _file_hashes[path] = cached
+    return cached[2]
+
+
+def class_source_hash(c):
+    """Computes the hash of a class source.
+
+    The hash covers the source files of the class and its base classes
+    (which the class inherits the constructor from) and of this generator.
+
+    Args:
+        c (class): The class to hash.
+
+    Returns:
+        digest (str): The source hash.
+    """
+    digest = hashlib.sha256(c.__qualname__.encode())
+    digest.update(_file_hash(__file__).encode())
+    for cls in c.__mro__:
+        path = getattr(sys.modules.get(cls.__module__), '__file__', None)
+        if path is not None:
+            digest.update(_file_hash(path).encode())
+    return digest.hexdigest()
+
+
+def _load_cache():
+    """Loads the on-disk cache of the class-documentations."""
+    try:
+        with CACHE_PATH.open('r') as file:
+            return {
+                name: tuple(entry) for name, entry in json.load(file).items()
+            }
+    except (OSError, ValueError):
+        return {}
+
+
+def take_unsaved():
+    """Takes the generated class-documentations missing in the on-disk cache.
+
+    The worker processes building documentation hand them over to the
+    parent process (see the `save_cache` function) instead of saving them.
+
+    Returns:
+        entries (dict): The cache entries by the class paths.
+    """
+    entries = {name: _class_docs[name] for name in _unsaved}
+    _unsaved.clear()
+    return entries
+
+
+def save_cache(entries=None):
+    """Saves the generated class-documentations to the on-disk cache.
+
+    The cache is merged with the one on the disk (which can be updated by
+    other processes building documentation) and replaced atomically.
+
+    Args:
+        entries (dict): The cache entries generated by other processes
+            (see the `take_unsaved` function) to save as well.
+    """
+    global _class_docs
+    if entries:
+        if _class_docs is None:
+            _class_docs = _load_cache()
+        _class_docs.update(entries)
+        _unsaved.update(entries)
+    if not _unsaved:
+        return
+    cache = _load_cache()
+    cache.update({name: _class_docs[name] for name in _unsaved})
+    with tempfile.NamedTemporaryFile(
+        'w', dir=CACHE_PATH.parent, prefix=f'{CACHE_PATH.name}.',
+        delete=False
+    ) as file:
+        json.dump(cache, file)
+    # The temporary files are private, while the cache is shared.
+    os.chmod(file.name, 0o644)
+    os.replace(file.name, CACHE_PATH)
+    _unsaved.clear()
+
+
 def generate_class_doc(c):
     """Generates the specified class documentation from docstring.
 
+    The generated documentation is cached in memory and on the disk (see
+    the `save_cache` function) until the class source is modified (see
+    the `class_source_hash` function).
+
     Args:
         c (class): The class for generating documentation.
 
     Returns:
         doc (dict): The The docstring element arranged as a dictionary.
     """
+    global _class_docs
+    if _class_docs is None:
+        _class_docs = _load_cache()
+    name = f'{c.__module__}.{c.__qualname__}'
+    digest = class_source_hash(c)
+    cached = _class_docs.get(name)
+    if cached is None or cached[0] != digest:
+        cached = digest, _generate_class_doc(c)
+        _class_docs[name] = cached
+        _unsaved.add(name)
+    return cached[1]
+
+
+def _generate_class_doc(c):
     doc = parse_docstring(c.__doc__)
     methods = []
     for m in inspect.getmembers(c, predicate=inspect.isroutine):
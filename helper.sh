@@ -26,6 +26,8 @@ action_usage(){
     echo -e "   ${CMD}preview${NC} runs web-server with documentation preview;"
     echo -e "   ${CMD}docs${NC} generates documentation (HTML-pages);"
     echo -e "   ${CMD}demo${NC} runs web-server with showcase project;" 
+    echo -e "   ${CMD}bench${OPT} ...${NC} runs benchmarks against the baseline;"
+    echo -e "      ${OPT}--save ${NC}records a new baseline;"
     echo -e "   ${CMD}build${NC} generates distribution archives;"  
 }
 
@@ -80,6 +82,11 @@ action_demo(){
     python main.py demo
 }
 
+action_bench(){
+    source .venv/bin/activate
+    python -m benchmarks "$@"
+}
+
 action_build(){
     source .venv/bin/activate
     python -m build
@@ -104,6 +111,9 @@ case $1 in
     demo)
         action_demo
     ;;
+    bench)
+        action_bench ${@:2}
+    ;;
     build)
         action_build
     ;;
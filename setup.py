@@ -29,10 +29,10 @@ setuptools.setup(
         "Programming Language :: Python :: 3",
     ],
     package_dir={"": "."},
-    packages=setuptools.find_packages(where=".", exclude=["tests"]),
+    packages=setuptools.find_packages(where=".", exclude=["tests", "benchmarks"]),
     package_data={"bootwrap": ["*.css", "*.js"]},
     include_package_data=True,    
-    python_requires=">=3.6",
+    python_requires=">=3.7",
     use_scm_version=True,
     setup_requires=['setuptools_scm'],
 )
@@ -4,15 +4,25 @@ Test for bootwrap/components/base.py
 
 import pytest
 import re
+import asyncio
+import pickle
 
 from bootwrap import (
     WebComponent,
+    AsyncValue,
+    Deck,
+    List,
+    Page,
+    Panel,
+    Table,
+    Text,
     ActionMixin,
     AppearanceMixin,
     OutlineMixin,
     AvailabilityMixin,
     Action,
-    ClassMixin
+    ClassMixin,
+    rendering
 )
 
 
@@ -22,10 +32,18 @@ def tests_web_component():
         def __str__(self):
             return self.identifier
     wc = TestWebComponent()
-    regex = re.compile(r'^[a-f0-9]{8}-?[a-f0-9]{4}-?4[a-f0-9]{3}-?[89ab][a-f0-9]{3}-?[a-f0-9]{12}\Z', re.I) # NOQA
+    regex = re.compile(r'^w[a-z0-9]+\Z')
     match = regex.match(str(wc))
     assert bool(match)
 
+    # The identifier is allocated lazily, but once allocated it is stable,
+    # unique and shared with the web component variants.
+    other = TestWebComponent()
+    variant = other._variant()
+    assert wc.identifier == str(wc)
+    assert other.identifier != wc.identifier
+    assert variant.identifier == other.identifier
+
 
 @pytest.mark.base
 def tests_action_mixin():
@@ -128,3 +146,144 @@ def tests_class_mixin():
     assert "pe-2" in ClassMixin().pe(2).classes
     assert "px-2" in ClassMixin().px(2).classes
     assert "py-2" in ClassMixin().py(2).classes
+
+
+@pytest.mark.base
+def tests_web_component_memoized_render():
+    calls = []
+
+    class TestWebComponent(WebComponent, ClassMixin):
+        def __str__(self):
+            calls.append(self)
+            return f'<i class="{self.classes}"></i>'
+
+    wc = TestWebComponent().add_classes('a')
+    assert str(wc) == '<i class="a"></i>'
+    assert str(wc) == '<i class="a"></i>'
+    assert len(calls) == 1
+
+    # Changing the component state invalidates the memoized output.
+    wc.add_classes('b')
+    assert str(wc) == '<i class="a b"></i>'
+    assert len(calls) == 2
+
+    # Making or changing other web components does not.
+    TestWebComponent().add_classes('c')
+    assert str(wc) == '<i class="a b"></i>'
+    assert len(calls) == 2
+
+    # Changing a nested web component invalidates the enclosing one.
+    text = Text('sometext')
+    panel = Panel(text)
+    html = str(panel)
+    text.as_primary()
+    assert 'text-primary' in str(panel)
+    assert str(panel) == str(panel)
+    text.add_classes('someclass')
+    assert 'someclass' in str(panel) and html not in str(panel)
+
+    # The in-place data changes are seen only after invalidating.
+    rows = [['a', 1]]
+    table = Table(['A', 'B'], rows)
+
+    def cells():
+        return re.findall(r'<td[^>]*>\s*(\w+)', str(table))
+
+    assert cells() == ['a', '1']
+    rows[0][1] = 2
+    Text('sometext').as_primary()
+    assert cells() == ['a', '1']
+    table.invalidate()
+    assert cells() == ['a', '2']
+
+
+@pytest.mark.base
+def tests_web_component_temporary():
+    made = []
+
+    class TestWebComponent(WebComponent):
+        def __str__(self):
+            text = Text('sometext').as_primary()
+            made.append(text)
+            made.append(text._variant().ms(1))
+            return str(made[-1])
+
+    wc = TestWebComponent()
+    assert 'class="ms-1 text-primary"' in str(wc)
+
+    # The web components made while rendering are not tracked.
+    text, variant = made
+    assert isinstance(text, Text) and type(variant) is type(text)
+    assert '_state' not in text.__dict__
+    assert '_state' not in variant.__dict__
+    assert '_state' in Text('sometext').__dict__
+
+    # They are pickled as web components of the original class.
+    copied = pickle.loads(pickle.dumps(text))
+    assert type(copied) is Text and str(copied) == str(text)
+
+
+@pytest.mark.base
+def tests_class_mixin_compose_classes():
+    mixin = ClassMixin().add_classes('a b')
+    assert mixin._compose_classes('c', None, 'a d') == 'a b c d'
+    assert mixin.classes == 'a b'
+    assert ClassMixin()._compose_classes() is None
+
+
+@pytest.mark.base
+def tests_web_component_deterministic_identifier():
+    class TestWebComponent(WebComponent):
+        def __str__(self):
+            return self.identifier
+
+    wc = TestWebComponent()
+    with rendering(deterministic=True):
+        first = wc.identifier
+        assert wc._variant().identifier == first
+        assert TestWebComponent().identifier != first
+    with rendering(deterministic=True):
+        assert wc.identifier == first
+    assert wc.identifier != first
+
+
+@pytest.mark.base
+def tests_web_component_arender():
+    pending = []
+    overlap = []
+
+    async def fetch(value, delay=0.01):
+        # Counts the fetches awaited at the same time.
+        pending.append(value)
+        overlap.append(len(pending))
+        await asyncio.sleep(delay)
+        pending.remove(value)
+        return value
+
+    nested = AsyncValue(lambda: fetch(Text(AsyncValue(fetch('nested')))))
+    panel = Panel(
+        Deck(
+            Deck.Card(AsyncValue(fetch('title1')), marker='marker1'),
+            Deck.Card('title2', marker=AsyncValue(fetch('marker2')))
+        ),
+        List(List.Item('title3', description=AsyncValue(fetch('desc3')))),
+        Table(['A', 'B'], [[AsyncValue(fetch('cell')), 1]]),
+        nested
+    )
+    with pytest.raises(RuntimeError):
+        str(panel)
+
+    html = asyncio.run(panel.arender())
+    # The async values are resolved concurrently, except the nested one
+    # which is known only once its outer value is resolved.
+    assert max(overlap) == 5
+    assert not pending
+    for value in [
+        'title1', 'marker2', 'desc3', 'cell', 'nested', '<h5', 'text-muted'
+    ]:
+        assert value in html
+    assert str(panel) == html
+    assert asyncio.run(panel.arender()) == html
+
+    page = Page(container=Text(AsyncValue(fetch('pagetext', 0))))
+    assert 'pagetext' in asyncio.run(page.arender())
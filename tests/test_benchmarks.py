@@ -0,0 +1,80 @@
+"""
+Test for benchmarks/runner.py
+"""
+
+import pytest
+
+from benchmarks import (
+    WORKLOADS,
+    import_time,
+    run,
+    compare,
+    load_baseline,
+    save_baseline
+)
+
+
+@pytest.mark.benchmarks
+def test_run():
+    results = run(['table', 'list'], scale=0.001, repeat=1, min_time=0)
+    assert set(results) == {'table', 'list'}
+    for measured in results.values():
+        assert measured['seconds'] > 0
+        assert measured['peak_bytes'] > 0
+        assert measured['bytes'] > 0
+    with pytest.raises(ValueError):
+        run(['unknown'])
+
+    # The HTML size does not depend on the workloads run before.
+    alone = run(['list'], scale=0.001, repeat=1, min_time=0)
+    assert alone['list']['bytes'] == results['list']['bytes']
+    assert 'docs-components' in WORKLOADS
+
+
+@pytest.mark.benchmarks
+def test_import_time():
+    # The import time is compared with its budget by the benchmark suite
+    # only, as it depends on the machine load.
+    assert import_time(repeat=1) > 0
+    assert import_time('pass', repeat=1) == 0
+
+
+@pytest.mark.benchmarks
+def test_compare():
+    baseline = {'table': {'seconds': 1.0, 'peak_bytes': 100, 'bytes': 10}}
+    assert compare(
+        {'table': {'seconds': 1.1, 'peak_bytes': 100, 'bytes': 10}},
+        baseline
+    ) == []
+    assert compare(
+        {'list': {'seconds': 9.0, 'peak_bytes': 900, 'bytes': 90}},
+        baseline
+    ) == []
+    regressions = compare(
+        {'table': {'seconds': 1.5, 'peak_bytes': 100, 'bytes': 12}},
+        baseline,
+        threshold=0.1
+    )
+    assert len(regressions) == 2
+    assert regressions[0].startswith('table: seconds')
+    assert regressions[1].startswith('table: bytes')
+
+    # The HTML size must not drift in either direction.
+    regressions = compare(
+        {'table': {'seconds': 1.0, 'peak_bytes': 100, 'bytes': 9}},
+        baseline
+    )
+    assert regressions == ['table: bytes 9 != 10']
+
+
+@pytest.mark.benchmarks
+def test_baseline(tmp_path):
+    path = tmp_path / 'baseline.json'
+    save_baseline(path, {'table': {'seconds': 1.0}}, scale=0.5)
+    save_baseline(path, {'list': {'seconds': 2.0}}, scale=0.5)
+    assert load_baseline(path, scale=0.5) == {
+        'table': {'seconds': 1.0},
+        'list': {'seconds': 2.0}
+    }
+    with pytest.raises(ValueError):
+        load_baseline(path)
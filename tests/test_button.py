@@ -287,6 +287,17 @@ def test_menu_button():
     assert actual == expected
 
 
+@pytest.mark.button
+def test_menu_button_rendering_is_repeatable():
+    actions = [Button('A'), Button('B')]
+    button = Button('Somename').as_primary().add_menu(*actions)
+    assert str(button) == str(button)
+
+    # Rendering must not leak render-time classes into the components.
+    assert button.classes is None
+    assert actions[0].classes is None
+    assert actions[1].classes is None
+
 
 @pytest.mark.button
 def test_button_group():
@@ -0,0 +1,145 @@
+"""
+Test for docs/doc_app.py
+"""
+
+import os
+import json
+import shutil
+import importlib
+
+import pytest
+
+doc_app = importlib.import_module('docs.doc_app')
+doc_generator = importlib.import_module('docs.doc_generator')
+
+
+@pytest.mark.docs
+def test_page_hash(monkeypatch):
+    digest = doc_app.page_hash('home')
+    assert doc_app.page_hash('home') == digest
+    assert doc_app.page_hash('layout') != digest
+
+    # A page depends on the shared sources and the sources of the classes
+    # it renders only.
+    components = doc_app.page_hash('components')
+    file_hash = doc_generator._file_hash
+
+    def modified(*names):
+        def fake_hash(path):
+            digest = file_hash(path)
+            if os.path.basename(path) in names:
+                digest += '1'
+            return digest
+        monkeypatch.setattr(doc_app, '_file_hash', fake_hash)
+        monkeypatch.setattr(doc_generator, '_file_hash', fake_hash)
+
+    modified('list.py')
+    assert doc_app.page_hash('home') == digest
+    assert doc_app.page_hash('components') != components
+
+    modified('base.py')
+    assert doc_app.page_hash('home') != digest
+
+    modified('live.js')
+    assert doc_app.page_hash('home') != digest
+
+
+@pytest.mark.docs
+def test_render_page(tmp_path, monkeypatch):
+    shutil.copytree(doc_app.CONFIG_DIR, tmp_path, dirs_exist_ok=True)
+    monkeypatch.setattr(doc_app, 'CONFIG_DIR', tmp_path)
+    monkeypatch.setattr(doc_app, '_configs', {})
+    monkeypatch.setattr(doc_app, '_pages', {})
+    monkeypatch.setattr(
+        doc_generator, 'CACHE_PATH', tmp_path / '.class_docs.json'
+    )
+
+    page = doc_app.render_page('home')
+    assert doc_app.render_page('home') is page
+
+    # The page is rendered again once its configuration file is modified.
+    path = tmp_path / 'home.yaml'
+    mtime = path.stat().st_mtime_ns + 1000000000
+    os.utime(path, ns=(mtime, mtime))
+    modified = doc_app.render_page('home')
+    assert modified is not page
+    assert doc_app.render_page('home') is modified
+
+    # The page is rendered again once the sources it depends on are modified.
+    monkeypatch.setattr(doc_app, 'sources_hash', lambda name: 'somehash')
+    assert doc_app.render_page('home') is not modified
+
+
+@pytest.mark.docs
+def test_doc_to_html(tmp_path, monkeypatch):
+    built = []
+
+    def build_page(name):
+        built.append(name)
+        return f'<p>{name}</p>'
+
+    monkeypatch.setattr(doc_app, 'build_page', build_page)
+    saved = []
+    monkeypatch.setattr(doc_app, 'save_cache', saved.append)
+
+    def build(**kwargs):
+        built.clear()
+        changed = doc_app.doc_to_html(
+            workers=1, directory=tmp_path, **kwargs
+        )
+        assert changed == built
+        return changed
+
+    assert build() == list(doc_app.PAGES)
+    # The class-documentations are saved once per build.
+    assert saved == [{}]
+    for name, filename in doc_app.PAGES.items():
+        assert (tmp_path / filename).read_text() == f'<p>{name}</p>'
+    manifest = json.loads((tmp_path / doc_app.BUILD_MANIFEST).read_text())
+    assert set(manifest) == set(doc_app.PAGES.values())
+
+    # Nothing has changed since the previous build.
+    assert build() == []
+
+    # A missing HTML-file is rebuilt.
+    (tmp_path / doc_app.PAGES['layout']).unlink()
+    assert build() == ['layout']
+
+    # A page is rebuilt if its inputs have changed.
+    page_hash = doc_app.page_hash
+    monkeypatch.setattr(
+        doc_app, 'page_hash',
+        lambda name: page_hash(name) + ('1' if name == 'base' else '')
+    )
+    assert build() == ['base']
+
+    # All the pages are rebuilt if the sources they depend on have changed.
+    monkeypatch.setattr(doc_app, 'page_hash', page_hash)
+    monkeypatch.setattr(doc_app, 'sources_hash', lambda name: 'somehash')
+    assert build() == list(doc_app.PAGES)
+
+    assert build(force=True) == list(doc_app.PAGES)
+
+
+@pytest.mark.docs
+def test_save_cache(tmp_path, monkeypatch):
+    path = tmp_path / '.class_docs.json'
+    monkeypatch.setattr(doc_generator, 'CACHE_PATH', path)
+    monkeypatch.setattr(doc_generator, '_class_docs', {'Some': ['h', {}]})
+    monkeypatch.setattr(doc_generator, '_unsaved', {'Some'})
+
+    doc_generator.save_cache()
+    assert json.loads(path.read_text()) == {'Some': ['h', {}]}
+    assert path.stat().st_mode & 0o777 == 0o644
+
+    # The entries generated by the worker processes are saved along.
+    doc_generator._class_docs['Worker'] = ('w', {})
+    doc_generator._unsaved.add('Worker')
+    entries = doc_generator.take_unsaved()
+    assert entries == {'Worker': ('w', {})}
+    assert not doc_generator._unsaved
+    monkeypatch.setattr(doc_generator, '_class_docs', {})
+    doc_generator.save_cache(entries)
+    assert json.loads(path.read_text()) == {
+        'Some': ['h', {}], 'Worker': ['w', {}]
+    }
@@ -0,0 +1,51 @@
+"""
+Test for bootwrap/__init__.py
+"""
+
+import sys
+import subprocess
+
+import pytest
+
+import bootwrap
+
+
+@pytest.mark.init
+def test_lazy_exports():
+    assert set(bootwrap.__all__) <= set(dir(bootwrap))
+    for name in bootwrap.__all__:
+        assert getattr(bootwrap, name) is not None
+    with pytest.raises(AttributeError):
+        bootwrap.Unknown  # pylint: disable=pointless-statement
+
+
+@pytest.mark.init
+def test_lazy_import():
+    modules = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys; from bootwrap import Text; print(*sys.modules)'
+        ],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert 'bootwrap.components.text' in modules
+    assert 'bootwrap.components.table' not in modules
+    assert 'bootwrap.page' not in modules
+    assert 'pkg_resources' not in modules
+
+
+@pytest.mark.init
+def test_import_all():
+    # The modules which are slow to import are imported on first use only.
+    modules = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import sys; from bootwrap import *; print(*sys.modules)'
+        ],
+        capture_output=True, text=True, check=True
+    ).stdout.split()
+    assert 'bootwrap.components.table' in modules
+    for name in [
+        'pkg_resources', 'importlib.resources', 'asyncio', 'concurrent'
+    ]:
+        assert name not in modules
@@ -2,9 +2,14 @@
 Test for bootwrap/page.py
 """
 
+import re
+
 import pytest
 
-from bootwrap import Page, Link, Javascript, Menu, Text
+from bootwrap import (
+    Page, Link, Javascript, Menu, Navigation, Panel, Text, Dialog, Button,
+    Table, Anchor
+)
 from .helper import HelperHTMLParser
 
 
@@ -177,4 +182,176 @@ def test_page_resources():
         Page(resources=[Text('Some Title')]).__html__()
 
     with pytest.raises(TypeError):
-        Page(title=Text('Some Title')).__html__()
\ No newline at end of file
+        Page(title=Text('Some Title')).__html__()
+
+
+@pytest.mark.page
+def test_page_iter_render():
+    page = Page(
+        title='Some Title',
+        container=Panel(Text('sometext1'), Text('sometext2'))
+    )
+    chunks = page.iter_render()
+
+    # The page head must be produced before the container is rendered.
+    head = ''
+    for chunk in chunks:
+        head += chunk
+        if '</head>' in head:
+            break
+    assert '<head>' in head
+    assert 'sometext1' not in head
+
+    assert ''.join([head, *chunks]) == str(page)
+
+
+@pytest.mark.page
+def test_page_compact():
+    page = Page(
+        title='Some Title',
+        container=Panel(Text('def f():\n    pass').as_code()),
+        compact=True
+    )
+    output = str(page)
+    assert 'def f():\n    pass' in output
+    assert '\n' not in output.replace('def f():\n    pass', '')
+    assert len(output) < len(str(Page(title='Some Title', container=Panel(
+        Text('def f():\n    pass').as_code()))))
+    assert ''.join(page.iter_render()) == output
+
+
+@pytest.mark.page
+def test_page_live():
+    output = str(Page(container=Text('sometext')))
+    assert 'function bootwrapPatch(' not in output
+
+    output = str(Page(container=Text('sometext'), live=True))
+    assert output.count('function bootwrapPatch(') == 1
+    assert output.count('function bootwrapSubscribe(') == 1
+    assert output.index('hljs.highlightAll();') < \
+        output.index('function bootwrapPatch(')
+
+
+@pytest.mark.page
+def test_page_deterministic():
+    def make_page(text):
+        return Page(
+            title='Some Title',
+            container=Navigation(
+                Navigation.Item('Chapter 1', Text(text), True),
+                Navigation.Item('Chapter 2', Text('sometext2'))
+            ),
+            deterministic=True
+        )
+
+    page = make_page('sometext1')
+    assert str(page) == str(page)
+    assert ''.join(page.iter_render()) == str(page)
+    assert page.etag() == page.etag()
+    assert page.etag() == make_page('sometext1').etag()
+    assert page.etag() != make_page('othertext').etag()
+
+
+@pytest.mark.page
+def test_page_shell_cache():
+    menu = Menu(brand=Text('Brand'))
+
+    def head(text):
+        html = str(Page(title='Some Title', menu=menu, container=Text(text)))
+        return html[:html.index('<div class="container-fluid">')]
+
+    assert head('sometext1') == head('sometext2')
+
+    # The shell is cached by the menu markup, so changing the menu after
+    # a render is reflected in the next one.
+    anchor = Anchor('Home')
+    menu = Menu(brand=Text('Brand'), anchors=[anchor])
+    assert 'active-route' not in head('sometext')
+    anchor.add_classes('active-route')
+    assert 'active-route' in head('sometext')
+
+    resources = [Link('some.css')]
+    page = Page(resources=resources, container=Text('sometext'))
+    assert 'other.js' not in str(page)
+    resources.append(Javascript('other.js'))
+    assert 'other.js' in str(page)
+
+    page = Page(
+        title='Some Title',
+        menu=menu,
+        container=Text('sometext'),
+        deterministic=True
+    )
+    assert str(page) == str(page)
+    assert page.etag() == page.etag()
+
+
+@pytest.mark.page
+def test_page_render_fragment():
+    dialog = Dialog('Title', Text('sometext'), Button('Bye').dismiss())
+    table = Table(['A'], [[1], [2]])
+    panel = Panel(dialog, Button('Open').toggle(dialog), table)
+    page = Page(container=panel)
+
+    assert page.render_fragment(dialog.identifier) == str(dialog)
+    assert page.render_fragment(table.identifier) == str(table)
+    with pytest.raises(KeyError):
+        page.render_fragment('unknown')
+
+    content = Panel(Text('sometext'))
+    page = Page(container=Navigation(Navigation.Item('Tab', content, True)))
+    assert page.render_fragment(content.identifier) == str(content)
+
+    def make_page():
+        dialog = Dialog('Title', Text('sometext'), Button('Bye').dismiss())
+        return Page(
+            container=Panel(dialog, Button('Open').toggle(dialog)),
+            deterministic=True
+        )
+
+    html = str(make_page())
+    fragment = make_page().render_fragment('d1')
+    assert fragment.lstrip().startswith('<div id="d1" class="modal">')
+    assert fragment in html
+
+
+@pytest.mark.page
+def test_page_render_fragment_alone(monkeypatch):
+    rendered = []
+
+    class Probe(Text):
+        def __str__(self):
+            rendered.append(self)
+            return super().__str__()
+
+    def make_page():
+        dialog = Dialog('Title', Text('sometext'), Button('Bye').dismiss())
+        navigation = Navigation(
+            Navigation.Item('Tab 1', Probe('sometext1'), True),
+            Navigation.Item('Tab 2', Probe('sometext2'))
+        )
+        return Page(
+            container=Panel(navigation, dialog, Button('Open').toggle(dialog)),
+            deterministic=True
+        )
+
+    html = str(make_page())
+    rendered.clear()
+
+    # Neither the page shell nor the other page web components are rendered
+    # to resolve the deterministic identifiers.
+    def render_shell(*args):
+        raise AssertionError('The page shell is rendered')
+
+    monkeypatch.setattr('bootwrap.page._render_shell', render_shell)
+    page = make_page()
+    identifier = re.search(r'<div id="(\w+)" class="modal">', html).group(1)
+    fragment = page.render_fragment(identifier)
+    assert fragment in html
+    assert rendered == []
+
+    # The identifiers of the web components made while rendering (the
+    # navigation tabs) are the same as in the page.
+    identifier = re.search(r'<ul id="(\w+)"', html).group(1)
+    assert page.render_fragment(identifier) in html
+    assert len(rendered) == 2
@@ -155,3 +155,13 @@ def test_as_collapse():
         <div id="{panel.identifier}" class="collapse"></div>
     ''')
     assert actual == expected
+
+
+@pytest.mark.panel
+def test_panel_iter_render():
+    text1 = Text('sometext1')
+    text2 = Text('sometext2')
+    panel = Panel(text1, text2).vertical()
+    chunks = list(panel.iter_render())
+    assert len(chunks) > 2
+    assert ''.join(chunks) == str(panel)
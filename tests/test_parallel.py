@@ -0,0 +1,148 @@
+"""
+Test for bootwrap/components/parallel.py
+"""
+
+import re
+import pickle
+import subprocess
+import sys
+import multiprocessing
+from concurrent import futures
+
+import pytest
+
+from bootwrap import Deck, List, Panel, Table, TableEntity, Text, rendering
+from bootwrap.components import base, parallel
+from bootwrap.components.table import _render_rows
+from bootwrap.components.utils import Template
+
+
+def cell_classes(value):
+    return 'odd' if value % 2 else ''
+
+
+def count_compiles(rows):
+    """Renders a shard of rows counting the template compilations."""
+    compiled = []
+    compile_template = Template._Template__compile
+
+    def counting_compile(template):
+        compiled.append(template)
+        compile_template(template)
+
+    Template._Template__compile = counting_compile
+    handlers = {0: (None, None, cell_classes, None, None, None)}
+    _render_rows(rows, handlers, 2, None)
+    return len(compiled), len(set(compiled))
+
+
+def normalized(html):
+    # The identifiers of the web components made while rendering differ.
+    return re.sub(r'\bw[0-9a-z_]+\b', 'id', html)
+
+
+@pytest.mark.parallel
+def test_parallel_render(monkeypatch):
+    monkeypatch.setattr(parallel, 'THRESHOLD', 20)
+    monkeypatch.setattr(parallel, 'SHARD_SIZE', 5)
+
+    table = Table(['A', 'B'], [[i, f'name {i}'] for i in range(50)])
+    table.body.transform(0, TableEntity.CELL, cell_classes)
+    lambdas = Table(['A'], [[i] for i in range(50)])
+    lambdas.body.transform(0, TableEntity.VALUE, lambda value: value * 2)
+    components = [
+        List(*[List.Item(f'title {i}', f'text {i}') for i in range(30)]),
+        Deck(*[Deck.Card(f'title {i}') for i in range(30)]),
+        Panel(*[Text(f'text {i}') for i in range(30)]).vertical(),
+        table,
+        lambdas,
+        List(*[List.Item(f'title {i}') for i in range(10)])
+    ]
+
+    for component in components:
+        expected = str(component)
+        with rendering(workers=2):
+            actual = str(component)
+        assert normalized(actual) == normalized(expected)
+        assert component.identifier in actual
+
+        with rendering(workers=2, deterministic=True):
+            actual = str(component)
+        with rendering(deterministic=True):
+            assert actual == str(component)
+
+    # The card titles are made while rendering in the worker processes.
+    with rendering(workers=2):
+        assert re.search(r'id="w[0-9a-z]+_[0-9a-z]+"', str(components[1]))
+
+    items = [Text('text')] * 10
+    with rendering(workers=2):
+        assert len(parallel.bounds(50)) == 8
+        assert parallel.render_all(items) is items
+
+
+@pytest.mark.parallel
+def test_parallel_cold_worker():
+    # A spawned worker starts with no template compiled, like the worker
+    # processes of a fresh pool.
+    context = multiprocessing.get_context('spawn')
+    with futures.ProcessPoolExecutor(1, mp_context=context) as pool:
+        compiled, unique = pool.submit(
+            count_compiles, [[i, i * 2] for i in range(200)]
+        ).result()
+    assert 0 < compiled == unique
+
+
+def fail(*items):
+    raise ValueError(items)
+
+
+@pytest.mark.parallel
+def test_parallel_run_restores_prefix():
+    prefix = base._identifier_prefix
+    options = parallel.render_options()
+    payload = pickle.dumps((parallel.inject, ('a', 'b'), options, 'w1_'))
+    assert parallel._run(payload) == 'ab'
+    assert base._identifier_prefix == prefix
+
+    payload = pickle.dumps((fail, ('a',), options, 'w2_'))
+    with pytest.raises(ValueError):
+        parallel._run(payload)
+    assert base._identifier_prefix == prefix
+
+
+@pytest.mark.parallel
+def test_parallel_shutdown(monkeypatch):
+    monkeypatch.setattr(parallel, 'THRESHOLD', 20)
+    monkeypatch.setattr(parallel, 'SHARD_SIZE', 5)
+    panel = Panel(*[Text(f'text {i}') for i in range(30)])
+
+    with rendering(workers=2):
+        html = str(panel)
+    assert parallel._pools
+    parallel.shutdown()
+    assert not parallel._pools
+
+    # The worker processes are started again by the next parallel render.
+    panel.invalidate()
+    with rendering(workers=2):
+        assert normalized(str(panel)) == normalized(html)
+    parallel.shutdown()
+
+    # The worker processes are shut down at the interpreter exit (the exit
+    # functions are called in the reverse order of their registration).
+    output = subprocess.run(
+        [
+            sys.executable, '-c',
+            'import atexit\n'
+            'atexit.register(lambda: print(len(parallel._pools)))\n'
+            'from bootwrap import Panel, Text, rendering\n'
+            'from bootwrap.components import parallel\n'
+            'parallel.THRESHOLD = 20\n'
+            'with rendering(workers=2):\n'
+            '    str(Panel(*[Text(str(i)) for i in range(30)]))\n'
+            'print(len(parallel._pools))\n'
+        ],
+        capture_output=True, text=True, check=True, timeout=60
+    ).stdout
+    assert output.split() == ['1', '0']
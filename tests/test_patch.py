@@ -0,0 +1,110 @@
+"""
+Test for bootwrap/patch.py
+"""
+
+import pytest
+
+from bs4 import BeautifulSoup, NavigableString, Tag
+
+from bootwrap import Button, Navigation, Panel, Table, Text, rendering
+from bootwrap.patch import diff
+from .helper import HelperHTMLParser
+
+
+def apply(markup, patch):
+    """Applies a patch the way the `bootwrapPatch` script function does."""
+    soup = BeautifulSoup(markup, 'html.parser')
+    target = soup.find(id=patch['target'])
+
+    def elements(node):
+        return [child for child in node.children if isinstance(child, Tag)]
+
+    def resolve(path):
+        siblings = elements(target.parent)
+        element = siblings[siblings.index(target) + (path or [0])[0]]
+        for index in path[1:]:
+            element = elements(element)[index]
+        return element
+
+    for change, element in [
+        (change, resolve(change['path'])) for change in patch['patches']
+    ]:
+        if change['op'] == 'replace' and not change['path']:
+            siblings = elements(target.parent)
+            start = siblings.index(target)
+            for old in siblings[start + 1:start + change['count']]:
+                old.decompose()
+            element.replace_with(BeautifulSoup(change['html'], 'html.parser'))
+        elif change['op'] == 'replace':
+            element.replace_with(BeautifulSoup(change['html'], 'html.parser'))
+        elif change['op'] == 'attributes':
+            element.attrs.update(change['set'])
+            for name in change['remove']:
+                del element[name]
+        else:
+            texts = [
+                child for child in element.children
+                if isinstance(child, NavigableString)
+            ]
+            texts[change['index']].replace_with(change['text'])
+    return str(soup)
+
+
+def render(component):
+    with rendering(deterministic=True):
+        return str(component)
+
+
+@pytest.mark.patch
+def test_diff_text_and_attributes():
+    prices = [['AAPL', 90], ['AMZN', 80], ['NVDA', 70]]
+
+    def make_panel(title, classes):
+        return Panel(
+            Text(title),
+            Table(['Symbol', 'Price'], [list(row) for row in prices]),
+            Button('Refresh')
+        ).add_classes(classes)
+
+    previous = render(make_panel('Portfolio', 'p-1'))
+    assert diff(previous, previous)['patches'] == []
+
+    prices[1][1] = 85
+    current = render(make_panel('My Portfolio', 'p-2'))
+    patch = diff(previous, current)
+    assert patch['target'] == 'd0'
+    assert sorted(change['op'] for change in patch['patches']) == \
+        ['attributes', 'text', 'text']
+    assert HelperHTMLParser.parse(apply(previous, patch)) == \
+        HelperHTMLParser.parse(current)
+
+
+@pytest.mark.patch
+def test_diff_replace():
+    previous = render(Panel(Text('sometext'), Button('Refresh')))
+    current = render(Panel(Button('Refresh'), Text('sometext')))
+    patch = diff(previous, current)
+    assert [change['op'] for change in patch['patches']] == ['replace']
+    assert HelperHTMLParser.parse(apply(previous, patch)) == \
+        HelperHTMLParser.parse(current)
+
+    previous = render(Navigation(
+        Navigation.Item('Chapter 1', 'sometext1', True),
+        Navigation.Item('Chapter 2', 'sometext2')
+    ))
+    current = render(Navigation(
+        Navigation.Item('Chapter 1', 'sometext1'),
+        Navigation.Item('Chapter 2', 'othertext', True)
+    ))
+    patch = diff(previous, current)
+    assert HelperHTMLParser.parse(apply(previous, patch)) == \
+        HelperHTMLParser.parse(current)
+
+    current = render(Table(['A'], [[1]]))
+    patch = diff(previous, current)
+    assert patch['patches'][0]['count'] == 2
+    assert HelperHTMLParser.parse(apply(previous, patch)) == \
+        HelperHTMLParser.parse(current)
+
+    with pytest.raises(ValueError):
+        diff('<div>sometext</div>', current)
@@ -0,0 +1,184 @@
+"""
+Test for bootwrap/serving.py
+"""
+
+import json
+import threading
+
+import pytest
+
+from flask import Flask
+
+from bootwrap import Javascript, Navigation, Page, Panel, Table, Text
+from bootwrap.assets import (
+    GENERIC_CSS,
+    GENERIC_JS,
+    LIVE_JS,
+    hashed_name,
+    load
+)
+from bootwrap import serving
+from bootwrap.serving import (
+    Channel,
+    register_assets,
+    register_channel,
+    register_fragments
+)
+
+
+@pytest.mark.serving
+def test_register_assets():
+    app = Flask(__name__)
+    assets_url = register_assets(app)
+    client = app.test_client()
+
+    for name in [GENERIC_CSS, GENERIC_JS, LIVE_JS]:
+        response = client.get(f'{assets_url}/{hashed_name(name)}')
+        assert response.status_code == 200
+        assert response.get_data(as_text=True) == load(name)
+        assert 'immutable' in response.headers['Cache-Control']
+
+    response = client.get(f'{assets_url}/{GENERIC_CSS}')
+    assert response.status_code == 404
+
+    output = str(Page(assets_url=assets_url))
+    assert f'{assets_url}/{hashed_name(GENERIC_CSS)}' in output
+    assert f'{assets_url}/{hashed_name(GENERIC_JS)}' in output
+    assert f'{assets_url}/{hashed_name(LIVE_JS)}' not in output
+    assert load(GENERIC_CSS) not in output
+
+    output = str(Page(assets_url=assets_url, live=True))
+    assert f'{assets_url}/{hashed_name(LIVE_JS)}' in output
+
+
+@pytest.mark.serving
+def test_register_fragments():
+    app = Flask(__name__)
+    text = Text('sometext')
+    url = register_fragments(app, '/fragments/', Page(container=Panel(text)))
+
+    def make_page(name):
+        return Page(container=Panel(Text(name)), deterministic=True)
+
+    register_fragments(app, '/<name>/fragments', make_page)
+    client = app.test_client()
+
+    response = client.get(f'{url}/{text.identifier}')
+    assert response.status_code == 200
+    assert response.get_data(as_text=True) == str(text)
+    assert client.get(f'{url}/unknown').status_code == 404
+
+    response = client.get('/somename/fragments/d1')
+    assert response.status_code == 200
+    assert 'somename' in response.get_data(as_text=True)
+
+
+@pytest.mark.serving
+def test_register_channel():
+    app = Flask(__name__)
+    channel = Channel(heartbeat=0.01)
+    url = register_channel(app, '/live', channel)
+    client = app.test_client()
+
+    def event(events):
+        chunk = next(events)
+        while chunk.startswith(b':'):
+            chunk = next(events)
+        name, data = chunk.decode().strip().split('\n')
+        return name[len('event: '):], json.loads(data[len('data: '):])
+
+    rows = [['AAPL', 90], ['AMZN', 80]]
+    table = Table(['Symbol', 'Price'], rows)
+    channel.publish(table)
+
+    response = client.get(url, buffered=False)
+    assert response.mimetype == 'text/event-stream'
+    events = iter(response.response)
+    assert next(events) == b'retry: 3000\n\n'
+
+    channel.publish(table)
+    name, data = event(events)
+    assert name == 'fragment'
+    assert data['target'] == table.identifier
+    assert data['html'] == str(table)
+
+    rows[1][1] = 85
+    table.invalidate()
+    channel.publish(table)
+    name, data = event(events)
+    assert name == 'patch'
+    assert data['target'] == table.identifier
+    assert [change['text'].strip() for change in data['patches']] == ['85']
+
+    channel.publish(table)
+    assert next(events).startswith(b':')
+
+    response.close()
+    channel.publish(table)
+
+    channel = Channel(backlog=1)
+    subscriber = channel.subscribe()
+    channel.publish(Text('sometext1'))
+    channel.publish(Text('sometext2'))
+    assert subscriber.closed
+    assert list(channel.stream(subscriber)) == ['retry: 3000\n\n']
+
+
+@pytest.mark.serving
+def test_channel_publish_deterministic():
+    channel = Channel()
+    subscriber = channel.subscribe()
+    text = Text('sometext1')
+    navigation = Navigation(Navigation.Item('Tab', text, True))
+
+    channel.publish(navigation)
+    fragment = json.loads(subscriber.events.get().split('data: ')[1])
+    assert fragment['target'] == navigation.identifier
+
+    # The nested web components made while rendering get the same
+    # identifiers, so an unchanged web component makes no patch.
+    navigation.invalidate()
+    channel.publish(navigation)
+    assert subscriber.events.empty()
+
+    text.as_strong()
+    channel.publish(navigation)
+    patch = json.loads(subscriber.events.get().split('data: ')[1])
+    assert patch['target'] == navigation.identifier
+    assert len(patch['patches']) == 1
+    assert '<strong' in patch['patches'][0]['html']
+
+    url = register_channel(Flask(__name__), '/live', channel)
+    assert str(Javascript(script=f'bootwrapSubscribe("{url}");')) == \
+        str(Javascript(script='bootwrapSubscribe("/live");', submap={}))
+
+
+@pytest.mark.serving
+def test_channel_publish_in_order(monkeypatch):
+    channel = Channel()
+    subscriber = channel.subscribe()
+    text = Text('sometext')
+    renders = []
+    others = []
+
+    def render_published(component):
+        html = f'<p id="{component.identifier}">{len(renders)}</p>'
+        renders.append(html)
+        if len(renders) == 1:
+            # The web component is published again while it is rendered.
+            other = threading.Thread(target=channel.publish, args=(text,))
+            other.start()
+            other.join(0.1)
+            others.append(other)
+        return component.identifier, html
+
+    monkeypatch.setattr(serving, '_render_published', render_published)
+    channel.publish(text)
+    others[0].join()
+
+    def event():
+        return json.loads(subscriber.events.get().split('data: ')[1])
+
+    assert event()['html'] == renders[0]
+    assert [change['text'] for change in event()['patches']] == ['1']
+    assert subscriber.events.empty()
@@ -2,9 +2,15 @@
 Test for bootwrap/components/table.py
 """
 
+import re
+import tracemalloc
+
+import numpy as np
 import pytest
 
-from bootwrap import Table, TableEntity
+from bootwrap import Table, TableEntity, Text
+from bootwrap.components.table import _row_code
+from bootwrap.components.utils import Template
 
 from .helper import HelperHTMLParser
 
@@ -142,6 +148,463 @@ def test_table_body():
         table.body.transform(0, TableEntity.VALUE, lambda v: v)
 
 
+@pytest.mark.table
+def test_table_ragged_body():
+    table = Table(None, [[1, 2], [3], [4, 5, 6]])
+    table.body.transform(
+        1, TableEntity.CELL, lambda v: 'someclass' if v == 5 else ''
+    )
+    table.body.transform(
+        2, TableEntity.ROW, lambda v: 'otherclass'
+    )
+    actual = HelperHTMLParser.parse(str(table))
+    expected = HelperHTMLParser.parse(f'''
+        <table id="{table.identifier}" class="table">
+            <tbody>
+                <tr>
+                    <td scope="row">1</td>
+                    <td>2</td>
+                </tr>
+                <tr>
+                    <td scope="row">3</td>
+                </tr>
+                <tr class="otherclass">
+                    <td scope="row">4</td>
+                    <td class="someclass">5</td>
+                    <td>6</td>
+                </tr>
+            </tbody>
+        </table>
+    ''')
+    assert actual == expected
+
+
+@pytest.mark.table
+def test_table_memoized_transform():
+    calls = []
+
+    def transform(value):
+        calls.append(value)
+        return f'<b>{value}</b>'
+
+    table = Table(None, [['a', 1], ['b', True], ['a', 1], [['x'], 2]])
+    table.body.transform(0, TableEntity.VALUE, transform, memoize=True)
+    table.body.transform(1, TableEntity.CELL, transform, memoize=True)
+    html = str(table)
+    assert html.count('<b>a</b>') == 2
+    assert html.count('class="<b>1</b>"') == 2
+    assert html.count('class="<b>True</b>"') == 1
+    assert calls == ['a', 1, 'b', True, ['x'], 2]
+
+    # The web components are not shared between rows.
+    table = Table(None, [['a'], ['b'], ['a'], ['a']])
+    table.body.transform(0, TableEntity.VALUE, Text, memoize=True)
+    identifiers = re.findall(r'id="(\w+)"', str(table.body))
+    assert len(identifiers) == 4
+    assert len(set(identifiers)) == 4
+
+    with pytest.raises(ValueError):
+        Table(None, [[1]]).body.transform(
+            0, TableEntity.VALUE, transform, vectorized=True, memoize=True
+        )
+
+
+@pytest.mark.table
+def test_table_compiled_once(monkeypatch):
+    compiled = []
+    compile_template = Template._Template__compile
+
+    def counting_compile(template):
+        compiled.append(template)
+        compile_template(template)
+
+    monkeypatch.setattr(Template, '_Template__compile', counting_compile)
+    templates = []
+    for name in ('_ROW', '_KEYED_ROW', '_FIRST_CELL', '_CELL'):
+        template = Template(getattr(Table.Body, name)._Template__markup)
+        monkeypatch.setattr(Table.Body, name, template)
+        templates.append(template)
+    _row_code.cache_clear()
+
+    def make_table():
+        table = Table(None, [[i, i * 2] for i in range(50)])
+        table.body.transform(0, TableEntity.CELL, lambda x: 'c')
+        table.body.transform(1, TableEntity.ROW, lambda x: 'r')
+        return table
+
+    # The rows are rendered by the compiled templates, so every template
+    # is compiled just once however many rows are rendered.
+    first = str(make_table())
+    table = make_table()
+    table.body.key_by(0)
+    assert str(table) != first
+    assert set(templates) <= set(compiled)
+    assert len(compiled) == len(set(compiled))
+
+
+@pytest.mark.table
+def test_table_columnar_body():
+    expected_body = '''
+        <tbody>
+            <tr class="someclass">
+                <td scope="row">1</td>
+                <td class="otherclass">x!</td>
+            </tr>
+            <tr>
+                <td scope="row">2</td>
+                <td>y!</td>
+            </tr>
+        </tbody>
+    '''
+
+    table = Table(None, {'A': [1, 2], 'B': ['x', 'y']})
+    table.body.transform(
+        0, TableEntity.ROW, lambda v: 'someclass' if v == 1 else ''
+    )
+    table.body.transform(
+        1,
+        TableEntity.VALUE,
+        lambda column: [f'{v}!' for v in column],
+        vectorized=True
+    )
+    table.body.transform(
+        1,
+        TableEntity.CELL,
+        lambda column: ['otherclass' if v == 'x' else '' for v in column],
+        vectorized=True
+    )
+    actual = HelperHTMLParser.parse(str(table))
+    expected = HelperHTMLParser.parse(f'''
+        <table id="{table.identifier}" class="table">
+            <thead>
+                <tr>
+                    <th scope="col">A</th>
+                    <th scope="col">B</th>
+                </tr>
+            </thead>
+            {expected_body}
+        </table>
+    ''')
+    assert actual == expected
+    assert len(table.body) == 2
+    assert table.body.column(1) == ['x', 'y']
+
+    table = Table(None, np.array([[1, 0], [2, 1]]))
+    table.body.transform(
+        0,
+        TableEntity.ROW,
+        lambda column: np.where(column == 1, 'someclass', ''),
+        vectorized=True
+    )
+    table.body.transform(
+        1,
+        TableEntity.VALUE,
+        lambda column: np.array(['x!', 'y!'])[column],
+        vectorized=True
+    )
+    table.body.transform(
+        1, TableEntity.CELL, lambda v: 'otherclass' if v == 0 else ''
+    )
+    actual = HelperHTMLParser.parse(str(table))
+    expected = HelperHTMLParser.parse(f'''
+        <table id="{table.identifier}" class="table">
+            {expected_body}
+        </table>
+    ''')
+    assert actual == expected
+
+    with pytest.raises(ValueError):
+        Table(None, {'A': [1, 2], 'B': ['x']})
+
+    with pytest.raises(ValueError):
+        table = Table(None, {'A': [1, 2]})
+        table.body.transform(
+            0, TableEntity.VALUE, lambda column: [1], vectorized=True
+        )
+        str(table)
+
+
+@pytest.mark.table
+def test_table_streamed_body():
+    def rows(n):
+        for i in range(n):
+            yield (i, f'name {i}')
+
+    def make_table(body):
+        table = Table(['A', 'B'], body)
+        table.body.transform(
+            0, TableEntity.CELL, lambda v: 'someclass' if v == 1 else ''
+        )
+        return table
+
+    assert str(make_table(rows(3)).body) == \
+        str(make_table([list(row) for row in rows(3)]).body)
+
+    table = Table(None, rows(1000))
+    chunks = list(table.body.iter_render(chunk_size=100))
+    assert len(chunks) == 11
+    assert chunks[0].startswith('<tbody>')
+    assert chunks[-1].endswith('</tbody>')
+    assert list(table.body.iter_render()) == []
+
+    assert str(Table(None, iter([]))).count('<tbody>') == 0
+
+    with pytest.raises(TypeError):
+        len(Table(None, rows(1)).body)
+    assert len(Table(None, range(0)).body) == 0
+
+    with pytest.raises(ValueError):
+        Table(None, rows(1)).body.transform(
+            0, TableEntity.VALUE, lambda column: column, vectorized=True
+        )
+
+    def peak_memory(n):
+        tracemalloc.start()
+        try:
+            for _ in Table(None, rows(n)).iter_render():
+                pass
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    assert peak_memory(10000) < 2 * peak_memory(1000)
+
+
+@pytest.mark.table
+def test_table_pagination():
+    rows = [[i, f'name {i}'] for i in range(1, 50)]
+
+    def cells(html):
+        return [
+            int(line.strip()) for line in html.split('\n')
+            if line.strip().isdigit()
+        ]
+
+    table = Table(['A', 'B'], rows)
+    assert table.body.pages(10) == 5
+    assert cells(table.body.render_page(2, 10)) == list(range(11, 21))
+    assert cells(table.body.render_page(5, 10)) == list(range(41, 50))
+    assert table.body.render_page(6, 10) == ''
+    assert cells(table.body.render_page(1, 3, sort_key=0, reverse=True)) \
+        == [49, 48, 47]
+    assert cells(
+        table.body.render_page(1, 3, sort_key=lambda row: -row[0] % 7)
+    ) == [7, 14, 21]
+    assert isinstance(table.body.page_indexes(3, 10), range)
+
+    with pytest.raises(ValueError):
+        table.body.render_page(0, 10)
+
+    columnar = Table(None, {'A': np.arange(1, 50), 'B': np.arange(1, 50)})
+    columnar.body.transform(
+        1,
+        TableEntity.VALUE,
+        lambda column: column * 100,
+        vectorized=True
+    )
+    assert cells(columnar.body.render_page(2, 2)) == [3, 300, 4, 400]
+    assert cells(columnar.body.render_page(1, 2, sort_key=0, reverse=True)) \
+        == [49, 4900, 48, 4800]
+
+    streamed = Table(None, iter(rows))
+    assert cells(streamed.body.render_page(3, 2)) == [5, 6]
+    with pytest.raises(TypeError):
+        Table(None, iter(rows)).body.render_page(1, 2, sort_key=0)
+
+    table = Table(['A', 'B'], rows).paginate(10, page=3, href='/a?p={page}')
+    actual = str(table)
+    assert cells(actual[:actual.index('</table>')]) == list(range(21, 31))
+    pager = HelperHTMLParser.parse(actual[actual.index('</table>') + 8:])
+    expected = HelperHTMLParser.parse('''
+        <nav aria-label="Table pages">
+            <ul class="pagination">
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=2">Previous</a>
+                </li>
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=1">1</a>
+                </li>
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=2">2</a>
+                </li>
+                <li class="page-item active">
+                    <a class="page-link" href="/a?p=3">3</a>
+                </li>
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=4">4</a>
+                </li>
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=5">5</a>
+                </li>
+                <li class="page-item">
+                    <a class="page-link" href="/a?p=4">Next</a>
+                </li>
+            </ul>
+        </nav>
+    ''')
+    assert pager == expected
+
+
+@pytest.mark.table
+def test_table_indexes():
+    rows = [[i, i % 7] for i in range(1, 50)]
+
+    def cells(html):
+        return [
+            int(line.strip()) for line in html.split('\n')
+            if line.strip().isdigit()
+        ][::2]
+
+    def even(row):
+        return row[0] % 2 == 0
+
+    table = Table(['A', 'B'], rows)
+    order = table.body.order(1)
+    assert table.body.order(1) is order
+    assert [rows[i][1] for i in order] == sorted(row[1] for row in rows)
+    assert table.body.order(1, reverse=True) is not order
+    assert isinstance(table.body.order(), range)
+
+    assert table.body.pages(10, even) == 3
+    assert cells(table.body.render_page(3, 10, where=even)) == \
+        list(range(42, 50, 2))
+    assert cells(table.body.render_page(1, 3, 0, True, even)) == \
+        [48, 46, 44]
+    assert cells(''.join(table.body.iter_render(sort_key=1, where=even))) \
+        == sorted(range(2, 50, 2), key=lambda i: i % 7)
+
+    rows[0][1] = 100
+    assert table.body.order(1)[-1] != 0
+    table.body.reindex()
+    assert table.body.order(1)[-1] == 0
+
+    streamed = Table(None, iter(rows))
+    assert cells(streamed.body.render_page(2, 3, where=even)) == [8, 10, 12]
+    with pytest.raises(TypeError):
+        Table(None, iter(rows)).body.order(where=even)
+
+    paginated = Table(['A', 'B'], rows).paginate(10, page=3, where=even)
+    actual = str(paginated)
+    assert cells(actual[:actual.index('</table>')]) == \
+        list(range(42, 50, 2))
+    assert 'page=4' not in actual
+
+
+@pytest.mark.table
+def test_table_diff():
+    def make_table(rows):
+        table = Table(['Symbol', 'Price'], rows)
+        table.body.key_by(0)
+        table.body.transform(
+            1, TableEntity.CELL, lambda v: 'up' if v > 100 else ''
+        )
+        return table
+
+    before = make_table([['AAPL', 90], ['AMZN', 80], ['NVDA', 70]])
+    actual = HelperHTMLParser.parse(str(before.body))
+    expected = HelperHTMLParser.parse('''
+        <tbody>
+            <tr data-key="AAPL">
+                <td scope="row">AAPL</td>
+                <td>90</td>
+            </tr>
+            <tr data-key="AMZN">
+                <td scope="row">AMZN</td>
+                <td>80</td>
+            </tr>
+            <tr data-key="NVDA">
+                <td scope="row">NVDA</td>
+                <td>70</td>
+            </tr>
+        </tbody>
+    ''')
+    assert actual == expected
+
+    after = make_table(
+        [['GOOG', 60], ['AAPL', 190], ['NVDA', 70], ['TSLA', 50]]
+    )
+    patch = after.diff(before)
+    assert patch['target'] == before.identifier
+    assert after.identifier != before.identifier
+    patch = after.diff(before, adopt_identifier=True)
+    assert after.identifier == before.identifier
+    assert patch['removed'] == ['AMZN']
+    assert patch['moved'] == []
+    assert [key for key, _ in patch['changed']] == ['AAPL']
+    assert HelperHTMLParser.parse(patch['changed'][0][1]) == \
+        HelperHTMLParser.parse('''
+            <tr data-key="AAPL">
+                <td scope="row">AAPL</td>
+                <td class="up">190</td>
+            </tr>
+        ''')
+    assert [(key, next_key) for key, _, next_key in patch['added']] == \
+        [('GOOG', 'AAPL'), ('TSLA', None)]
+
+    assert after.diff(after) == {
+        'target': after.identifier,
+        'removed': [],
+        'changed': [],
+        'moved': [],
+        'added': []
+    }
+
+    # The successive patches target the table element rendered first.
+    latest = make_table([['GOOG', 61], ['AAPL', 190], ['TSLA', 50]])
+    patch = latest.diff(after, adopt_identifier=True)
+    assert patch['target'] == before.identifier
+    assert latest.identifier == before.identifier
+    assert patch['removed'] == ['NVDA']
+    assert patch['changed'] == [[
+        'GOOG', '<tr data-key="GOOG"> <td scope="row"> GOOG </td> '
+        '<td> 61 </td> </tr> '
+    ]]
+    assert f'id="{before.identifier}"' in str(latest)
+
+    with pytest.raises(ValueError):
+        Table(None, [[1]]).diff(Table(None, [[1]]))
+    with pytest.raises(ValueError):
+        make_table([['AAPL', 1], ['AAPL', 2]]).diff(latest)
+    with pytest.raises(ValueError):
+        latest.diff(make_table([['AAPL', 1], ['AAPL', 2]]))
+
+
+@pytest.mark.table
+def test_table_diff_moved():
+    def make_table(keys):
+        table = Table(['Symbol'], [[key] for key in keys])
+        table.body.key_by(0)
+        return table
+
+    def apply(patch, keys):
+        # Applies the patch the way the `bootwrapPatchTable` script does.
+        keys = [key for key in keys if key not in patch['removed']]
+        added = [[key, next_key] for key, _, next_key in patch['added']]
+        for key, next_key in patch['moved'][::-1] + added[::-1]:
+            if key in keys:
+                keys.remove(key)
+            keys.insert(
+                len(keys) if next_key is None else keys.index(next_key), key
+            )
+        return keys
+
+    patch = make_table('BA').diff(make_table('AB'))
+    assert patch['moved'] == [['B', 'A']]
+    assert patch['changed'] == [] and patch['added'] == []
+    assert apply(patch, list('AB')) == list('BA')
+
+    for before, after in [
+        ('ABCDE', 'EDCBA'),
+        ('ABCDE', 'BCDEA'),
+        ('ABCDE', 'AXDBYC'),
+        ('ABCDEFG', 'GCFXBAD'),
+    ]:
+        patch = make_table(after).diff(make_table(before))
+        assert apply(patch, list(before)) == list(after)
+    patch = make_table('BCDEA').diff(make_table('ABCDE'))
+    assert patch['moved'] == [['A', None]]
+
+
 @pytest.mark.table
 def test_table_as_striped():
     table = Table(None, None).as_striped()
@@ -4,7 +4,8 @@ Test for bootwrap/components/link.py
 
 import pytest
 
-from bootwrap import attr, inject, Text
+from bootwrap import attr, inject, rendering, set_render_options, Text
+from bootwrap.components.utils import Template, tag
 
 from .helper import HelperHTMLParser
 
@@ -30,6 +31,15 @@ def test_attr():
         attr('name', list())
 
 
+@pytest.mark.utils
+def test_tag():
+    output = tag('span', [attr('id', 'd1'), '', attr('class', 'c')], 'A')
+    assert output == '<span id="d1" class="c">A</span>'
+
+    output = tag('span', [attr('class', None)], 'A')
+    assert output == '<span>A</span>'
+
+
 @pytest.mark.utils
 def test_inject():
     output = inject(Text('A'), Text('B'), Text('C'))
@@ -48,3 +58,83 @@ def test_inject():
         <span id="...">C</span>
     ''')
     assert actual == expected
+
+
+@pytest.mark.utils
+def test_template():
+    template = Template('''
+        <div {id=identifier} {class=classes}>
+            {inner}
+            <style>div {{ color: red }}</style>
+        </div>
+    ''')
+
+    output = template.render(identifier='d1', classes=None, inner=0)
+    assert output == (
+        '\n<div id="d1" >\n'
+        '    0\n'
+        '    <style>div { color: red }</style>\n'
+        '</div>\n'
+    )
+
+    inner = [Text('A'), None]
+    output = template.render(identifier='d1', inner=inner)
+    assert output == ''.join(template.iter_render(identifier='d1', inner=inner))
+
+    with pytest.raises(ValueError):
+        Template('<div>{not a slot}</div>').render()
+
+
+@pytest.mark.utils
+def test_template_compact():
+    template = Template('''
+        <div {id=identifier}
+            {class=classes}>
+            <pre>{code}
+              indented</pre>
+        </div>
+    ''')
+
+    with rendering(compact=True):
+        output = template.render(identifier='d1', code='x')
+        chunks = ''.join(template.iter_render(identifier='d1', code='x'))
+    assert output == '<div id="d1"> <pre>x\n      indented</pre> </div> '
+    assert chunks == output
+
+    # The process-wide options apply outside of the `with` block.
+    set_render_options(compact=True)
+    try:
+        assert template.render(identifier='d1', code='x') == output
+    finally:
+        set_render_options(compact=False)
+    assert template.render(identifier='d1', code='x') != output
+
+    # The blank content is kept just for textarea elements.
+    template = Template('''
+        <textarea {id=identifier}>  </textarea>
+        <pre>
+        </pre>
+    ''')
+    with rendering(compact=True):
+        output = template.render(identifier='d1')
+    assert output == '<textarea id="d1">  </textarea> <pre></pre> '
+
+    # The whitespaces around the content slots are never doubled.
+    template = Template('''
+        <ul>
+            {items}
+            {more}
+        </ul>
+    ''')
+    for items, more, expected in [
+        (['<li>A</li> ', '<li>B</li>\n'], None,
+         '<ul> <li>A</li> <li>B</li> </ul> '),
+        (None, None, '<ul> </ul> '),
+        ('A\n', ' ', '<ul> A </ul> '),
+        ('', 'B', '<ul> B </ul> ')
+    ]:
+        with rendering(compact=True):
+            output = template.render(items=items, more=more)
+            chunks = ''.join(template.iter_render(items=items, more=more))
+        assert output == expected
+        assert chunks == output